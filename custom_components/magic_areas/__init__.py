@@ -1,32 +1,27 @@
 """Magic Areas component for Home Assistant."""
 
 from collections.abc import Callable
-from datetime import UTC, datetime
 import logging
-from typing import Any
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_NAME, EVENT_HOMEASSISTANT_STARTED
-from homeassistant.core import Event, HomeAssistant, callback
-from homeassistant.helpers.device_registry import (
-    EVENT_DEVICE_REGISTRY_UPDATED,
-    EventDeviceRegistryUpdatedData,
-)
-from homeassistant.helpers.entity_registry import (
-    EVENT_ENTITY_REGISTRY_UPDATED,
-    EventEntityRegistryUpdatedData,
-)
+from homeassistant.core import HomeAssistant, callback
 
 from custom_components.magic_areas.base.magic import MagicArea
 from custom_components.magic_areas.const import (
-    CONF_RELOAD_ON_REGISTRY_CHANGE,
     DATA_AREA_OBJECT,
+    DATA_LOG_GUARDS,
+    DATA_RELOAD_COORDINATOR,
     DATA_TRACKED_LISTENERS,
-    DEFAULT_RELOAD_ON_REGISTRY_CHANGE,
     MODULE_DATA,
     MagicConfigEntryVersion,
 )
 from custom_components.magic_areas.helpers.area import get_magic_area_for_config_entry
+from custom_components.magic_areas.helpers.cache import async_get_area_cache
+from custom_components.magic_areas.helpers.registry import async_get_registry_index
+from custom_components.magic_areas.helpers.reload import async_get_reload_coordinator
+from custom_components.magic_areas.helpers.trace import async_setup_log_guards
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,34 +29,26 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Set up the component."""
 
+    # Keep hot path debug guards in sync with logger levels
+    async_setup_log_guards(hass)
+
+    # Make sure meta areas follow area reloads
+    reload_coordinator = async_get_reload_coordinator(hass)
+
     @callback
-    async def _async_reload_entry(*args, **kwargs) -> None:
+    def _async_reload_entry(*args, **kwargs) -> None:
         # Prevent reloads if we're not fully loaded yet
         if not hass.is_running:
             return
 
-        hass.config_entries.async_update_entry(
-            config_entry,
-            data={**config_entry.data, "entity_ts": datetime.now(UTC)},
-        )
+        reload_coordinator.async_request_reload(config_entry.entry_id)
 
     @callback
-    async def _async_registry_updated(
-        event: (
-            Event[EventEntityRegistryUpdatedData]
-            | Event[EventDeviceRegistryUpdatedData]
-        ),
-    ) -> None:
+    def _async_registry_updated(magic_area: MagicArea) -> None:
         """Reload integration when entity registry is updated."""
 
-        area_data: dict[str, Any] = dict(config_entry.data)
-        if config_entry.options:
-            area_data.update(config_entry.options)
-
         # Check if disabled
-        if not area_data.get(
-            CONF_RELOAD_ON_REGISTRY_CHANGE, DEFAULT_RELOAD_ON_REGISTRY_CHANGE
-        ):
+        if not magic_area.settings.reload_on_registry_change:
             _LOGGER.debug(
                 "%s: Auto-Reloading disabled for this area skipping...",
                 config_entry.data[ATTR_NAME],
@@ -73,7 +60,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
             config_entry.data[ATTR_NAME],
         )
 
-        await _async_reload_entry()
+        _async_reload_entry()
 
     async def _async_setup_integration(*args, **kwargs) -> None:
         """Load integration when Hass has finished starting."""
@@ -83,6 +70,9 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
             hass, config_entry
         )
         assert magic_area is not None
+
+        # Entities without a state yet are classified from the cache
+        await async_get_area_cache(hass).async_load()
         await magic_area.initialize()
 
         _LOGGER.debug(
@@ -99,17 +89,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         # Watch for area changes.
         if not magic_area.is_meta():
             tracked_listeners.append(
-                hass.bus.async_listen(
-                    EVENT_ENTITY_REGISTRY_UPDATED,
-                    _async_registry_updated,
-                    magic_area.make_entity_registry_filter(),
-                )
-            )
-            tracked_listeners.append(
-                hass.bus.async_listen(
-                    EVENT_DEVICE_REGISTRY_UPDATED,
-                    _async_registry_updated,
-                    magic_area.make_device_registry_filter(),
+                async_get_registry_index(hass).async_register_area(
+                    magic_area, _async_registry_updated
                 )
             )
             # Reload once Home Assistant has finished starting to make sure we have all entities.
@@ -121,10 +102,27 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         }
 
         # Setup platforms
+        start = time.monotonic()
         await hass.config_entries.async_forward_entry_setups(
             config_entry, magic_area.available_platforms()
         )
 
+        # Pick up entities created by the platforms for meta areas
+        magic_area.load_magic_entities()
+        magic_area.setup_timings["platforms"] = time.monotonic() - start
+
+        # Meta areas pick up our entities from here on
+        magic_area.async_notify_loaded()
+
+        _LOGGER.debug(
+            "%s: Setup timings: %s",
+            magic_area.name,
+            ", ".join(
+                f"{phase} {duration:.3f}s"
+                for phase, duration in magic_area.setup_timings.items()
+            ),
+        )
+
     hass.data.setdefault(MODULE_DATA, {})
 
     await _async_setup_integration()
@@ -174,6 +172,14 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     if not data:
         hass.data.pop(MODULE_DATA)
 
+        # Last area is gone, the next setup starts a fresh coordinator
+        if reload_coordinator := hass.data.pop(DATA_RELOAD_COORDINATOR, None):
+            reload_coordinator.async_shutdown()
+
+        # Stop following logger level changes
+        if unsub_log_guards := hass.data.pop(DATA_LOG_GUARDS, None):
+            unsub_log_guards()
+
     return True
 
 
@@ -0,0 +1,164 @@
+"""Resolved configuration for Magic Areas."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import logging
+from types import MappingProxyType
+from typing import Any
+
+from custom_components.magic_areas.const import (
+    CONF_CLEAR_TIMEOUT,
+    CONF_ENABLED_FEATURES,
+    CONF_EXCLUDE_ENTITIES,
+    CONF_EXTENDED_TIME,
+    CONF_EXTENDED_TIMEOUT,
+    CONF_IGNORE_DIAGNOSTIC_ENTITIES,
+    CONF_INCLUDE_ENTITIES,
+    CONF_KEEP_ONLY_ENTITIES,
+    CONF_PRESENCE_DEVICE_PLATFORMS,
+    CONF_PRESENCE_SENSOR_DEVICE_CLASS,
+    CONF_RELOAD_ON_REGISTRY_CHANGE,
+    CONF_RELOAD_QUIET_WINDOW,
+    CONF_SECONDARY_STATES,
+    CONF_SECONDARY_STATES_CALCULATION_MODE,
+    CONF_SLEEP_TIMEOUT,
+    CONF_TYPE,
+    CONFIGURABLE_AREA_STATE_MAP,
+    DEFAULT_CLEAR_TIMEOUT,
+    DEFAULT_EXTENDED_TIME,
+    DEFAULT_EXTENDED_TIMEOUT,
+    DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES,
+    DEFAULT_PRESENCE_DEVICE_PLATFORMS,
+    DEFAULT_RELOAD_ON_REGISTRY_CHANGE,
+    DEFAULT_RELOAD_QUIET_WINDOW,
+    DEFAULT_SECONDARY_STATES_CALCULATION_MODE,
+    DEFAULT_SLEEP_TIMEOUT,
+    ONE_MINUTE,
+    AreaStates,
+    CalculationMode,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+EMPTY_FEATURE_OPTIONS: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class AreaSettings:
+    """Immutable snapshot of an area's merged configuration.
+
+    Built once when the area is created so hot paths don't have to walk
+    the raw config dict and resolve defaults on every event. Timeouts are
+    stored in seconds.
+    """
+
+    area_type: str | None
+    clear_timeout: int
+    extended_time: int
+    extended_timeout: int
+    sleep_timeout: int
+    secondary_state_entities: Mapping[AreaStates, str]
+    calculation_mode: CalculationMode
+    include_entities: tuple[str, ...]
+    exclude_entities: frozenset[str]
+    keep_only_entities: frozenset[str]
+    presence_device_platforms: frozenset[str]
+    presence_sensor_device_classes: frozenset[str]
+    ignore_diagnostic_entities: bool
+    reload_on_registry_change: bool
+    reload_quiet_window: int
+    features: frozenset[str]
+    feature_options: Mapping[str, Mapping[str, Any]]
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any], name: str = "") -> "AreaSettings":
+        """Build settings from a merged config entry data/options dict."""
+
+        secondary_states: Mapping[str, Any] = config.get(CONF_SECONDARY_STATES) or {}
+
+        secondary_state_entities: dict[AreaStates, str] = {}
+        for area_state, state_entity_key in CONFIGURABLE_AREA_STATE_MAP.items():
+            state_entity = secondary_states.get(state_entity_key)
+            if state_entity:
+                secondary_state_entities[AreaStates(area_state)] = state_entity
+
+        include_entities = config.get(CONF_INCLUDE_ENTITIES)
+        if not isinstance(include_entities, list):
+            include_entities = []
+
+        features, feature_options = cls._resolve_features(
+            config.get(CONF_ENABLED_FEATURES), name
+        )
+
+        return cls(
+            area_type=config.get(CONF_TYPE),
+            clear_timeout=int(
+                config.get(CONF_CLEAR_TIMEOUT, DEFAULT_CLEAR_TIMEOUT) * ONE_MINUTE
+            ),
+            extended_time=int(
+                secondary_states.get(CONF_EXTENDED_TIME, DEFAULT_EXTENDED_TIME)
+                * ONE_MINUTE
+            ),
+            extended_timeout=int(
+                secondary_states.get(CONF_EXTENDED_TIMEOUT, DEFAULT_EXTENDED_TIMEOUT)
+                * ONE_MINUTE
+            ),
+            sleep_timeout=int(
+                secondary_states.get(CONF_SLEEP_TIMEOUT, DEFAULT_SLEEP_TIMEOUT)
+                * ONE_MINUTE
+            ),
+            secondary_state_entities=MappingProxyType(secondary_state_entities),
+            calculation_mode=CalculationMode(
+                secondary_states.get(
+                    CONF_SECONDARY_STATES_CALCULATION_MODE,
+                    DEFAULT_SECONDARY_STATES_CALCULATION_MODE,
+                )
+            ),
+            include_entities=tuple(include_entities),
+            exclude_entities=frozenset(config.get(CONF_EXCLUDE_ENTITIES) or []),
+            keep_only_entities=frozenset(config.get(CONF_KEEP_ONLY_ENTITIES) or []),
+            presence_device_platforms=frozenset(
+                config.get(
+                    CONF_PRESENCE_DEVICE_PLATFORMS, DEFAULT_PRESENCE_DEVICE_PLATFORMS
+                )
+            ),
+            presence_sensor_device_classes=frozenset(
+                config.get(CONF_PRESENCE_SENSOR_DEVICE_CLASS) or []
+            ),
+            ignore_diagnostic_entities=config.get(
+                CONF_IGNORE_DIAGNOSTIC_ENTITIES, DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES
+            ),
+            reload_on_registry_change=config.get(
+                CONF_RELOAD_ON_REGISTRY_CHANGE, DEFAULT_RELOAD_ON_REGISTRY_CHANGE
+            ),
+            reload_quiet_window=int(
+                config.get(CONF_RELOAD_QUIET_WINDOW, DEFAULT_RELOAD_QUIET_WINDOW)
+            ),
+            features=features,
+            feature_options=feature_options,
+        )
+
+    @staticmethod
+    def _resolve_features(
+        enabled_features: Any, name: str
+    ) -> tuple[frozenset[str], Mapping[str, Mapping[str, Any]]]:
+        """Return enabled features and their options."""
+
+        # Deal with legacy
+        if isinstance(enabled_features, list):
+            return frozenset(enabled_features), MappingProxyType({})
+
+        # Handle everything else
+        if not isinstance(enabled_features, dict):
+            _LOGGER.warning(
+                "%s: Invalid configuration for %s", name, CONF_ENABLED_FEATURES
+            )
+            return frozenset(), MappingProxyType({})
+
+        feature_options: dict[str, Mapping[str, Any]] = {
+            feature: MappingProxyType(dict(options))
+            for feature, options in enabled_features.items()
+            if isinstance(options, dict)
+        }
+
+        return frozenset(enabled_features), MappingProxyType(feature_options)
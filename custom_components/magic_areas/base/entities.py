@@ -1,9 +1,19 @@
 """The basic entities for magic areas."""
 
+from collections.abc import Iterable, Mapping
 import logging
 
-from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from custom_components.magic_areas.base.magic import MagicArea
@@ -180,3 +190,143 @@ class BinaryMagicEntity(MagicEntity):
             self._attr_extra_state_attributes = dict(last_state.attributes)
 
         self.schedule_update_ha_state()
+
+
+class MagicGroupEntity(MagicEntity):
+    """Class for magic entities built on top of a group entity.
+
+    Members can be replaced in place, which lets meta areas follow their
+    children without being reloaded. The member listener is kept here
+    instead of in the group, so it can be moved onto the new members.
+    """
+
+    _entity_ids: list[str]
+    _members_listener: CALLBACK_TYPE | None = None
+
+    def __init__(
+        self,
+        area: MagicArea,
+        domain: str,
+        translation_key: str | None = None,
+        extra_identifiers: list[str] | None = None,
+    ) -> None:
+        """Initialize the group, keyed by its translation key."""
+        MagicEntity.__init__(
+            self,
+            area,
+            domain=domain,
+            translation_key=translation_key,
+            extra_identifiers=extra_identifiers,
+        )
+        self.group_key = translation_key
+
+    @property
+    def group_members(self) -> list[str]:
+        """Return the entity ids in the group."""
+        return self._entity_ids
+
+    async def async_added_to_hass(self) -> None:
+        """Register listeners, tracking the members here."""
+
+        # The group would subscribe to the members it's added with for good
+        members = self._entity_ids
+        self._entity_ids = []
+        try:
+            await super().async_added_to_hass()
+        finally:
+            self._entity_ids = members
+
+        self.async_on_remove(self._async_untrack_members)
+        self._async_track_members()
+
+        if self.hass.is_running:
+            self.async_update_group_state()  # type: ignore[attr-defined]
+            self.async_write_ha_state()
+
+    @callback
+    def _update_at_start(self, hass: HomeAssistant) -> None:
+        """Update the group state at start, once the members are tracked."""
+        if self._members_listener is None:
+            return
+        super()._update_at_start(hass)  # type: ignore[misc]
+
+    @callback
+    def async_update_group_members(self, entity_ids: list[str]) -> None:
+        """Replace the group members and refresh the group state."""
+
+        if entity_ids == self._entity_ids:
+            return
+
+        removed_members = set(self._entity_ids).difference(entity_ids)
+        self._entity_ids = list(entity_ids)
+
+        attributes = getattr(self, "_attr_extra_state_attributes", None)
+        if isinstance(attributes, dict) and ATTR_ENTITY_ID in attributes:
+            attributes[ATTR_ENTITY_ID] = self._entity_ids
+
+        # Not added yet, members are tracked once added
+        if self.hass is None or self._members_listener is None:
+            return
+
+        for entity_id in removed_members:
+            self.async_update_supported_features(entity_id, None)  # type: ignore[attr-defined]
+        self._async_track_members()
+
+        self.async_update_group_state()  # type: ignore[attr-defined]
+        self.async_write_ha_state()
+
+    @callback
+    def _async_track_members(self) -> None:
+        """Subscribe to the current members, dropping the previous ones."""
+
+        self._async_untrack_members()
+
+        for entity_id in self._entity_ids:
+            if (state := self.hass.states.get(entity_id)) is None:
+                continue
+            self.async_update_supported_features(entity_id, state)  # type: ignore[attr-defined]
+
+        self._members_listener = async_track_state_change_event(
+            self.hass, self._entity_ids, self._async_member_changed
+        )
+
+    @callback
+    def _async_untrack_members(self) -> None:
+        if self._members_listener:
+            self._members_listener()
+            self._members_listener = None
+
+    @callback
+    def _async_member_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle member state changes."""
+        self.async_set_context(event.context)
+        self.async_update_supported_features(  # type: ignore[attr-defined]
+            event.data["entity_id"], event.data["new_state"]
+        )
+        self.async_defer_or_update_ha_state()  # type: ignore[attr-defined]
+
+
+@callback
+def async_update_group_members(
+    groups: Iterable[Entity], members: Mapping[str | None, list[str]]
+) -> bool:
+    """Replace the members of existing groups in place.
+
+    Members map the key of each group the area should have to its member
+    entity ids. Return False if the groups don't match the keys one to one,
+    meaning entities have to be added or removed.
+    """
+
+    existing = {
+        group.group_key: group
+        for group in groups
+        if isinstance(group, MagicGroupEntity)
+    }
+
+    if existing.keys() != members.keys():
+        return False
+
+    for key, entity_ids in members.items():
+        existing[key].async_update_group_members(entity_ids)
+
+    return True
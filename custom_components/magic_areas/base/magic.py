@@ -1,62 +1,63 @@
 """Classes for Magic Areas and Meta Areas."""
 
-import asyncio
-from datetime import UTC, datetime, timedelta
+from collections.abc import Callable, Iterable, Mapping
+from datetime import UTC, datetime
 import logging
-import random
+import time
+from typing import Any
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.components.switch.const import DOMAIN as SWITCH_DOMAIN
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    ATTR_DEVICE_CLASS,
-    ATTR_ENTITY_ID,
     EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     EntityCategory,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import (
-    EventDeviceRegistryUpdatedData,
     async_get as devicereg_async_get,
 )
-from homeassistant.helpers.dispatcher import async_dispatcher_connect, dispatcher_send
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_registry import (
-    EventEntityRegistryUpdatedData,
     RegistryEntry,
     async_get as entityreg_async_get,
 )
-from homeassistant.util import Throttle, slugify
+from homeassistant.util import slugify
 
+from custom_components.magic_areas.base.config import (
+    EMPTY_FEATURE_OPTIONS,
+    AreaSettings,
+)
+from custom_components.magic_areas.base.record import AreaEntityRecord
+from custom_components.magic_areas.helpers.cache import (
+    async_get_area_cache,
+    registry_fingerprint,
+)
+from custom_components.magic_areas.helpers.states import (
+    AREA_STATE_BITS,
+    MASK_OCCUPIED,
+    mask_states,
+    states_mask,
+)
+from custom_components.magic_areas.helpers.trace import AreaTracer
 from custom_components.magic_areas.const import (
-    AREA_STATE_OCCUPIED,
     AREA_TYPE_EXTERIOR,
     AREA_TYPE_INTERIOR,
     AREA_TYPE_META,
-    CONF_ENABLED_FEATURES,
-    CONF_EXCLUDE_ENTITIES,
     CONF_FEATURE_AGGREGATION,
     CONF_FEATURE_BLE_TRACKERS,
     CONF_FEATURE_PRESENCE_HOLD,
     CONF_FEATURE_WASP_IN_A_BOX,
-    CONF_IGNORE_DIAGNOSTIC_ENTITIES,
-    CONF_INCLUDE_ENTITIES,
-    CONF_PRESENCE_DEVICE_PLATFORMS,
-    CONF_PRESENCE_SENSOR_DEVICE_CLASS,
-    CONF_TYPE,
     CONFIGURABLE_AREA_STATE_MAP,
     DATA_AREA_OBJECT,
-    DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES,
-    DEFAULT_PRESENCE_DEVICE_PLATFORMS,
     MAGIC_AREAS_COMPONENTS,
     MAGIC_AREAS_COMPONENTS_GLOBAL,
     MAGIC_AREAS_COMPONENTS_META,
-    MAGIC_DEVICE_ID_PREFIX,
-    MAGICAREAS_UNIQUEID_PREFIX,
     META_AREA_GLOBAL,
     MODULE_DATA,
+    AreaStates,
     MagicAreasEvents,
-    MetaAreaAutoReloadSettings,
     MetaAreaType,
 )
 
@@ -97,26 +98,42 @@ class MagicArea:
         self.floor_id: str | None = area.floor_id
         self.logger = logging.getLogger(__name__)
 
-        # Faster lookup lists
-        self._area_entities: list[str] = []
-        self._area_devices: list[str] = []
+        # Faster lookup sets
+        self._area_entities: set[str] = set()
+        self._area_devices: set[str] = set()
 
         # Timestamp for initialization / reload tests
         self.timestamp: datetime = datetime.now(UTC)
-        self.reloading: bool = False
+        # Setup phase -> duration in seconds
+        self.setup_timings: dict[str, float] = {}
 
         # Merged options
         area_config = dict(config.data)
         if config.options:
             area_config.update(config.options)
         self.config = area_config
+        self.settings: AreaSettings = AreaSettings.from_config(area_config, self.name)
+
+        self.entities: dict[str, list[AreaEntityRecord]] = {}
+        # domain -> device_class -> records, built while loading entities
+        self._entity_index: dict[str, dict[str | None, list[AreaEntityRecord]]] = {}
+        self.magic_entities: dict[str, list[AreaEntityRecord]] = {}
 
-        self.entities: dict[str, list[dict[str, str]]] = {}
-        self.magic_entities: dict[str, list[dict[str, str]]] = {}
+        # Warm-start cache of entity records
+        self._fingerprint: str | None = None
+        self._cached_records: dict[str, AreaEntityRecord] = {}
 
         self.last_changed: datetime = datetime.now(UTC)
 
-        self.states: list[str] = []
+        # Area states, as a bitmask over AreaStates
+        self.state_mask: int = 0
+        self._states: list[AreaStates] = []
+
+        # Trace buffer, active while the area's trace logger is on debug
+        self.tracer = AreaTracer(self.id)
+
+        # Kept by the light control switch, read by light groups
+        self.light_control: bool = False
 
         self.loaded_platforms: list[str] = []
 
@@ -129,11 +146,15 @@ class MagicArea:
             "%s (%s) initialized.", self.name, "Meta-Area" if self.is_meta() else "Area"
         )
 
+    @callback
+    def async_notify_loaded(self) -> None:
+        """Announce the area as loaded, once its platforms are set up."""
+
         @callback
-        async def _async_notify_load(*args, **kwargs) -> None:
+        def _async_notify_load(*args, **kwargs) -> None:
             """Notify that area is loaded."""
             # Announce area type loaded
-            dispatcher_send(
+            async_dispatcher_send(
                 self.hass,
                 MagicAreasEvents.AREA_LOADED,
                 self.area_type,
@@ -143,19 +164,45 @@ class MagicArea:
 
         # Wait for Hass to have started before announcing load events.
         if self.hass.is_running:
-            self.hass.create_task(_async_notify_load())
+            _async_notify_load()
         else:
             self.hass.bus.async_listen_once(
                 EVENT_HOMEASSISTANT_STARTED, _async_notify_load
             )
 
+    @property
+    def entity_ids(self) -> set[str]:
+        """Return the ids of the entities loaded for this area."""
+        return self._area_entities
+
+    @property
+    def device_ids(self) -> set[str]:
+        """Return the ids of the devices loaded for this area."""
+        return self._area_devices
+
+    @property
+    def states(self) -> list[AreaStates]:
+        """Return the area states."""
+        return self._states
+
+    @states.setter
+    def states(self, states: Iterable[str]) -> None:
+        """Set the area states."""
+        self.set_state_mask(states_mask(states))
+
+    def set_state_mask(self, mask: int) -> None:
+        """Set the area states from a bitmask."""
+        if mask != self.state_mask:
+            self.state_mask = mask
+            self._states = mask_states(mask)
+
     def is_occupied(self) -> bool:
         """Return if area is occupied."""
-        return self.has_state(AREA_STATE_OCCUPIED)
+        return bool(self.state_mask & MASK_OCCUPIED)
 
     def has_state(self, state) -> bool:
         """Check if area has a given state."""
-        return state in self.states
+        return bool(self.state_mask & AREA_STATE_BITS.get(state, 0))
 
     def has_configured_state(self, state) -> bool:
         """Check if area supports a given state."""
@@ -173,33 +220,11 @@ class MagicArea:
 
     def has_feature(self, feature) -> bool:
         """Check if area has a given feature."""
-        enabled_features = self.config.get(CONF_ENABLED_FEATURES)
+        return feature in self.settings.features
 
-        # Deal with legacy
-        if isinstance(enabled_features, list):
-            return feature in enabled_features
-
-        # Handle everything else
-        if not isinstance(enabled_features, dict):
-            self.logger.warning(
-                "%s: Invalid configuration for %s", self.name, CONF_ENABLED_FEATURES
-            )
-            return False
-
-        return feature in enabled_features
-
-    def feature_config(self, feature) -> dict:
+    def feature_config(self, feature) -> Mapping[str, Any]:
         """Return configuration for a given feature."""
-        if not self.has_feature(feature):
-            self.logger.debug("%s: Feature '%s' not enabled.", self.name, feature)
-            return {}
-
-        options = self.config.get(CONF_ENABLED_FEATURES, {})
-
-        if not options:
-            self.logger.debug("%s: No feature config found for %s", self.name, feature)
-
-        return options.get(feature, {})
+        return self.settings.feature_options.get(feature, EMPTY_FEATURE_OPTIONS)
 
     def available_platforms(self):
         """Return available platforms to area type."""
@@ -219,7 +244,7 @@ class MagicArea:
     @property
     def area_type(self):
         """Return the area type."""
-        return self.config.get(CONF_TYPE)
+        return self.settings.area_type
 
     def is_meta(self) -> bool:
         """Return if area is Meta or not."""
@@ -249,13 +274,11 @@ class MagicArea:
             return True
 
         # Is in the exclusion list?
-        if entity.entity_id in self.config.get(CONF_EXCLUDE_ENTITIES, []):
+        if entity.entity_id in self.settings.exclude_entities:
             return True
 
         # Are we excluding DIAGNOSTIC and CONFIG?
-        if self.config.get(
-            CONF_IGNORE_DIAGNOSTIC_ENTITIES, DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES
-        ):
+        if self.settings.ignore_diagnostic_entities:
             if entity.entity_category in [
                 EntityCategory.CONFIG,
                 EntityCategory.DIAGNOSTIC,
@@ -267,8 +290,9 @@ class MagicArea:
     async def load_entities(self) -> None:
         """Load entities into entity list."""
 
-        entity_list: list[RegistryEntry] = []
-        include_entities = self.config.get(CONF_INCLUDE_ENTITIES)
+        # entity_id -> entry, de-duplicates entities found more than once
+        entity_list: dict[str, RegistryEntry] = {}
+        include_entities = self.settings.include_entities
 
         entity_registry = entityreg_async_get(self.hass)
         device_registry = devicereg_async_get(self.hass)
@@ -276,46 +300,38 @@ class MagicArea:
         # Add entities from devices in this area
         devices_in_area = device_registry.devices.get_devices_for_area_id(self.id)
         for device in devices_in_area:
-            entity_list.extend(
-                [
-                    entity
-                    for entity in entity_registry.entities.get_entries_for_device_id(
-                        device.id
-                    )
-                    if not self._should_exclude_entity(entity)
-                ]
-            )
-            self._area_devices.append(device.id)
+            for entity in entity_registry.entities.get_entries_for_device_id(device.id):
+                if not self._should_exclude_entity(entity):
+                    entity_list[entity.entity_id] = entity
+            self._area_devices.add(device.id)
 
         # Add entities that are specifically set as this area but device is not or has no device.
         entities_in_area = entity_registry.entities.get_entries_for_area_id(self.id)
-        entity_list.extend(
-            [
+        for entity in entities_in_area:
+            if entity.entity_id not in entity_list and not self._should_exclude_entity(
                 entity
-                for entity in entities_in_area
-                if entity.entity_id not in entity_list
-                and not self._should_exclude_entity(entity)
-            ]
-        )
+            ):
+                entity_list[entity.entity_id] = entity
 
-        if include_entities and isinstance(include_entities, list):
+        if include_entities:
             for include_entity in include_entities:
                 entity_entry = entity_registry.async_get(include_entity)
                 if entity_entry:
-                    entity_list.append(entity_entry)
+                    entity_list.setdefault(entity_entry.entity_id, entity_entry)
 
-        self.load_entity_list(entity_list)
+        self.load_entity_list(entity_list.values())
 
         self.logger.debug(
             "%s: Found area entities: %s",
             self.name,
-            str(self.entities),
+            self.entities,
         )
 
     def load_magic_entities(self):
         """Load magic areas-generated entities."""
 
         entity_registry = entityreg_async_get(self.hass)
+        self.magic_entities = {}
 
         # Add magic are entities
         entities_for_config_id = (
@@ -324,38 +340,53 @@ class MagicArea:
             )
         )
 
-        for entity_id in [entity.entity_id for entity in entities_for_config_id]:
-            entity_domain = entity_id.split(".")[0]
-
-            if entity_domain not in self.magic_entities:
-                self.magic_entities[entity_domain] = []
+        for entity in entities_for_config_id:
+            if entity.domain not in self.magic_entities:
+                self.magic_entities[entity.domain] = []
 
-            self.magic_entities[entity_domain].append(self.get_entity_dict(entity_id))
+            self.magic_entities[entity.domain].append(
+                self.get_entity_record(entity.entity_id, entity)
+            )
 
         self.logger.debug(
-            "%s: Loaded magic entities: %s", self.name, str(self.magic_entities)
+            "%s: Loaded magic entities: %s", self.name, self.magic_entities
         )
 
-    def get_entity_dict(self, entity_id) -> dict[str, str]:
-        """Return entity_id in a dictionary with attributes (if available)."""
+        if self._fingerprint:
+            async_get_area_cache(self.hass).async_update_area(
+                self.id,
+                self._fingerprint,
+                [
+                    record
+                    for entities in (
+                        *self.entities.values(),
+                        *self.magic_entities.values(),
+                    )
+                    for record in entities
+                ],
+            )
 
-        # Get latest state and create object
-        latest_state = self.hass.states.get(entity_id)
-        entity_dict = {ATTR_ENTITY_ID: entity_id}
+    def get_entity_record(
+        self, entity_id: str, entry: RegistryEntry | None = None
+    ) -> AreaEntityRecord:
+        """Return a record of the entity for the area's entity lists."""
 
-        if latest_state:
-            # Need to exclude entity_id if present but latest_state.attributes
-            # is a ReadOnlyDict so we can't remove it, need to iterate and select
-            # all keys that are NOT entity_id
-            for attr_key, attr_value in latest_state.attributes.items():
-                if attr_key != ATTR_ENTITY_ID:
-                    entity_dict[attr_key] = attr_value
+        # Classify entities that haven't reported a state yet from the cache
+        cached = self._cached_records.get(entity_id)
+        if cached and self.hass.states.get(entity_id) is None:
+            return cached
 
-        return entity_dict
+        return AreaEntityRecord.from_entity_id(self.hass, entity_id, entry)
 
-    def load_entity_list(self, entity_list: list[RegistryEntry]) -> None:
+    def load_entity_list(self, entity_list: Iterable[RegistryEntry]) -> None:
         """Populate entity list with loaded entities."""
-        self.logger.debug("%s: Original entity list: %s", self.name, str(entity_list))
+        self.logger.debug("%s: Original entity list: %s", self.name, entity_list)
+
+        entity_list = list(entity_list)
+        self._fingerprint = registry_fingerprint(entity_list)
+        self._cached_records = async_get_area_cache(self.hass).async_get_records(
+            self.id, self._fingerprint
+        )
 
         for entity in entity_list:
             if entity.entity_id in self._area_entities:
@@ -363,8 +394,6 @@ class MagicArea:
             self.logger.debug("%s: Loading entity: %s", self.name, entity.entity_id)
 
             try:
-                updated_entity = self.get_entity_dict(entity.entity_id)
-
                 if not entity.domain:
                     self.logger.warning(
                         "%s: Entity domain not found for %s", self.name, entity
@@ -373,9 +402,13 @@ class MagicArea:
                 if entity.domain not in self.entities:
                     self.entities[entity.domain] = []
 
-                self.entities[entity.domain].append(updated_entity)
+                record = self.get_entity_record(entity.entity_id, entity)
+                self.entities[entity.domain].append(record)
+                self._entity_index.setdefault(record.domain, {}).setdefault(
+                    record.device_class, []
+                ).append(record)
 
-                self._area_entities.append(entity.entity_id)
+                self._area_entities.add(entity.entity_id)
 
             # Adding pylint exception because this is a last-resort hail-mary catch-all
             # pylint: disable-next=broad-exception-caught
@@ -395,28 +428,18 @@ class MagicArea:
 
         sensors: list[str] = []
 
-        valid_presence_platforms = self.config.get(
-            CONF_PRESENCE_DEVICE_PLATFORMS, DEFAULT_PRESENCE_DEVICE_PLATFORMS
-        )
+        valid_presence_platforms = self.settings.presence_device_platforms
 
         for component, entities in self.entities.items():
             if component not in valid_presence_platforms:
                 continue
 
-            for entity in entities:
-                if not entity:
-                    continue
-
-                if component == BINARY_SENSOR_DOMAIN:
-                    if ATTR_DEVICE_CLASS not in entity:
-                        continue
-
-                    if entity[ATTR_DEVICE_CLASS] not in self.config.get(
-                        CONF_PRESENCE_SENSOR_DEVICE_CLASS, []
-                    ):
-                        continue
+            if component == BINARY_SENSOR_DOMAIN:
+                entities = self.get_entities(
+                    component, self.settings.presence_sensor_device_classes
+                )
 
-                sensors.append(entity[ATTR_ENTITY_ID])
+            sensors.extend(entity.entity_id for entity in entities)
 
         # Append presence_hold switch as a presence_sensor
         if self.has_feature(CONF_FEATURE_PRESENCE_HOLD):
@@ -445,7 +468,9 @@ class MagicArea:
         """Initialize area."""
         self.logger.debug("%s: Initializing area...", self.name)
 
+        start = time.monotonic()
         await self.load_entities()
+        self.setup_timings["load_entities"] = time.monotonic() - start
 
         self.finalize_init()
 
@@ -453,96 +478,29 @@ class MagicArea:
         """Check if area has entities."""
         return domain in self.entities
 
-    def make_entity_registry_filter(self):
-        """Create entity register filter for this area."""
-
-        @callback
-        def _entity_registry_filter(event_data: EventEntityRegistryUpdatedData) -> bool:
-            """Filter entity registry events relevant to this area."""
-
-            entity_id = event_data["entity_id"]
-
-            # Ignore our own stuff
-            _, entity_part = entity_id.split(".")
-            if entity_part.startswith(MAGICAREAS_UNIQUEID_PREFIX):
-                return False
-
-            # Ignore if too soon
-            if datetime.now(UTC) - self.timestamp < timedelta(
-                seconds=MetaAreaAutoReloadSettings.THROTTLE
-            ):
-                return False
-
-            action = event_data["action"]
-            entity_registry = entityreg_async_get(self.hass)
-            entity_entry = entity_registry.async_get(entity_id)
-
-            if (
-                action == "update"
-                and "changes" in event_data
-                and "area_id" in event_data["changes"]
-            ):
-                # Removed from our area
-                if event_data["changes"]["area_id"] == self.id:
-                    return True
-
-                # Is from our area
-                if entity_entry and entity_entry.area_id == self.id:
-                    return True
-
-                return False
-
-            if action in ("create", "remove"):
-                # Is from our area
-                if entity_entry and entity_entry.area_id == self.id:
-                    return True
-
-            return False
-
-        return _entity_registry_filter
-
-    def make_device_registry_filter(self):
-        """Create device register filter for this area."""
-
-        @callback
-        def _device_registry_filter(event_data: EventDeviceRegistryUpdatedData) -> bool:
-            """Filter device registry events relevant to this area."""
-
-            # Ignore our own stuff
-            if event_data["device_id"].startswith(MAGIC_DEVICE_ID_PREFIX):
-                return False
-
-            # Ignore if too soon
-            if datetime.now(UTC) - self.timestamp < timedelta(
-                seconds=MetaAreaAutoReloadSettings.THROTTLE
-            ):
-                return False
-
-            action = event_data["action"]
-
-            if (
-                action == "update"
-                and "changes" in event_data
-                and "area_id" in event_data["changes"]
-            ):
-                # Removed from our area
-                if event_data["changes"]["area_id"] == self.id:
-                    return True
-
-            # Was from our area?
-            if event_data["device_id"] in self._area_devices:
-                return True
-
-            device_registry = devicereg_async_get(self.hass)
-            device_entry = device_registry.async_get(event_data["device_id"])
-
-            # Is from our area
-            if device_entry and device_entry.area_id == self.id:
-                return True
-
-            return False
-
-        return _device_registry_filter
+    def reset_entities(self) -> None:
+        """Forget loaded entities before loading them again."""
+        self.entities = {}
+        self._entity_index = {}
+        self._area_entities = set()
+
+    def get_entities(
+        self, domain: str, device_classes: Iterable[str | None]
+    ) -> list[AreaEntityRecord]:
+        """Return the area's entities of a domain with any of the device classes."""
+        device_classes = set(device_classes)
+        return [
+            record
+            for device_class, records in self._entity_index.get(domain, {}).items()
+            if device_class in device_classes
+            for record in records
+        ]
+
+    def get_entities_by_device_class(
+        self, domain: str
+    ) -> Mapping[str | None, list[AreaEntityRecord]]:
+        """Return the area's entities of a domain grouped by device class."""
+        return self._entity_index.get(domain, {})
 
 
 class MagicMetaArea(MagicArea):
@@ -557,6 +515,9 @@ class MagicMetaArea(MagicArea):
         """Initialize the meta magic area with all the stuff."""
         super().__init__(hass, area, config)
         self.child_areas: list[str] = self.get_child_areas()
+        self._membership_updaters: list[Callable[[], bool]] = []
+        # (domain, device_class) pairs the platforms were set up with
+        self._entity_layout: frozenset[tuple[str, str | None]] = frozenset()
 
     def get_presence_sensors(self) -> list[str]:
         """Return list of entities used for presence tracking."""
@@ -597,27 +558,75 @@ class MagicMetaArea(MagicArea):
 
     def get_child_areas(self):
         """Return areas that a Meta area is watching."""
+        return [area.slug for area in self.get_child_magic_areas()]
+
+    def get_child_magic_areas(self) -> list[MagicArea]:
+        """Return the area objects of the areas a Meta area is watching."""
         data = self.hass.data[MODULE_DATA]
-        areas: list[str] = []
+        areas: list[MagicArea] = []
 
         for area_info in data.values():
             area: MagicArea = area_info[DATA_AREA_OBJECT]
 
-            if area.is_meta():
-                continue
-
-            if self.floor_id:
-                if self.floor_id == area.floor_id:
-                    areas.append(area.slug)
-            else:
-                if (
-                    self.id == MetaAreaType.GLOBAL
-                    or area.config.get(CONF_TYPE) == self.id
-                ):
-                    areas.append(area.slug)
+            if self.is_parent_of(area.area_type, area.floor_id):
+                areas.append(area)
 
         return areas
 
+    def is_parent_of(self, area_type: str | None, floor_id: str | None) -> bool:
+        """Return whether an area of the given type and floor is a child."""
+
+        if area_type == AREA_TYPE_META:
+            return False
+
+        if self.floor_id:
+            return self.floor_id == floor_id
+
+        return self.id == MetaAreaType.GLOBAL or area_type == self.id
+
+    @callback
+    def async_register_membership_updater(
+        self, updater: Callable[[], bool]
+    ) -> CALLBACK_TYPE:
+        """Register a platform callback applying membership changes in place.
+
+        The callback returns False if its entities can't follow the change,
+        i.e. entities would have to be added or removed.
+        """
+        self._membership_updaters.append(updater)
+
+        @callback
+        def _unregister() -> None:
+            self._membership_updaters.remove(updater)
+
+        return _unregister
+
+    async def async_update_membership(self) -> bool:
+        """Reload child entities and update existing entities in place.
+
+        Return False if the entry needs a full reload instead.
+        """
+        self.logger.debug("%s: Updating meta area membership.", self.name)
+
+        self.child_areas = self.get_child_areas()
+        self.reset_entities()
+        await self.load_entities()
+        self.timestamp = datetime.now(UTC)
+
+        # Platforms create entities per domain and device class
+        if self.get_entity_layout() != self._entity_layout:
+            return False
+
+        return all(updater() for updater in list(self._membership_updaters))
+
+    def get_entity_layout(self) -> frozenset[tuple[str, str | None]]:
+        """Return the domains and device classes of the loaded entities."""
+        return frozenset(
+            (domain, device_class)
+            for domain, device_classes in self._entity_index.items()
+            for device_class in device_classes
+        )
+
     async def initialize(self, _=None) -> None:
         """Initialize Meta area."""
         if self.initialized:
@@ -626,7 +635,10 @@ class MagicMetaArea(MagicArea):
 
         self.logger.debug("%s: Initializing meta area...", self.name)
 
+        start = time.monotonic()
         await self.load_entities()
+        self._entity_layout = self.get_entity_layout()
+        self.setup_timings["load_entities"] = time.monotonic() - start
 
         self.finalize_init()
 
@@ -643,31 +655,20 @@ class MagicMetaArea(MagicArea):
             if area.slug not in self.child_areas:
                 continue
 
-            # Force loading of magic entities
-            area.load_magic_entities()
-
+            # Children load their magic entities before announcing their load,
+            # meta areas are updated from the announcement
             for entities in area.magic_entities.values():
                 for entity in entities:
-                    if not isinstance(entity[ATTR_ENTITY_ID], str):
-                        self.logger.debug(
-                            "%s: Entity ID is not a string: '%s' (probably a group, skipping)",
-                            self.name,
-                            str(entity[ATTR_ENTITY_ID]),
-                        )
-                        continue
-
                     # Skip excluded entities
-                    if entity[ATTR_ENTITY_ID] in self.config.get(
-                        CONF_EXCLUDE_ENTITIES, []
-                    ):
+                    if entity.entity_id in self.settings.exclude_entities:
                         continue
 
-                    entity_entry = entity_registry.async_get(entity[ATTR_ENTITY_ID])
+                    entity_entry = entity_registry.async_get(entity.entity_id)
                     if not entity_entry:
                         self.logger.debug(
                             "%s: Magic Entity not found on Entity Registry: %s",
                             self.name,
-                            entity[ATTR_ENTITY_ID],
+                            entity.entity_id,
                         )
                         continue
                     entity_list.append(entity_entry)
@@ -675,75 +676,5 @@ class MagicMetaArea(MagicArea):
         self.load_entity_list(entity_list)
 
         self.logger.debug(
-            "%s: Loaded entities for meta area: %s", self.name, str(self.entities)
-        )
-
-    def finalize_init(self) -> None:
-        """Finalize Meta-Area initialization."""
-
-        async_dispatcher_connect(
-            self.hass, MagicAreasEvents.AREA_LOADED, self._handle_loaded_area
-        )
-
-    @callback
-    async def _handle_loaded_area(
-        self, area_type: str, floor_id: int | None, area_id: str
-    ) -> None:
-        """Handle area loaded signals."""
-
-        self.logger.debug(
-            "%s: Received area loaded signal (type=%s, floor_id=%s, area_id=%s)",
-            self.name,
-            area_type,
-            floor_id,
-            area_id,
-        )
-
-        # Don't act while hass is not running
-        if not self.hass.is_running:
-            return
-
-        # Ignore if already handling it
-        if self.reloading:
-            return
-
-        # Handle Global
-        if self.slug == MetaAreaType.GLOBAL:
-            return await self.reload()
-
-        # Handle all non-Global meta-areas including floors
-        self.logger.info(
-            "SS %s, AT %s, AI %s, CA: %s",
-            self.slug,
-            area_type,
-            area_id,
-            str(self.child_areas),
-        )
-        if area_type == self.slug or area_id in self.child_areas:
-            return await self.reload()
-
-    @Throttle(min_time=timedelta(seconds=MetaAreaAutoReloadSettings.THROTTLE))
-    async def reload(self) -> None:
-        """Reload current entry."""
-        self.logger.info("%s: Reloading entry.", self.name)
-
-        # Give some time for areas to finish loading,
-        # randomize to prevent staggering the CPU with
-        # stacked reloads.
-        max_delay: float = (
-            MetaAreaAutoReloadSettings.DELAY_MULTIPLIER
-            * MetaAreaAutoReloadSettings.DELAY
+            "%s: Loaded entities for meta area: %s", self.name, self.entities
         )
-        delay: float = random.uniform(
-            MetaAreaAutoReloadSettings.DELAY,
-            max_delay,
-        )
-
-        # Make Global load last
-        if self.slug == MetaAreaType.GLOBAL:
-            delay = max_delay
-
-        self.reloading = True
-        await asyncio.sleep(delay)
-
-        self.hass.config_entries.async_schedule_reload(self.hass_config.entry_id)
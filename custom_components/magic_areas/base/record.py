@@ -0,0 +1,64 @@
+"""Entity records for Magic Areas."""
+
+from dataclasses import dataclass, field
+
+from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.helpers.entity_registry import RegistryEntry
+
+
+@dataclass(frozen=True, slots=True)
+class AreaEntityRecord:
+    """Compact record of an entity loaded into an area.
+
+    Only the fields used to pick entities are kept, the entity's state
+    is read from the state machine when needed.
+    """
+
+    hass: HomeAssistant = field(repr=False, compare=False)
+    entity_id: str
+    domain: str
+    device_class: str | None = None
+    unit: str | None = None
+    entity_category: str | None = None
+
+    @classmethod
+    def from_entity_id(
+        cls,
+        hass: HomeAssistant,
+        entity_id: str,
+        entry: RegistryEntry | None = None,
+    ) -> "AreaEntityRecord":
+        """Create a record from the entity's current state and registry entry."""
+
+        device_class: str | None = None
+        unit: str | None = None
+        entity_category: str | None = None
+
+        # The state reflects registry overrides, fall back to the
+        # registry for entities that haven't reported a state yet
+        latest_state = hass.states.get(entity_id)
+        if latest_state:
+            device_class = latest_state.attributes.get(ATTR_DEVICE_CLASS)
+            unit = latest_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+
+        if entry:
+            device_class = (
+                device_class or entry.device_class or entry.original_device_class
+            )
+            unit = unit or entry.unit_of_measurement
+            entity_category = entry.entity_category
+
+        return cls(
+            hass,
+            entity_id,
+            split_entity_id(entity_id)[0],
+            device_class,
+            unit,
+            entity_category,
+        )
+
+    @property
+    def state(self) -> State | None:
+        """Return the entity's current state."""
+        return self.hass.states.get(self.entity_id)
@@ -7,11 +7,11 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_ENTITY_ID
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from custom_components.magic_areas.base.entities import async_update_group_members
 from custom_components.magic_areas.base.magic import MagicArea, MagicMetaArea
 from custom_components.magic_areas.binary_sensor.base import AreaSensorGroupBinarySensor
 from custom_components.magic_areas.binary_sensor.ble_tracker import (
@@ -39,7 +39,11 @@ from custom_components.magic_areas.const import (
     MagicAreasFeatureInfoHealth,
 )
 from custom_components.magic_areas.helpers.area import get_area_from_config_entry
-from custom_components.magic_areas.threshold import create_illuminance_threshold
+from custom_components.magic_areas.threshold import (
+    AreaThresholdSensor,
+    create_illuminance_threshold,
+    get_illuminance_threshold_sensors,
+)
 from custom_components.magic_areas.util import cleanup_removed_entries
 
 _LOGGER = logging.getLogger(__name__)
@@ -74,7 +78,59 @@ async def async_setup_entry(
     )
     assert area is not None
 
-    entities = []
+    entities = create_binary_sensors(hass, area)
+
+    # Add all entities
+    async_add_entities(entities)
+
+    # Follow child area changes in place
+    if isinstance(area, MagicMetaArea):
+
+        @callback
+        def _async_update_membership() -> bool:
+            if not (
+                async_update_group_members(
+                    _entities_of_type(entities, AreaAggregateBinarySensor),
+                    get_aggregate_sensor_members(area),
+                )
+                and async_update_group_members(
+                    _entities_of_type(entities, AreaHealthBinarySensor),
+                    get_health_sensor_members(area),
+                )
+            ):
+                return False
+
+            # The threshold sensor comes and goes with the illuminance sensors
+            if bool(_entities_of_type(entities, AreaThresholdSensor)) != bool(
+                get_illuminance_threshold_sensors(area)
+            ):
+                return False
+
+            for entity in entities:
+                if isinstance(entity, (MetaAreaStateBinarySensor, AreaThresholdSensor)):
+                    entity.async_update_sensors()
+
+            return True
+
+        config_entry.async_on_unload(
+            area.async_register_membership_updater(_async_update_membership)
+        )
+
+    # Cleanup
+    if BINARY_SENSOR_DOMAIN in area.magic_entities:
+        cleanup_removed_entries(
+            area.hass, entities, area.magic_entities[BINARY_SENSOR_DOMAIN]
+        )
+
+
+def _entities_of_type(entities: list[Entity], cls: type[Entity]) -> list[Entity]:
+    return [entity for entity in entities if isinstance(entity, cls)]
+
+
+def create_binary_sensors(hass: HomeAssistant, area: MagicArea) -> list[Entity]:
+    """Create the binary sensors for the area."""
+
+    entities: list[Entity] = []
 
     # Create main presence sensor
     if area.is_meta() and isinstance(area, MagicMetaArea):
@@ -99,14 +155,7 @@ async def async_setup_entry(
     if area.has_feature(CONF_FEATURE_BLE_TRACKERS):
         entities.extend(create_ble_tracker_sensor(area))
 
-    # Add all entities
-    async_add_entities(entities)
-
-    # Cleanup
-    if BINARY_SENSOR_DOMAIN in area.magic_entities:
-        cleanup_removed_entries(
-            area.hass, entities, area.magic_entities[BINARY_SENSOR_DOMAIN]
-        )
+    return entities
 
 
 def create_wasp_in_a_box_sensor(
@@ -157,26 +206,52 @@ def create_ble_tracker_sensor(area: MagicArea) -> list[AreaBLETrackerBinarySenso
 
 def create_health_sensors(area: MagicArea) -> list[AreaHealthBinarySensor]:
     """Add the health sensors for the area."""
+
+    health_sensors: list[AreaHealthBinarySensor] = []
+
+    for device_class, distress_entities in get_health_sensor_members(area).items():
+        _LOGGER.debug(
+            "%s: Creating health sensor with the following entities: %s",
+            area.slug,
+            str(distress_entities),
+        )
+
+        try:
+            health_sensors.append(
+                AreaHealthBinarySensor(
+                    area,
+                    device_class=device_class,
+                    entity_ids=distress_entities,
+                )
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            _LOGGER.error(
+                "%s: Error creating area health sensor: %s",
+                area.slug,
+                str(e),
+            )
+
+    return health_sensors
+
+
+def get_health_sensor_members(area: MagicArea) -> dict[str, list[str]]:
+    """Return the members of the area's health sensor by device class."""
     if not area.has_feature(CONF_FEATURE_HEALTH):
-        return []
+        return {}
 
     if BINARY_SENSOR_DOMAIN not in area.entities:
-        return []
-
-    distress_entities: list[str] = []
+        return {}
 
     health_sensor_device_classes = area.feature_config(CONF_FEATURE_HEALTH).get(
         CONF_HEALTH_SENSOR_DEVICE_CLASSES, DEFAULT_HEALTH_SENSOR_DEVICE_CLASSES
     )
 
-    for entity in area.entities[BINARY_SENSOR_DOMAIN]:
-        if ATTR_DEVICE_CLASS not in entity:
-            continue
-
-        if entity[ATTR_DEVICE_CLASS] not in health_sensor_device_classes:
-            continue
-
-        distress_entities.append(entity[ATTR_ENTITY_ID])
+    distress_entities: list[str] = [
+        entity.entity_id
+        for entity in area.get_entities(
+            BINARY_SENSOR_DOMAIN, health_sensor_device_classes
+        )
+    ]
 
     if not distress_entities:
         _LOGGER.debug(
@@ -184,66 +259,17 @@ def create_health_sensors(area: MagicArea) -> list[AreaHealthBinarySensor]:
             area.name,
             str(health_sensor_device_classes),
         )
-        return []
-
-    _LOGGER.debug(
-        "%s: Creating health sensor with the following entities: %s",
-        area.slug,
-        str(distress_entities),
-    )
+        return {}
 
-    try:
-        return [
-            AreaHealthBinarySensor(
-                area,
-                device_class=BinarySensorDeviceClass.PROBLEM,
-                entity_ids=distress_entities,
-            )
-        ]
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        _LOGGER.error(
-            "%s: Error creating area health sensor: %s",
-            area.slug,
-            str(e),
-        )
-        return []
+    return {BinarySensorDeviceClass.PROBLEM: distress_entities}
 
 
 def create_aggregate_sensors(area: MagicArea) -> list[Entity]:
     """Create the aggregate sensors for the area."""
-    # Create aggregates
-    if not area.has_feature(CONF_FEATURE_AGGREGATION):
-        return []
 
     aggregates: list[Entity] = []
 
-    # Check BINARY_SENSOR_DOMAIN entities, count by device_class
-    if BINARY_SENSOR_DOMAIN not in area.entities:
-        return []
-
-    device_class_entities: dict[str, list[str]] = {}
-
-    for entity in area.entities[BINARY_SENSOR_DOMAIN]:
-        if ATTR_DEVICE_CLASS not in entity:
-            continue
-
-        if entity[ATTR_DEVICE_CLASS] not in device_class_entities:
-            device_class_entities[entity[ATTR_DEVICE_CLASS]] = []
-
-        device_class_entities[entity[ATTR_DEVICE_CLASS]].append(entity["entity_id"])
-
-    for device_class, entity_list in device_class_entities.items():
-        if len(entity_list) < area.feature_config(CONF_FEATURE_AGGREGATION).get(
-            CONF_AGGREGATES_MIN_ENTITIES, 0
-        ):
-            continue
-
-        if device_class not in area.feature_config(CONF_FEATURE_AGGREGATION).get(
-            CONF_AGGREGATES_BINARY_SENSOR_DEVICE_CLASSES,
-            DEFAULT_AGGREGATES_BINARY_SENSOR_DEVICE_CLASSES,
-        ):
-            continue
-
+    for device_class, entity_list in get_aggregate_sensor_members(area).items():
         _LOGGER.debug(
             "Creating aggregate sensor for device_class '%s' with %s entities (%s)",
             device_class,
@@ -263,3 +289,40 @@ def create_aggregate_sensors(area: MagicArea) -> list[Entity]:
             )
 
     return aggregates
+
+
+def get_aggregate_sensor_members(area: MagicArea) -> dict[str, list[str]]:
+    """Return the members of the area's aggregate sensors by device class."""
+    # Create aggregates
+    if not area.has_feature(CONF_FEATURE_AGGREGATION):
+        return {}
+
+    # Check BINARY_SENSOR_DOMAIN entities, count by device_class
+    if BINARY_SENSOR_DOMAIN not in area.entities:
+        return {}
+
+    device_class_entities: dict[str, list[str]] = {
+        device_class: [entity.entity_id for entity in entities]
+        for device_class, entities in area.get_entities_by_device_class(
+            BINARY_SENSOR_DOMAIN
+        ).items()
+        if device_class is not None
+    }
+
+    members: dict[str, list[str]] = {}
+
+    for device_class, entity_list in device_class_entities.items():
+        if len(entity_list) < area.feature_config(CONF_FEATURE_AGGREGATION).get(
+            CONF_AGGREGATES_MIN_ENTITIES, 0
+        ):
+            continue
+
+        if device_class not in area.feature_config(CONF_FEATURE_AGGREGATION).get(
+            CONF_AGGREGATES_BINARY_SENSOR_DEVICE_CLASSES,
+            DEFAULT_AGGREGATES_BINARY_SENSOR_DEVICE_CLASSES,
+        ):
+            continue
+
+        members[device_class] = entity_list
+
+    return members
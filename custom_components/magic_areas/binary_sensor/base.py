@@ -5,14 +5,25 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
 )
 from homeassistant.components.group.binary_sensor import BinarySensorGroup
+from homeassistant.core import State, callback
 
-from custom_components.magic_areas.base.entities import MagicEntity
+from custom_components.magic_areas.base.entities import MagicGroupEntity
 from custom_components.magic_areas.base.magic import MagicArea
-from custom_components.magic_areas.const import AGGREGATE_MODE_ALL, EMPTY_STRING
+from custom_components.magic_areas.const import (
+    AGGREGATE_MODE_ALL,
+    ATTR_ON_COUNT,
+    ATTR_TOTAL,
+    EMPTY_STRING,
+)
+from custom_components.magic_areas.helpers.aggregate import BinaryStateCounter
+
 
+class AreaSensorGroupBinarySensor(MagicGroupEntity, BinarySensorGroup):
+    """Group binary sensor for the area.
 
-class AreaSensorGroupBinarySensor(MagicEntity, BinarySensorGroup):
-    """Group binary sensor for the area."""
+    Member states are counted as they change, so the group state doesn't
+    have to be recomputed over all members.
+    """
 
     def __init__(
         self,
@@ -22,9 +33,13 @@ class AreaSensorGroupBinarySensor(MagicEntity, BinarySensorGroup):
     ) -> None:
         """Initialize an area sensor group binary sensor."""
 
-        MagicEntity.__init__(
+        MagicGroupEntity.__init__(
             self, area, domain=BINARY_SENSOR_DOMAIN, translation_key=device_class
         )
+
+        self._counter = BinaryStateCounter()
+        self._all_mode = device_class in AGGREGATE_MODE_ALL
+
         BinarySensorGroup.__init__(
             self,
             device_class=(
@@ -33,6 +48,41 @@ class AreaSensorGroupBinarySensor(MagicEntity, BinarySensorGroup):
             name=EMPTY_STRING,
             unique_id=self._attr_unique_id,
             entity_ids=entity_ids,
-            mode=device_class in AGGREGATE_MODE_ALL,
+            mode=self._all_mode,
         )
         delattr(self, "_attr_name")
+
+    @callback
+    def async_update_supported_features(
+        self, entity_id: str, new_state: State | None
+    ) -> None:
+        """Count a member's new state."""
+        super().async_update_supported_features(entity_id, new_state)
+
+        self._counter.update(entity_id, new_state.state if new_state else None)
+
+    @callback
+    def async_update_group_state(self) -> None:
+        """Update the group state from the member counts."""
+
+        counter = self._counter
+
+        # Unavailable if all members are unavailable or missing
+        self._attr_available = counter.present > counter.unavailable
+
+        self._attr_extra_state_attributes[ATTR_ON_COUNT] = counter.on
+        self._attr_extra_state_attributes[ATTR_TOTAL] = len(self._entity_ids)
+
+        if self._all_mode:
+            # Unknown if any member is unknown or unavailable
+            if counter.invalid:
+                self._attr_is_on = None
+            else:
+                self._attr_is_on = counter.on == counter.present
+            return
+
+        # Unknown if all members are unknown or unavailable
+        if counter.present == counter.invalid:
+            self._attr_is_on = None
+        else:
+            self._attr_is_on = counter.on > 0
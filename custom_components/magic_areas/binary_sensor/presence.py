@@ -5,6 +5,7 @@ from collections import Counter
 from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 import logging
+import time
 
 from homeassistant.components.binary_sensor import (
     DOMAIN as BINARY_SENSOR_DOMAIN,
@@ -13,13 +14,12 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.components.sun.const import STATE_ABOVE_HORIZON
 from homeassistant.const import STATE_ON
-from homeassistant.core import Event, EventStateChangedData, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect, dispatcher_send
-from homeassistant.helpers.event import (
-    async_call_later,
-    async_track_state_change_event,
-    async_track_time_interval,
+from homeassistant.core import Event, EventStateChangedData, State, callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
 )
+from homeassistant.helpers.event import async_track_state_change_event
 
 from custom_components.magic_areas.base.entities import BinaryMagicEntity
 from custom_components.magic_areas.base.magic import MagicArea, MagicMetaArea
@@ -31,33 +31,24 @@ from custom_components.magic_areas.const import (
     ATTR_PRESENCE_SENSORS,
     ATTR_STATES,
     ATTR_TYPE,
-    CONF_CLEAR_TIMEOUT,
-    CONF_EXTENDED_TIME,
-    CONF_EXTENDED_TIMEOUT,
-    CONF_KEEP_ONLY_ENTITIES,
-    CONF_SECONDARY_STATES,
-    CONF_SECONDARY_STATES_CALCULATION_MODE,
-    CONF_SLEEP_TIMEOUT,
-    CONF_TYPE,
     CONFIGURABLE_AREA_STATE_MAP,
-    DEFAULT_CLEAR_TIMEOUT,
-    DEFAULT_EXTENDED_TIME,
-    DEFAULT_EXTENDED_TIMEOUT,
-    DEFAULT_SECONDARY_STATES_CALCULATION_MODE,
-    DEFAULT_SLEEP_TIMEOUT,
     EMPTY_STRING,
     INVALID_STATES,
     ONE_MINUTE,
     PRESENCE_SENSOR_VALID_ON_STATES,
-    UPDATE_INTERVAL,
     AreaStates,
     CalculationMode,
     MagicAreasEvents,
     MagicAreasFeatureInfo,
     MagicAreasFeatureInfoPresenceTracking,
 )
+from custom_components.magic_areas.helpers.states import mask_states, states_mask
+from custom_components.magic_areas.helpers.timer import async_schedule_timer
+from custom_components.magic_areas.helpers.trace import LogGuard
+from custom_components.magic_areas.util import area_signal
 
 _LOGGER = logging.getLogger(__name__)
+_DEBUG = LogGuard(_LOGGER)
 
 
 class AreaStateTrackerEntity(BinaryMagicEntity):
@@ -74,44 +65,51 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
 
         self._state: bool = False
 
-        self._last_off_time: datetime = datetime.now(UTC) - timedelta(days=2)
-        self._clear_timeout_callback: Callable[[], None] | None = None
+        # When the clear timeout started, None while not on timeout
+        self._clear_timeout_start: datetime | None = None
+        self._evaluation_callback: Callable[[], None] | None = None
+
+        # Pending evaluation for this loop iteration, if any
+        self._pending_update: asyncio.Task | None = None
+        # Updates merged into the pending evaluation, reported when tracing
+        self._coalesced_updates: int = 0
+        # Updates merged into a pending evaluation since the entity was created
+        self._coalesced_evaluations: int = 0
 
         self._sensors: list[str] = []
+        self._sensors_listener: Callable[[], None] | None = None
         self._active_sensors: list[str] = []
         self._last_active_sensors: list[str] = []
 
+        # Live view of sensors currently in a valid on state, kept
+        # separately for keep-only sensors as they only count while occupied.
+        self._valid_states: frozenset[str] = frozenset(self._valid_on_states())
+        self._valid_secondary_states: frozenset[str] = frozenset(
+            self._valid_on_states([STATE_ABOVE_HORIZON])
+        )
+        self._keep_only_sensors: frozenset[str] = frozenset()
+        self._active_presence_sensors: dict[str, None] = {}
+        self._active_keep_only_sensors: dict[str, None] = {}
+
         self._load_presence_sensors()
 
         _LOGGER.debug("%s: presence tracker initialized", self.area.name)
 
     def _setup_tracking_listeners(self) -> None:
         # Track presence sensor
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, self._sensors, self._sensor_state_change
-            )
-        )
+        self._track_presence_sensors()
+        self.async_on_remove(self._untrack_presence_sensors)
 
         # Track secondary states
-        secondary_state_entities: list[str] = []
-        configurable_states = self._get_configured_secondary_states()
-
-        for configurable_state in configurable_states:
-            configurable_state_entity = CONFIGURABLE_AREA_STATE_MAP[configurable_state]
-            tracked_entity = self.area.config.get(CONF_SECONDARY_STATES, {}).get(
-                configurable_state_entity, None
-            )
-            if not tracked_entity:
-                continue
-
-            secondary_state_entities.append(tracked_entity)
+        secondary_state_entities: list[str] = list(
+            self.area.settings.secondary_state_entities.values()
+        )
 
         if secondary_state_entities:
             _LOGGER.debug(
                 "%s: Secondary state tracking: %s",
                 self.area.name,
-                str(secondary_state_entities),
+                secondary_state_entities,
             )
             self.async_on_remove(
                 async_track_state_change_event(
@@ -119,25 +117,66 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
                 )
             )
 
-        # Timed self update
-        delta = timedelta(seconds=UPDATE_INTERVAL)
-        self.async_on_remove(
-            async_track_time_interval(self.hass, self._update_state, delta)
+        self.async_on_remove(self._cleanup_timers)
+
+    @callback
+    def _track_presence_sensors(self) -> None:
+        """Subscribe to the current presence sensors."""
+
+        self._untrack_presence_sensors()
+        self._rescan_sensors()
+
+        self._sensors_listener = async_track_state_change_event(
+            self.hass, self._sensors, self._sensor_state_change
         )
 
-        self.async_on_remove(self._cleanup_timers)
+    @callback
+    def _untrack_presence_sensors(self) -> None:
+        """Remove the presence sensors listener."""
+        if self._sensors_listener:
+            self._sensors_listener()
+            self._sensors_listener = None
 
     @callback
     def _cleanup_timers(self) -> None:
         """Remove pending timers."""
         self._remove_clear_timeout()
+        self._cancel_scheduled_evaluation()
+
+        if self._pending_update:
+            self._pending_update.cancel()
+            self._pending_update = None
 
     # Public methods
 
+    @property
+    def coalesced_evaluations(self) -> int:
+        """Return how many evaluations were merged into an already pending one."""
+        return self._coalesced_evaluations
+
     def get_sensors(self) -> list[str]:
         """Return sensors used for tracking."""
         return self._sensors
 
+    @callback
+    def async_update_sensors(self) -> None:
+        """Reload presence sensors from the area and re-evaluate in place."""
+
+        sensors = self._sensors
+        self._load_presence_sensors()
+
+        if self._sensors == sensors:
+            return
+
+        _LOGGER.debug("%s: Presence sensors changed: %s", self.area.name, self._sensors)
+
+        # Not added yet, listeners will pick up the new list
+        if self.hass is None:
+            return
+
+        self._track_presence_sensors()
+        self._schedule_update()
+
     def get_metadata(self) -> dict:
         """Return metadata information about the area's occupancy."""
         return {
@@ -160,33 +199,40 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
 
         return [STATE_ON] if self.area.is_meta() else valid_states
 
-    def _get_configured_secondary_states(self) -> list[str]:
-        """Return configured secondary states."""
-        secondary_states = []
+    # Entity loading
 
-        for (
-            configurable_state,
-            configurable_state_entity,
-        ) in CONFIGURABLE_AREA_STATE_MAP.items():
-            secondary_state_entity = self.area.config.get(
-                CONF_SECONDARY_STATES, {}
-            ).get(configurable_state_entity, None)
+    def _load_presence_sensors(self) -> None:
+        """Load sensors that are relevant for presence sensing."""
 
-            if not secondary_state_entity:
-                continue
+        self._sensors = self.area.get_presence_sensors()
+        self._keep_only_sensors = self.area.settings.keep_only_entities
 
-            secondary_states.append(configurable_state)
+    def _rescan_sensors(self) -> None:
+        """Rebuild the active sensor set from the state machine."""
 
-        return secondary_states
+        self._active_presence_sensors.clear()
+        self._active_keep_only_sensors.clear()
 
-    # Entity loading
+        for sensor in self._sensors:
+            self._track_sensor_state(sensor, self.hass.states.get(sensor))
 
-    def _load_presence_sensors(self) -> None:
-        """Load sensors that are relevant for presence sensing."""
+    @callback
+    def _track_sensor_state(self, entity_id: str, state: State | None) -> None:
+        """Add or remove a sensor from the active sensor set."""
 
-        self._sensors = self.area.get_presence_sensors()
+        active_sensors = (
+            self._active_keep_only_sensors
+            if entity_id in self._keep_only_sensors
+            else self._active_presence_sensors
+        )
+
+        if state is not None and state.state in self._valid_states:
+            active_sensors[entity_id] = None
+        else:
+            active_sensors.pop(entity_id, None)
 
     # Entity state tracking & reporting
+    @callback
     def _secondary_state_change(self, event: Event[EventStateChangedData]) -> None:
         """Handle area secondary state change event."""
         if event.data["new_state"] is None:
@@ -211,11 +257,15 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
             )
             return None
 
-        self.hass.loop.call_soon_threadsafe(self._update_state, datetime.now(UTC))
+        self._schedule_update()
 
+    @callback
     def _sensor_state_change(self, event: Event[EventStateChangedData]) -> None:
         """Actions when the sensor state has changed."""
         if event.data["new_state"] is None:
+            # Removed sensors no longer count as active
+            self._track_sensor_state(event.data["entity_id"], None)
+            self._schedule_update()
             return
 
         # Ignore state reports taht aren't really a state change
@@ -229,33 +279,61 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
         to_state = event.data["new_state"].state
         entity_id = event.data["entity_id"]
 
-        _LOGGER.debug(
-            "%s: sensor '%s' changed to {%s}",
-            self.area.name,
-            entity_id,
-            to_state,
-        )
+        self._track_sensor_state(entity_id, event.data["new_state"])
 
-        if to_state in INVALID_STATES:
+        self.area.tracer.trace("sensor", detail=(entity_id, to_state))
+
+        if _DEBUG.enabled:
             _LOGGER.debug(
-                "%s: sensor '%s' has invalid state %s",
+                "%s: sensor '%s' changed to {%s}",
                 self.area.name,
                 entity_id,
                 to_state,
             )
-            return
 
-        if to_state and to_state not in self._valid_on_states():
+        # Invalid states are handled as off, there is no periodic update
+        # to pick up the sensor going away otherwise.
+        if to_state in INVALID_STATES and _DEBUG.enabled:
             _LOGGER.debug(
-                "Setting last non-normal time %s %s",
-                event.data["old_state"],
-                event.data["new_state"],
+                "%s: sensor '%s' has invalid state %s",
+                self.area.name,
+                entity_id,
+                to_state,
             )
-            self._last_off_time = datetime.now(UTC)  # Update last_off_time
-            # Clear the timeout
+
+        if to_state and to_state not in self._valid_states:
+            if _DEBUG.enabled:
+                _LOGGER.debug(
+                    "Setting last non-normal time %s %s",
+                    event.data["old_state"],
+                    event.data["new_state"],
+                )
+            # Restart the clear timeout from this transition
             self._remove_clear_timeout()
 
-        self.hass.loop.call_soon_threadsafe(self._update_state, datetime.now(UTC))
+        self._schedule_update()
+
+    @callback
+    def _schedule_update(self) -> None:
+        """Mark the area dirty, evaluating it at most once per loop iteration."""
+
+        if self._pending_update:
+            self._coalesced_updates += 1
+            self._coalesced_evaluations += 1
+            return
+
+        # Tracked by hass, so waiting for hass to be idle includes the evaluation
+        self._pending_update = self.hass.async_create_task(
+            self._async_run_pending_update(),
+            f"Evaluate Magic Areas area {self.area.name}",
+            eager_start=False,
+        )
+
+    async def _async_run_pending_update(self) -> None:
+        """Run the evaluation scheduled by `_schedule_update`."""
+
+        self._pending_update = None
+        self._update_state()
 
     async def _async_update_state(self, timeout: int) -> None:
         await asyncio.sleep(timeout)
@@ -265,6 +343,12 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
     def _update_state(self, extra: datetime | None = None) -> None:
         """Update the area's state and report changes."""
 
+        tracer = self.area.tracer
+        start = time.perf_counter() if tracer.enabled else 0.0
+
+        coalesced = self._coalesced_updates
+        self._coalesced_updates = 0
+
         states_tuple = self._update_area_states()
         new_states, lost_states = states_tuple
 
@@ -272,56 +356,72 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
             state in new_states for state in [AreaStates.OCCUPIED, AreaStates.CLEAR]
         )
 
-        _LOGGER.debug(
-            "%s: States updated. New states: %s / Lost states: %s",
-            self.area.name,
-            str(new_states),
-            str(lost_states),
-        )
+        if _DEBUG.enabled:
+            _LOGGER.debug(
+                "%s: States updated. New states: %s / Lost states: %s",
+                self.area.name,
+                new_states,
+                lost_states,
+            )
 
         if state_changed:
             # Consider all secondary states new
             states_tuple = (self.area.states.copy(), [])
 
+        self._schedule_next_evaluation()
         self._report_state_change(states_tuple)
 
+        if tracer.enabled:
+            tracer.trace(
+                "evaluate",
+                states=self.area.states,
+                duration=time.perf_counter() - start,
+                detail=(new_states, lost_states, coalesced),
+            )
+
     def _report_state_change(self, states_tuple=([], [])):
         """Fire an event reporting area state change."""
-        new_states, lost_states = states_tuple
-        _LOGGER.debug(
-            "%s: Reporting state change (new states: %s/lost states: %s)",
-            self.area.name,
-            str(new_states),
-            str(lost_states),
-        )
-        dispatcher_send(
-            self.hass, MagicAreasEvents.AREA_STATE_CHANGED, self.area.id, states_tuple
+        if _DEBUG.enabled:
+            new_states, lost_states = states_tuple
+            _LOGGER.debug(
+                "%s: Reporting state change (new states: %s/lost states: %s)",
+                self.area.name,
+                new_states,
+                lost_states,
+            )
+        async_dispatcher_send(
+            self.hass,
+            area_signal(MagicAreasEvents.AREA_STATE_CHANGED, self.area.id),
+            self.area.id,
+            states_tuple,
         )
 
     # Area state calculations
 
-    def _update_area_states(self) -> tuple[set[str], set[str]]:
+    def _update_area_states(self) -> tuple[list[AreaStates], list[AreaStates]]:
         """Return new and lost states for this area."""
 
-        last_state: set[str] = set(self.area.states.copy())
-        current_state: set[str] = set(self._get_area_states())
+        last_mask = self.area.state_mask
+        current_mask = states_mask(self._get_area_states())
 
-        if last_state == current_state:
-            return (set(), set())
+        changed = last_mask ^ current_mask
+        if not changed:
+            return ([], [])
 
         # Calculate what's new
-        new_states: set[str] = current_state - last_state
-        lost_states: set[str] = last_state - current_state
-        _LOGGER.debug(
-            "%s: Current state: %s, last state: %s -> new states %s / lost states %s",
-            self.area.name,
-            str(current_state),
-            str(last_state),
-            str(new_states),
-            str(lost_states),
-        )
+        new_states = mask_states(changed & current_mask)
+        lost_states = mask_states(changed & last_mask)
+        if _DEBUG.enabled:
+            _LOGGER.debug(
+                "%s: Current state: %s, last state: %s -> new states %s / lost states %s",
+                self.area.name,
+                current_mask,
+                last_mask,
+                new_states,
+                lost_states,
+            )
 
-        self.area.states = list(current_state)
+        self.area.set_state_mask(current_mask)
 
         return (new_states, lost_states)
 
@@ -348,13 +448,9 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
             datetime.now(UTC) - self.area.last_changed
         ).total_seconds()
 
-        extended_time = self.area.config.get(CONF_SECONDARY_STATES, {}).get(
-            CONF_EXTENDED_TIME, DEFAULT_EXTENDED_TIME
-        )
-
         if (
             AreaStates.OCCUPIED in states
-            and (seconds_since_last_change / ONE_MINUTE) >= extended_time
+            and seconds_since_last_change >= self.area.settings.extended_time
         ):
             states.append(AreaStates.EXTENDED)
 
@@ -367,29 +463,18 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
 
         states: list[AreaStates] = []
 
-        configurable_states = self._get_configured_secondary_states()
+        configurable_states = self.area.settings.secondary_state_entities
 
         # Assume AreaStates.DARK if not configured
         if AreaStates.DARK not in configurable_states:
             states.append(AreaStates.DARK)
 
-        for configurable_state in configurable_states:
-            configurable_state_entity = CONFIGURABLE_AREA_STATE_MAP[configurable_state]
-
-            secondary_state_entity = self.area.config.get(
-                CONF_SECONDARY_STATES, {}
-            ).get(configurable_state_entity, None)
-
-            if not secondary_state_entity:
-                continue
-
+        for configurable_state, secondary_state_entity in configurable_states.items():
             entity = self.hass.states.get(secondary_state_entity)
             if not entity:
                 continue
 
-            has_valid_state = entity.state.lower() in self._valid_on_states(
-                [STATE_ABOVE_HORIZON]
-            )
+            has_valid_state = entity.state.lower() in self._valid_secondary_states
             state_to_add = None
 
             # Handle dark state from light sensor as an inverted configurable state
@@ -444,67 +529,18 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
         return True
 
     def _get_sensors_state(self) -> bool:
-        """Fetch state from tracked sensors."""
-
-        valid_states = self._valid_on_states()
-
-        _LOGGER.debug(
-            "%s: Updating state. (Valid states: %s)",
-            self.area.name,
-            ",".join(valid_states),
-        )
+        """Return whether any tracked sensor is active."""
 
-        active_sensors = []
-        available_sensors = self._sensors.copy()
-
-        # Filter out keep-only sensors if the area isn't occupied
-        if not self.area.is_occupied():
-            keep_only_entities = self.area.config.get(CONF_KEEP_ONLY_ENTITIES, [])
-            available_sensors = [
-                sensor for sensor in self._sensors if sensor not in keep_only_entities
-            ]
-
-        # Loop over all entities and check their state
-        for sensor in available_sensors:
-            try:
-                entity = self.hass.states.get(sensor)
-
-                if not entity:
-                    _LOGGER.debug(
-                        "%s: Could not get sensor state: '%s' entity not found, skipping",
-                        self.area.name,
-                        sensor,
-                    )
-                    continue
-
-                _LOGGER.debug(
-                    "%s: Sensor '%s' state: %s", self.area.name, sensor, entity.state
-                )
-
-                # Skip unavailable entities
-                if entity.state in INVALID_STATES:
-                    _LOGGER.debug(
-                        "%s: Sensor '%s' is unavailable, skipping...",
-                        self.area.name,
-                        sensor,
-                    )
-                    continue
+        active_sensors = list(self._active_presence_sensors)
 
-                if entity.state in valid_states:
-                    _LOGGER.debug(
-                        "%s: Valid presence sensor found: %s.", self.area.name, sensor
-                    )
-                    active_sensors.append(sensor)
+        # Keep-only sensors only count while the area is occupied
+        if self.area.is_occupied():
+            active_sensors.extend(self._active_keep_only_sensors)
 
-            # Adding pylint exception because this is a last-resort hail-mary catch-all
-            # pylint: disable-next=broad-exception-caught
-            except Exception as e:
-                _LOGGER.error(
-                    "%s: Error getting entity state for '%s': %s",
-                    self.area.name,
-                    sensor,
-                    str(e),
-                )
+        if _DEBUG.enabled:
+            _LOGGER.debug(
+                "%s: Active presence sensors: %s", self.area.name, active_sensors
+            )
 
         # Populate metadata
         if self._active_sensors:
@@ -521,37 +557,25 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
         if not self.area.is_occupied():
             return False
 
-        timeout = self._get_clear_timeout()
-
-        _LOGGER.debug("%s: Scheduling clear in %s seconds", self.area.name, timeout)
-        self._clear_timeout_callback = async_call_later(
-            self.hass, timeout, self._update_state
+        _LOGGER.debug(
+            "%s: Clearing in %s seconds",
+            self.area.name,
+            self._get_clear_timeout(),
         )
+        self._clear_timeout_start = datetime.now(UTC)
 
     def _get_clear_timeout(self) -> int:
         """Return configured clear timeout value."""
         if self.area.has_state(AreaStates.SLEEP):
-            return (
-                self.area.config.get(CONF_SECONDARY_STATES, {}).get(
-                    CONF_SLEEP_TIMEOUT, DEFAULT_SLEEP_TIMEOUT
-                )
-                * ONE_MINUTE
-            )
+            return self.area.settings.sleep_timeout
 
         if self.area.has_state(AreaStates.EXTENDED):
-            return (
-                self.area.config.get(CONF_SECONDARY_STATES, {}).get(
-                    CONF_EXTENDED_TIMEOUT, DEFAULT_EXTENDED_TIMEOUT
-                )
-                * ONE_MINUTE
-            )
+            return self.area.settings.extended_timeout
 
-        return (
-            self.area.config.get(CONF_CLEAR_TIMEOUT, DEFAULT_CLEAR_TIMEOUT) * ONE_MINUTE
-        )
+        return self.area.settings.clear_timeout
 
     def _remove_clear_timeout(self) -> None:
-        if not self._clear_timeout_callback:
+        if self._clear_timeout_start is None:
             return
 
         _LOGGER.debug(
@@ -559,31 +583,81 @@ class AreaStateTrackerEntity(BinaryMagicEntity):
             self.area.name,
         )
 
-        # pylint: disable-next=not-callable
-        self._clear_timeout_callback()
-        self._clear_timeout_callback = None
+        self._clear_timeout_start = None
 
     def _is_on_clear_timeout(self) -> bool:
-        return self._clear_timeout_callback is not None
+        return self._clear_timeout_start is not None
+
+    def _get_clear_time(self) -> datetime | None:
+        """Return when the running clear timeout expires."""
+        if self._clear_timeout_start is None:
+            return None
+        return self._clear_timeout_start + timedelta(seconds=self._get_clear_timeout())
 
     def _timeout_exceeded(self) -> bool:
         """Check if clear timeout is exceeded."""
         if not self.area.is_occupied():
             return False
 
-        clear_delta = timedelta(seconds=self._get_clear_timeout())
-
-        last_clear = self._last_off_time
-        clear_time = last_clear + clear_delta
-        time_now = datetime.now(UTC)
+        clear_time = self._get_clear_time()
+        if clear_time is None:
+            return False
 
-        if time_now >= clear_time:
+        if datetime.now(UTC) >= clear_time:
             _LOGGER.debug("%s: Clear Timeout exceeded.", self.area.name)
             self._remove_clear_timeout()
             return True
 
         return False
 
+    # Scheduled evaluation
+
+    def _get_next_evaluation(self) -> datetime | None:
+        """Return the next instant the area state can change on its own."""
+
+        if not self.area.is_occupied():
+            return None
+
+        deadlines: list[datetime] = []
+
+        if (clear_time := self._get_clear_time()) is not None:
+            deadlines.append(clear_time)
+
+        if not self.area.has_state(AreaStates.EXTENDED):
+            deadlines.append(
+                self.area.last_changed
+                + timedelta(seconds=self.area.settings.extended_time)
+            )
+
+        return min(deadlines, default=None)
+
+    def _schedule_next_evaluation(self) -> None:
+        """Schedule a single re-evaluation for when the state is due to change."""
+
+        self._cancel_scheduled_evaluation()
+
+        next_evaluation = self._get_next_evaluation()
+
+        if not next_evaluation:
+            return
+
+        delay = max((next_evaluation - datetime.now(UTC)).total_seconds(), 0)
+
+        _LOGGER.debug(
+            "%s: Scheduling next evaluation in %s seconds", self.area.name, delay
+        )
+        self._evaluation_callback = async_schedule_timer(
+            self.hass, delay, self._update_state
+        )
+
+    def _cancel_scheduled_evaluation(self) -> None:
+        if not self._evaluation_callback:
+            return
+
+        # pylint: disable-next=not-callable
+        self._evaluation_callback()
+        self._evaluation_callback = None
+
 
 class AreaStateBinarySensor(AreaStateTrackerEntity, BinarySensorEntity):
     """Create an area presence sensor entity that tracks the current occupied state."""
@@ -615,14 +689,18 @@ class AreaStateBinarySensor(AreaStateTrackerEntity, BinarySensorEntity):
         # Setup the listeners
         await self._setup_listeners()
 
-        self.hass.loop.call_soon_threadsafe(self._update_state, datetime.now(UTC))
+        self._schedule_update()
 
         _LOGGER.debug("%s: area presence binary sensor initialized", self.area.name)
 
     async def _setup_listeners(self) -> None:
         # Setup state change listener
-        async_dispatcher_connect(
-            self.hass, MagicAreasEvents.AREA_STATE_CHANGED, self._area_state_changed
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                area_signal(MagicAreasEvents.AREA_STATE_CHANGED, self.area.id),
+                self._area_state_changed,
+            )
         )
 
         self._setup_tracking_listeners()
@@ -637,12 +715,13 @@ class AreaStateBinarySensor(AreaStateTrackerEntity, BinarySensorEntity):
                 ATTR_ACTIVE_SENSORS: [],
                 ATTR_LAST_ACTIVE_SENSORS: [],
                 ATTR_PRESENCE_SENSORS: [],
-                ATTR_TYPE: self.area.config.get(CONF_TYPE),
+                ATTR_TYPE: self.area.area_type,
                 ATTR_CLEAR_TIMEOUT: 0,
             }
         )
 
     # Area change handlers
+    @callback
     def _area_state_changed(
         self, area_id: str, states_tuple: tuple[list[str], list[str]]
     ) -> None:
@@ -651,22 +730,13 @@ class AreaStateBinarySensor(AreaStateTrackerEntity, BinarySensorEntity):
         # pylint: disable-next=unused-variable
         new_states, old_states = states_tuple
 
-        if area_id != self.area.id:
-            _LOGGER.debug(
-                "%s: Area state change event not for us. Skipping. (req: %s}/self: %s)",
-                self.area.name,
-                area_id,
-                self.area.id,
-            )
-            return
-
         _LOGGER.debug(
             "%s: Binary presence sensor detected area state change.", self.area.name
         )
 
         self._attr_is_on = self.area.is_occupied()
         self._attr_extra_state_attributes.update(self.get_metadata())
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
 
 class MetaAreaStateBinarySensor(AreaStateBinarySensor):
@@ -680,6 +750,17 @@ class MetaAreaStateBinarySensor(AreaStateBinarySensor):
 
         AreaStateBinarySensor.__init__(self, area)
 
+        # Running count of child areas per state, kept from child state deltas
+        self._child_states: dict[str, set[str]] = {}
+        self._child_state_counts: Counter[str] = Counter()
+        self._child_listeners: list[Callable[[], None]] = []
+
+    async def _setup_listeners(self) -> None:
+        await super()._setup_listeners()
+
+        self._track_child_areas()
+        self.async_on_remove(self._untrack_child_areas)
+
     async def _load_attributes(self) -> None:
         await super()._load_attributes()
         self._attr_extra_state_attributes.update(
@@ -688,43 +769,90 @@ class MetaAreaStateBinarySensor(AreaStateBinarySensor):
             }
         )
 
-    def _get_secondary_states(self) -> list[AreaStates]:
-        """Return secondary states for an area through calculation."""
+    @callback
+    def async_update_sensors(self) -> None:
+        """Reload child areas and presence sensors in place."""
 
-        states: list[AreaStates] = []
-        mode: CalculationMode = CalculationMode(
-            self.area.config.get(CONF_SECONDARY_STATES, {}).get(
-                CONF_SECONDARY_STATES_CALCULATION_MODE,
-                DEFAULT_SECONDARY_STATES_CALCULATION_MODE,
-            )
-        )
+        self._attr_extra_state_attributes[ATTR_AREAS] = self.area.child_areas
+
+        if self.hass is not None:
+            self._track_child_areas()
+
+        super().async_update_sensors()
+
+    # Child area tracking
 
-        child_areas: list[str] = self.area.get_child_areas()
-        states_list: list[AreaStates] = []
+    @callback
+    def _track_child_areas(self) -> None:
+        """Seed child state counts and follow child area state changes."""
+
+        self._untrack_child_areas()
 
-        for area_slug in child_areas:
-            area_entity_id: str = (
-                f"{BINARY_SENSOR_DOMAIN}.magic_areas_presence_tracking_{area_slug}_area_state"
+        self._child_states = {
+            area.id: set(area.states) for area in self.area.get_child_magic_areas()
+        }
+        self._child_state_counts = Counter(
+            state for states in self._child_states.values() for state in states
+        )
+
+        self._child_listeners = [
+            async_dispatcher_connect(
+                self.hass,
+                area_signal(MagicAreasEvents.AREA_STATE_CHANGED, area_id),
+                self._child_area_state_changed,
             )
-            area_state = self.hass.states.get(area_entity_id)
+            for area_id in self._child_states
+        ]
 
-            if not area_state:
-                continue
-            if ATTR_STATES not in area_state.attributes:
-                continue
+    @callback
+    def _untrack_child_areas(self) -> None:
+        """Remove child area listeners."""
+        while self._child_listeners:
+            self._child_listeners.pop()()
+
+    @callback
+    def _child_area_state_changed(
+        self, area_id: str, states_tuple: tuple[list[str], list[str]]
+    ) -> None:
+        """Apply a child area's new and lost states to the running counts."""
+
+        child_states = self._child_states.get(area_id)
+        if child_states is None:
+            return
+
+        new_states, lost_states = states_tuple
+
+        # Occupancy changes report the child's full state set instead
+        if AreaStates.OCCUPIED in new_states or AreaStates.CLEAR in new_states:
+            lost_states = list(child_states.difference(new_states))
 
-            states_list.extend(area_state.attributes[ATTR_STATES])
+        for state in new_states:
+            if state not in child_states:
+                child_states.add(state)
+                self._child_state_counts[state] += 1
 
-        state_counter = Counter(states_list)
-        child_area_count: int = len(child_areas)
+        for state in lost_states:
+            if state in child_states:
+                child_states.discard(state)
+                self._child_state_counts[state] -= 1
+
+        self._schedule_update()
+
+    def _get_secondary_states(self) -> list[AreaStates]:
+        """Return secondary states for an area through calculation."""
+
+        states: list[AreaStates] = []
+        mode: CalculationMode = self.area.settings.calculation_mode
+
+        child_area_count: int = len(self._child_states)
 
         for secondary_state in CONFIGURABLE_AREA_STATE_MAP:
-            if secondary_state not in state_counter:
-                continue
+            amt_states = self._child_state_counts[secondary_state]
 
-            amt_states = state_counter[AreaStates(secondary_state)]
+            if not amt_states:
+                continue
 
-            if mode == CalculationMode.ANY and amt_states > 0:
+            if mode == CalculationMode.ANY:
                 states.append(AreaStates(secondary_state))
                 continue
 
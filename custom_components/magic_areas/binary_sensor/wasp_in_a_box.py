@@ -1,5 +1,6 @@
 """Wasp in a box binary sensor component."""
 
+from datetime import datetime
 import logging
 
 from homeassistant.components.binary_sensor import (
@@ -8,7 +9,13 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.const import STATE_OFF, STATE_ON
-from homeassistant.core import Event, EventStateChangedData, State, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    State,
+    callback,
+)
 from homeassistant.helpers.event import async_track_state_change_event
 
 from custom_components.magic_areas.base.entities import MagicEntity
@@ -25,7 +32,10 @@ from custom_components.magic_areas.const import (
     MagicAreasFeatureInfoWaspInABox,
     MagicAreasFeatures,
 )
-from custom_components.magic_areas.helpers.timer import ReusableTimer
+from custom_components.magic_areas.helpers.timer import (
+    ReusableTimer,
+    async_schedule_timer,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,6 +71,7 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
 
         self.wasp: bool = False
         self._wasp_timer: ReusableTimer | None = None
+        self._delayed_check: CALLBACK_TYPE | None = None
         self._attr_is_on: bool = False
 
         self._wasp_sensors: list[str] = []
@@ -100,7 +111,7 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
                 self.wasp = False
                 self._attr_extra_state_attributes[ATTR_WASP] = STATE_OFF
                 self._attr_is_on = self.wasp
-                self.schedule_update_ha_state()
+                self.async_write_ha_state()
 
             self._wasp_timer = ReusableTimer(
                 self.hass, self._wasp_timeout * ONE_MINUTE, forget_wasp
@@ -122,6 +133,7 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Call to remove the entity to hass."""
+        self._cancel_delayed_check()
         if self._wasp_timer:
             await self._wasp_timer.async_remove()
         await super().async_will_remove_from_hass()
@@ -141,6 +153,7 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
         if new_state.state == old_state.state:
             return
 
+        self._cancel_delayed_check()
         self.wasp_in_a_box(wasp_state=new_state.state)
 
     @callback
@@ -158,20 +171,38 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
         if new_state.state == old_state.state:
             return
 
+        # A newer box event replaces a pending delayed check
+        self._cancel_delayed_check()
+
         if self._delay:
             self.wasp = False
             self._attr_is_on = self.wasp
             self._attr_extra_state_attributes[ATTR_BOX] = new_state.state
             self._attr_extra_state_attributes[ATTR_WASP] = STATE_OFF
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
             if self._wasp_timer:
                 self._wasp_timer.cancel()
-            self.hass.loop.call_later(
-                self._delay, self.wasp_in_a_box, None, new_state.state
+
+            box_state = new_state.state
+
+            @callback
+            def _delayed_wasp_in_a_box(now: datetime) -> None:
+                self._delayed_check = None
+                self.wasp_in_a_box(box_state=box_state)
+
+            self._delayed_check = async_schedule_timer(
+                self.hass, self._delay, _delayed_wasp_in_a_box
             )
         else:
             self.wasp_in_a_box(box_state=new_state.state)
 
+    @callback
+    def _cancel_delayed_check(self) -> None:
+        """Cancel the pending delayed check, if any."""
+        if self._delayed_check:
+            self._delayed_check()
+            self._delayed_check = None
+
     def wasp_in_a_box(
         self,
         wasp_state: str | None = None,
@@ -219,4 +250,4 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
         self._attr_extra_state_attributes[ATTR_WASP] = wasp_state
 
         self._attr_is_on = self.wasp
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
@@ -60,7 +60,10 @@ from .const import (
     CONF_AGGREGATES_BINARY_SENSOR_DEVICE_CLASSES,
     CONF_AGGREGATES_ILLUMINANCE_THRESHOLD,
     CONF_AGGREGATES_ILLUMINANCE_THRESHOLD_HYSTERESIS,
+    CONF_AGGREGATES_MAX_STALENESS,
     CONF_AGGREGATES_MIN_ENTITIES,
+    CONF_AGGREGATES_MIN_PUBLISH_INTERVAL,
+    CONF_AGGREGATES_PUBLISH_DELTA,
     CONF_AGGREGATES_SENSOR_DEVICE_CLASSES,
     CONF_BLE_TRACKER_ENTITIES,
     CONF_CLEAR_TIMEOUT,
@@ -103,6 +106,7 @@ from .const import (
     CONF_PRESENCE_HOLD_TIMEOUT,
     CONF_PRESENCE_SENSOR_DEVICE_CLASS,
     CONF_RELOAD_ON_REGISTRY_CHANGE,
+    CONF_RELOAD_QUIET_WINDOW,
     CONF_SECONDARY_STATES,
     CONF_SECONDARY_STATES_CALCULATION_MODE,
     CONF_SLEEP_ENTITY,
@@ -512,9 +516,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow, ConfigBase):
         for domain in CONFIG_FLOW_ENTITY_FILTER_EXT:
             filtered_area_entities.extend(
                 [
-                    entity["entity_id"]
+                    entity.entity_id
                     for entity in self.area.entities.get(domain, [])
-                    if entity["entity_id"] in self.all_entities
+                    if entity.entity_id in self.all_entities
                 ]
             )
 
@@ -536,16 +540,16 @@ class OptionsFlowHandler(config_entries.OptionsFlow, ConfigBase):
 
         self.all_lights = sorted(
             self.resolve_groups(
-                entity["entity_id"]
+                entity.entity_id
                 for entity in self.area.entities.get(LIGHT_DOMAIN, [])
-                if entity["entity_id"] in self.all_entities
+                if entity.entity_id in self.all_entities
             )
         )
         self.all_media_players = sorted(
             self.resolve_groups(
-                entity["entity_id"]
+                entity.entity_id
                 for entity in self.area.entities.get(MEDIA_PLAYER_DOMAIN, [])
-                if entity["entity_id"] in self.all_entities
+                if entity.entity_id in self.all_entities
             )
         )
 
@@ -672,6 +676,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow, ConfigBase):
                 self.all_area_entities, multiple=True
             ),
             CONF_RELOAD_ON_REGISTRY_CHANGE: self._build_selector_boolean(),
+            CONF_RELOAD_QUIET_WINDOW: self._build_selector_number(max_value=300),
             CONF_IGNORE_DIAGNOSTIC_ENTITIES: self._build_selector_boolean(),
         }
 
@@ -1216,6 +1221,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow, ConfigBase):
                 min_value=0,
                 max_value=100,
             ),
+            CONF_AGGREGATES_MIN_PUBLISH_INTERVAL: self._build_selector_number(),
+            CONF_AGGREGATES_PUBLISH_DELTA: self._build_selector_number(
+                unit_of_measurement="%",
+                mode=NumberSelectorMode.SLIDER,
+                min_value=0,
+                max_value=100,
+            ),
+            CONF_AGGREGATES_MAX_STALENESS: self._build_selector_number(),
         }
 
         return await self.do_feature_config(
@@ -44,15 +44,12 @@ MODULE_DATA = f"{DOMAIN}_data"
 
 ADDITIONAL_LIGHT_TRACKING_ENTITIES = ["sun.sun"]
 DEFAULT_SENSOR_PRECISION = 2
-UPDATE_INTERVAL = ONE_MINUTE
 
 
 class MetaAreaAutoReloadSettings(IntEnum):
     """Settings for Meta-Area Auto Reload functionality."""
 
-    DELAY = 3
-    DELAY_MULTIPLIER = 4
-    THROTTLE = 5
+    QUIET_WINDOW = 2
 
 
 # Light group options
@@ -337,7 +334,11 @@ class MagicAreasFeatures(StrEnum):
 
 # Magic Areas Events
 class MagicAreasEvents(StrEnum):
-    """Magic Areas events."""
+    """Magic Areas events.
+
+    AREA_STATE_CHANGED is only sent on per-area signals (see
+    `util.area_signal`), listeners subscribe to the areas they follow.
+    """
 
     AREA_STATE_CHANGED = "magicareas_area_state_changed"
     AREA_LOADED = "magicareas_area_loaded"
@@ -363,6 +364,17 @@ ALL_SENSOR_DEVICE_CLASSES = [cls.value for cls in SensorDeviceClass]
 # Data Items
 DATA_AREA_OBJECT = "area_object"
 DATA_TRACKED_LISTENERS = "tracked_listeners"
+DATA_REGISTRY_INDEX = f"{DOMAIN}_registry_index"
+DATA_RELOAD_COORDINATOR = f"{DOMAIN}_reload_coordinator"
+DATA_AREA_CACHE = f"{DOMAIN}_area_cache"
+DATA_SERVICE_BATCHER = f"{DOMAIN}_service_batcher"
+DATA_TIMER_WHEEL = f"{DOMAIN}_timer_wheel"
+DATA_LOG_GUARDS = f"{DOMAIN}_log_guards"
+
+# Area cache storage
+AREA_CACHE_STORAGE_KEY = f"{DOMAIN}.area_cache"
+AREA_CACHE_STORAGE_VERSION = 1
+AREA_CACHE_SAVE_DELAY = 10
 
 # Attributes
 ATTR_STATES = "states"
@@ -374,6 +386,8 @@ ATTR_ACTIVE_SENSORS = "active_sensors"
 ATTR_LAST_ACTIVE_SENSORS = "last_active_sensors"
 ATTR_FEATURES = "features"
 ATTR_PRESENCE_SENSORS = "presence_sensors"
+ATTR_ON_COUNT = "on_count"
+ATTR_TOTAL = "total"
 
 PRESENCE_SENSOR_VALID_ON_STATES = [STATE_ON, STATE_OPEN, STATE_PLAYING]
 
@@ -588,6 +602,18 @@ CONF_AGGREGATES_ILLUMINANCE_THRESHOLD, DEFAULT_AGGREGATES_ILLUMINANCE_THRESHOLD
     "aggregates_illuminance_threshold_hysteresis",
     0,  # 0 = disabled
 )  # cv.positive_int
+CONF_AGGREGATES_MIN_PUBLISH_INTERVAL, DEFAULT_AGGREGATES_MIN_PUBLISH_INTERVAL = (
+    "aggregates_min_publish_interval",
+    0,  # 0 = disabled
+)  # cv.positive_int
+CONF_AGGREGATES_PUBLISH_DELTA, DEFAULT_AGGREGATES_PUBLISH_DELTA = (
+    "aggregates_publish_delta",
+    0,  # 0 = disabled
+)  # cv.positive_int
+CONF_AGGREGATES_MAX_STALENESS, DEFAULT_AGGREGATES_MAX_STALENESS = (
+    "aggregates_max_staleness",
+    0,  # 0 = disabled
+)  # cv.positive_int
 
 CONF_HEALTH_SENSOR_DEVICE_CLASSES, DEFAULT_HEALTH_SENSOR_DEVICE_CLASSES = (
     "health_binary_sensor_device_classes",
@@ -599,6 +625,11 @@ CONF_RELOAD_ON_REGISTRY_CHANGE, DEFAULT_RELOAD_ON_REGISTRY_CHANGE = (
     True,
 )
 
+CONF_RELOAD_QUIET_WINDOW, DEFAULT_RELOAD_QUIET_WINDOW = (
+    "reload_quiet_window",
+    MetaAreaAutoReloadSettings.QUIET_WINDOW,
+)  # cv.positive_int, seconds
+
 CONF_IGNORE_DIAGNOSTIC_ENTITIES, DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES = (
     "ignore_diagnostic_entities",
     True,
@@ -764,6 +795,18 @@ AGGREGATE_FEATURE_SCHEMA = vol.Schema(
             CONF_AGGREGATES_ILLUMINANCE_THRESHOLD_HYSTERESIS,
             default=DEFAULT_AGGREGATES_ILLUMINANCE_THRESHOLD_HYSTERESIS,
         ): cv.positive_int,
+        vol.Optional(
+            CONF_AGGREGATES_MIN_PUBLISH_INTERVAL,
+            default=DEFAULT_AGGREGATES_MIN_PUBLISH_INTERVAL,
+        ): cv.positive_int,
+        vol.Optional(
+            CONF_AGGREGATES_PUBLISH_DELTA,
+            default=DEFAULT_AGGREGATES_PUBLISH_DELTA,
+        ): cv.positive_int,
+        vol.Optional(
+            CONF_AGGREGATES_MAX_STALENESS,
+            default=DEFAULT_AGGREGATES_MAX_STALENESS,
+        ): cv.positive_int,
     },
     extra=vol.REMOVE_EXTRA,
 )
@@ -1000,6 +1043,9 @@ REGULAR_AREA_BASIC_OPTIONS_SCHEMA = vol.Schema(
         vol.Optional(
             CONF_RELOAD_ON_REGISTRY_CHANGE, default=DEFAULT_RELOAD_ON_REGISTRY_CHANGE
         ): cv.boolean,
+        vol.Optional(
+            CONF_RELOAD_QUIET_WINDOW, default=DEFAULT_RELOAD_QUIET_WINDOW
+        ): cv.positive_int,
         vol.Optional(
             CONF_IGNORE_DIAGNOSTIC_ENTITIES, default=DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES
         ): cv.boolean,
@@ -1057,6 +1103,9 @@ REGULAR_AREA_SCHEMA = vol.Schema(
         vol.Optional(
             CONF_RELOAD_ON_REGISTRY_CHANGE, default=DEFAULT_RELOAD_ON_REGISTRY_CHANGE
         ): cv.boolean,
+        vol.Optional(
+            CONF_RELOAD_QUIET_WINDOW, default=DEFAULT_RELOAD_QUIET_WINDOW
+        ): cv.positive_int,
         vol.Optional(
             CONF_IGNORE_DIAGNOSTIC_ENTITIES, default=DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES
         ): cv.boolean,
@@ -1110,6 +1159,7 @@ OPTIONS_AREA = [
     (CONF_INCLUDE_ENTITIES, [], cv.entity_ids),
     (CONF_EXCLUDE_ENTITIES, [], cv.entity_ids),
     (CONF_RELOAD_ON_REGISTRY_CHANGE, DEFAULT_RELOAD_ON_REGISTRY_CHANGE, cv.boolean),
+    (CONF_RELOAD_QUIET_WINDOW, DEFAULT_RELOAD_QUIET_WINDOW, cv.positive_int),
     (CONF_IGNORE_DIAGNOSTIC_ENTITIES, DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES, cv.boolean),
 ]
 OPTIONS_PRESENCE_TRACKING = [
@@ -1192,6 +1242,13 @@ OPTIONS_AGGREGATES = [
         DEFAULT_AGGREGATES_ILLUMINANCE_THRESHOLD_HYSTERESIS,
         int,
     ),
+    (
+        CONF_AGGREGATES_MIN_PUBLISH_INTERVAL,
+        DEFAULT_AGGREGATES_MIN_PUBLISH_INTERVAL,
+        int,
+    ),
+    (CONF_AGGREGATES_PUBLISH_DELTA, DEFAULT_AGGREGATES_PUBLISH_DELTA, int),
+    (CONF_AGGREGATES_MAX_STALENESS, DEFAULT_AGGREGATES_MAX_STALENESS, int),
 ]
 
 OPTIONS_HEALTH_SENSOR = [
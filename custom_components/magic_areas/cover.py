@@ -9,11 +9,14 @@ from homeassistant.components.cover import (
 from homeassistant.components.cover.const import DOMAIN as COVER_DOMAIN
 from homeassistant.components.group.cover import CoverGroup
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from custom_components.magic_areas.base.entities import MagicEntity
-from custom_components.magic_areas.base.magic import MagicArea
+from custom_components.magic_areas.base.entities import (
+    MagicGroupEntity,
+    async_update_group_members,
+)
+from custom_components.magic_areas.base.magic import MagicArea, MagicMetaArea
 from custom_components.magic_areas.const import (
     CONF_FEATURE_COVER_GROUPS,
     EMPTY_STRING,
@@ -40,62 +43,89 @@ async def async_setup_entry(
     if not area.has_feature(CONF_FEATURE_COVER_GROUPS):
         return
 
+    entities_to_add = create_cover_groups(area)
+
+    if entities_to_add:
+        async_add_entities(entities_to_add)
+
+    # Follow child area changes in place
+    if isinstance(area, MagicMetaArea):
+
+        @callback
+        def _async_update_membership() -> bool:
+            return async_update_group_members(
+                entities_to_add, get_cover_group_members(area)
+            )
+
+        config_entry.async_on_unload(
+            area.async_register_membership_updater(_async_update_membership)
+        )
+
+    if COVER_DOMAIN in area.magic_entities:
+        cleanup_removed_entries(
+            area.hass, entities_to_add, area.magic_entities[COVER_DOMAIN]
+        )
+
+
+def create_cover_groups(area: MagicArea) -> list["AreaCoverGroup"]:
+    """Create the cover groups for the area."""
+
     # Check if there are any covers
     if not area.has_entities(COVER_DOMAIN):
         _LOGGER.debug("No %s entities for area %s", COVER_DOMAIN, area.name)
-        return
+        return []
 
     entities_to_add = []
 
+    for device_class, covers in get_cover_group_members(area).items():
+        _LOGGER.debug(
+            "Creating %s cover group for %s with covers: %s",
+            device_class,
+            area.name,
+            covers,
+        )
+        entities_to_add.append(AreaCoverGroup(area, device_class))
+
+    return entities_to_add
+
+
+def get_cover_group_members(area: MagicArea) -> dict[str | None, list[str]]:
+    """Return the members of the area's cover groups by device class."""
+
+    members: dict[str | None, list[str]] = {}
+
     # Append None to the list of device classes to catch those covers that
     # don't have a device class assigned (and put them in their own group)
+    covers_by_device_class = area.get_entities_by_device_class(COVER_DOMAIN)
     for device_class in [*COVER_DEVICE_CLASSES, None]:
         covers_in_device_class = [
-            e["entity_id"]
-            for e in area.entities[COVER_DOMAIN]
-            if e.get("device_class") == device_class
+            e.entity_id for e in covers_by_device_class.get(device_class, [])
         ]
 
         if any(covers_in_device_class):
-            _LOGGER.debug(
-                "Creating %s cover group for %s with covers: %s",
-                device_class,
-                area.name,
-                covers_in_device_class,
-            )
-            entities_to_add.append(AreaCoverGroup(area, device_class))
+            members[device_class] = covers_in_device_class
 
-    if entities_to_add:
-        async_add_entities(entities_to_add)
-
-    if COVER_DOMAIN in area.magic_entities:
-        cleanup_removed_entries(
-            area.hass, entities_to_add, area.magic_entities[COVER_DOMAIN]
-        )
+    return members
 
 
-class AreaCoverGroup(MagicEntity, CoverGroup):
+class AreaCoverGroup(MagicGroupEntity, CoverGroup):
     """Cover group for handling all the covers in the area."""
 
     feature_info = MagicAreasFeatureInfoCoverGroups()
 
     def __init__(self, area: MagicArea, device_class: str) -> None:
         """Initialize the cover group."""
-        MagicEntity.__init__(
+        MagicGroupEntity.__init__(
             self, area, domain=COVER_DOMAIN, translation_key=device_class
         )
         sensor_device_class: CoverDeviceClass | None = (
             CoverDeviceClass(device_class) if device_class else None
         )
         self._attr_device_class = sensor_device_class
-        self._entities = [
-            e
-            for e in area.entities[COVER_DOMAIN]
-            if e.get("device_class") == device_class
-        ]
+        self._entities = area.get_entities(COVER_DOMAIN, [device_class])
         CoverGroup.__init__(
             self,
-            entities=[e["entity_id"] for e in self._entities],
+            entities=[e.entity_id for e in self._entities],
             name=EMPTY_STRING,
             unique_id=self._attr_unique_id,
         )
@@ -40,7 +40,7 @@ async def async_setup_entry(
         _LOGGER.debug("%s: No %s entities for area.", area.name, FAN_DOMAIN)
         return
 
-    fan_entities: list[str] = [e["entity_id"] for e in area.entities[FAN_DOMAIN]]
+    fan_entities: list[str] = [e.entity_id for e in area.entities[FAN_DOMAIN]]
 
     try:
         fan_groups: list[AreaFanGroup] = [AreaFanGroup(area, fan_entities)]
@@ -0,0 +1,225 @@
+"""Incremental aggregation for Magic Areas aggregate sensors."""
+
+import math
+
+from homeassistant.components.sensor.const import UNIT_CONVERTERS
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import State
+from homeassistant.exceptions import HomeAssistantError
+
+# Minimum number of updates between two full re-summations
+RESUM_MIN_UPDATES = 100
+
+
+class RunningAggregate:
+    """Running sum and count over the numeric values of group members.
+
+    Updates only apply the delta of the member that changed. The sum is
+    recomputed from the member values once every `len(members)` updates,
+    so rounding errors can't accumulate while updates stay O(1) amortized.
+    """
+
+    __slots__ = ("_sum", "_updates", "_values")
+
+    def __init__(self) -> None:
+        """Initialize an empty aggregate."""
+        self._values: dict[str, float] = {}
+        self._sum: float = 0.0
+        self._updates: int = 0
+
+    @property
+    def count(self) -> int:
+        """Return the number of members with a numeric value."""
+        return len(self._values)
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the member values."""
+        return self._sum
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the member values."""
+        if not self._values:
+            return None
+        return self._sum / len(self._values)
+
+    def update(self, member: str, value: float | None) -> None:
+        """Set the value of a member, None if it has no numeric value."""
+
+        old_value = self._values.pop(member, None)
+        if old_value is not None:
+            self._sum -= old_value
+
+        if value is not None:
+            self._values[member] = value
+            self._sum += value
+
+        self._updates += 1
+        if self._updates >= max(len(self._values), RESUM_MIN_UPDATES):
+            self._sum = math.fsum(self._values.values())
+            self._updates = 0
+
+    def clear(self) -> None:
+        """Forget all members."""
+        self._values.clear()
+        self._sum = 0.0
+        self._updates = 0
+
+
+def normalize_state_value(
+    state: State | None, device_class: str | None, unit: str | None
+) -> float | None:
+    """Return a member's numeric value in the given unit.
+
+    Return None for missing, unavailable or non-numeric states, and for
+    states in a unit that can't be converted.
+    """
+
+    if state is None:
+        return None
+
+    try:
+        value = float(state.state)
+    except ValueError:
+        return None
+
+    if not math.isfinite(value):
+        return None
+
+    state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    if state_unit is None or unit is None or state_unit == unit:
+        return value
+
+    if (converter := UNIT_CONVERTERS.get(device_class)) is None:
+        return None
+
+    try:
+        return converter.convert(value, state_unit, unit)
+    except HomeAssistantError:
+        return None
+
+
+class BinaryStateCounter:
+    """Counts of group member states, updated from each member change."""
+
+    __slots__ = ("_states", "on", "present", "unavailable", "unknown")
+
+    def __init__(self) -> None:
+        """Initialize empty counts."""
+        self._states: dict[str, str] = {}
+        # Members with a state
+        self.present: int = 0
+        self.on: int = 0
+        self.unavailable: int = 0
+        self.unknown: int = 0
+
+    @property
+    def invalid(self) -> int:
+        """Return the number of members that are unknown or unavailable."""
+        return self.unavailable + self.unknown
+
+    def update(self, member: str, state: str | None) -> None:
+        """Set the state of a member, None if it has no state."""
+
+        if (old_state := self._states.pop(member, None)) is not None:
+            self._count(old_state, -1)
+
+        if state is not None:
+            self._states[member] = state
+            self._count(state, 1)
+
+    def _count(self, state: str, delta: int) -> None:
+        self.present += delta
+        if state == STATE_ON:
+            self.on += delta
+        elif state == STATE_UNAVAILABLE:
+            self.unavailable += delta
+        elif state == STATE_UNKNOWN:
+            self.unknown += delta
+
+
+class PublishPolicy:
+    """Decide when an aggregate value is worth publishing.
+
+    A value is held back while the minimum interval since the last publish
+    hasn't passed, or when it's within the significant-change delta of the
+    last published value. Held back values are published at the latest once
+    the max staleness is reached. Becoming (un)available always publishes.
+    """
+
+    __slots__ = (
+        "delta_percent",
+        "last_published",
+        "last_value",
+        "max_staleness",
+        "min_interval",
+    )
+
+    def __init__(
+        self,
+        min_interval: float = 0,
+        delta_percent: float = 0,
+        max_staleness: float = 0,
+    ) -> None:
+        """Initialize the policy, zero disables a setting."""
+        self.min_interval = min_interval
+        self.delta_percent = delta_percent
+        self.max_staleness = max_staleness
+        self.last_value: float | None = None
+        self.last_published: float | None = None
+
+    def is_due(self, value: float | None, now: float) -> bool:
+        """Return whether a value should be published now."""
+
+        if self.last_published is None:
+            return True
+
+        # Becoming (un)available
+        if value is None or self.last_value is None:
+            return value != self.last_value
+
+        if value == self.last_value:
+            return False
+
+        elapsed = now - self.last_published
+        if elapsed < self.min_interval:
+            return False
+
+        if self.max_staleness and elapsed >= self.max_staleness:
+            return True
+
+        return self._is_significant(value)
+
+    def next_check(self, now: float) -> float | None:
+        """Return the delay until a held back value should be checked again."""
+
+        if self.last_published is None:
+            return None
+
+        deadlines = [
+            self.last_published + setting - now
+            for setting in (self.min_interval, self.max_staleness)
+            if setting
+        ]
+        pending = [delay for delay in deadlines if delay > 0]
+
+        return min(pending) if pending else None
+
+    def published(self, value: float | None, now: float) -> None:
+        """Record a published value."""
+        self.last_value = value
+        self.last_published = now
+
+    def _is_significant(self, value: float) -> bool:
+        assert self.last_value is not None
+        if not self.delta_percent:
+            return True
+        return abs(value - self.last_value) > (
+            abs(self.last_value) * self.delta_percent / 100
+        )
@@ -0,0 +1,147 @@
+"""Warm-start cache of area entities for Magic Areas.
+
+Areas store the records of their entities (including their own magic
+entities) keyed by a fingerprint of the registry entries they were built
+from. On the next start, entities without a state yet are classified from
+the cache instead of the registry alone, so platforms can be set up
+right away. The cache is reconciled when areas are reloaded once Home
+Assistant has started and every entity reported its state.
+"""
+
+import asyncio
+from collections.abc import Iterable
+import hashlib
+import logging
+from typing import TypedDict
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_registry import RegistryEntry
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+
+from custom_components.magic_areas.base.record import AreaEntityRecord
+from custom_components.magic_areas.const import (
+    AREA_CACHE_SAVE_DELAY,
+    AREA_CACHE_STORAGE_KEY,
+    AREA_CACHE_STORAGE_VERSION,
+    DATA_AREA_CACHE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CachedArea(TypedDict):
+    """Cached entities of an area."""
+
+    fingerprint: str
+    # [entity_id, device_class, unit, entity_category]
+    entities: list[list[str | None]]
+
+
+@callback
+@singleton(DATA_AREA_CACHE)
+def async_get_area_cache(hass: HomeAssistant) -> "AreaCache":
+    """Return the shared area cache."""
+    return AreaCache(hass)
+
+
+def registry_fingerprint(entries: Iterable[RegistryEntry]) -> str:
+    """Return a fingerprint of registry entries, changing with any update."""
+    digest = hashlib.sha1(usedforsecurity=False)
+    for entry in sorted(entries, key=lambda entry: entry.entity_id):
+        digest.update(f"{entry.entity_id}|{entry.modified_at.isoformat()}|".encode())
+    return digest.hexdigest()
+
+
+class AreaCache:
+    """Persist area entity records across restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._store: Store[dict[str, CachedArea]] = Store(
+            hass, AREA_CACHE_STORAGE_VERSION, AREA_CACHE_STORAGE_KEY
+        )
+        self._areas: dict[str, CachedArea] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load the cache from storage, once."""
+
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            data = await self._store.async_load()
+            if data:
+                self._areas = data
+            self._loaded = True
+
+        _LOGGER.debug("Loaded cached entities for %d area(s)", len(self._areas))
+
+    @callback
+    def async_get_records(
+        self, area_id: str, fingerprint: str
+    ) -> dict[str, AreaEntityRecord]:
+        """Return the cached records of an area if they are still valid."""
+
+        cached = self._areas.get(area_id)
+        if not cached or cached["fingerprint"] != fingerprint:
+            return {}
+
+        records: dict[str, AreaEntityRecord] = {}
+        for entity_id, device_class, unit, entity_category in cached["entities"]:
+            assert entity_id is not None
+            records[entity_id] = AreaEntityRecord(
+                self.hass,
+                entity_id,
+                entity_id.split(".")[0],
+                device_class,
+                unit,
+                entity_category,
+            )
+        return records
+
+    @callback
+    def async_update_area(
+        self, area_id: str, fingerprint: str, records: Iterable[AreaEntityRecord]
+    ) -> None:
+        """Update the cached records of an area, saving if anything changed.
+
+        Only records built from a live state are stored, entities without
+        a state keep their previously cached record if it's still valid.
+        """
+
+        previous = self._areas.get(area_id)
+        previous_entities = (
+            {entity[0]: entity for entity in previous["entities"]}
+            if previous and previous["fingerprint"] == fingerprint
+            else {}
+        )
+
+        entities: list[list[str | None]] = []
+        for record in records:
+            if record.state is not None:
+                entities.append(
+                    [
+                        record.entity_id,
+                        record.device_class,
+                        record.unit,
+                        record.entity_category,
+                    ]
+                )
+            elif record.entity_id in previous_entities:
+                entities.append(previous_entities[record.entity_id])
+
+        cached = CachedArea(fingerprint=fingerprint, entities=entities)
+        if previous == cached:
+            return
+
+        self._areas[area_id] = cached
+        self._store.async_delay_save(self._data_to_save, AREA_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, CachedArea]:
+        """Return data to store."""
+        return dict(self._areas)
@@ -0,0 +1,204 @@
+"""Registry event routing for Magic Areas.
+
+A single set of registry listeners is shared by every area. Events are
+mapped to the one or two areas they affect instead of running a filter
+per area.
+"""
+
+from collections.abc import Callable
+import logging
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
+from homeassistant.helpers.device_registry import (
+    EVENT_DEVICE_REGISTRY_UPDATED,
+    EventDeviceRegistryUpdatedData,
+    async_get as devicereg_async_get,
+)
+from homeassistant.helpers.entity_registry import (
+    EVENT_ENTITY_REGISTRY_UPDATED,
+    EventEntityRegistryUpdatedData,
+    async_get as entityreg_async_get,
+)
+from homeassistant.helpers.singleton import singleton
+
+from custom_components.magic_areas.base.magic import MagicArea
+from custom_components.magic_areas.const import (
+    DATA_REGISTRY_INDEX,
+    MAGIC_DEVICE_ID_PREFIX,
+    MAGICAREAS_UNIQUEID_PREFIX,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+@singleton(DATA_REGISTRY_INDEX)
+def async_get_registry_index(hass: HomeAssistant) -> "RegistryIndex":
+    """Return the shared registry index."""
+    return RegistryIndex(hass)
+
+
+class RegistryIndex:
+    """Index of area_id -> devices/entities used to route registry events."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+
+        self._areas: dict[str, tuple[MagicArea, HassJob[[MagicArea], None]]] = {}
+        self._entity_areas: dict[str, set[str]] = {}
+        self._device_areas: dict[str, set[str]] = {}
+
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_register_area(
+        self, area: MagicArea, on_change: Callable[[MagicArea], None]
+    ) -> CALLBACK_TYPE:
+        """Start routing registry changes for an area, return an unregister callback."""
+
+        self.async_unregister_area(area.id)
+
+        self._areas[area.id] = (area, HassJob(on_change))
+
+        for entity_id in area.entity_ids:
+            self._entity_areas.setdefault(entity_id, set()).add(area.id)
+        for device_id in area.device_ids:
+            self._device_areas.setdefault(device_id, set()).add(area.id)
+
+        if not self._listeners:
+            self._listeners = [
+                self.hass.bus.async_listen(
+                    EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+                ),
+                self.hass.bus.async_listen(
+                    EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+                ),
+            ]
+
+        @callback
+        def _unregister() -> None:
+            # Don't drop a newer registration for the same area
+            registration = self._areas.get(area.id)
+            if registration and registration[0] is area:
+                self.async_unregister_area(area.id)
+
+        return _unregister
+
+    @callback
+    def async_unregister_area(self, area_id: str) -> None:
+        """Stop routing registry changes for an area."""
+
+        registration = self._areas.pop(area_id, None)
+        if not registration:
+            return
+
+        area = registration[0]
+        self._discard(self._entity_areas, area.entity_ids, area_id)
+        self._discard(self._device_areas, area.device_ids, area_id)
+
+        if not self._areas:
+            for remove_listener in self._listeners:
+                remove_listener()
+            self._listeners = []
+
+    @staticmethod
+    def _discard(index: dict[str, set[str]], keys, area_id: str) -> None:
+        for key in keys:
+            area_ids = index.get(key)
+            if not area_ids:
+                continue
+            area_ids.discard(area_id)
+            if not area_ids:
+                del index[key]
+
+    # Event routing
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Route an entity registry event to the areas it affects."""
+
+        event_data = event.data
+        entity_id = event_data["entity_id"]
+
+        # Ignore our own stuff
+        _, entity_part = split_entity_id(entity_id)
+        if entity_part.startswith(MAGICAREAS_UNIQUEID_PREFIX):
+            return
+
+        area_ids: set[str] = set()
+        action = event_data["action"]
+
+        if action == "update":
+            changes = event_data.get("changes", {})
+            if "area_id" not in changes:
+                return
+            # Removed from an area
+            if changes["area_id"]:
+                area_ids.add(changes["area_id"])
+        elif action not in ("create", "remove"):
+            return
+
+        # Was loaded by an area
+        area_ids.update(self._entity_areas.get(entity_id, ()))
+
+        # Is from an area
+        entity_entry = entityreg_async_get(self.hass).async_get(entity_id)
+        if entity_entry and entity_entry.area_id:
+            area_ids.add(entity_entry.area_id)
+
+        self._async_notify(area_ids)
+
+    @callback
+    def _async_device_registry_updated(
+        self, event: Event[EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Route a device registry event to the areas it affects."""
+
+        event_data = event.data
+        device_id = event_data["device_id"]
+
+        # Ignore our own stuff
+        if device_id.startswith(MAGIC_DEVICE_ID_PREFIX):
+            return
+
+        area_ids: set[str] = set()
+
+        if event_data["action"] == "update":
+            changes = event_data.get("changes", {})
+            # Removed from an area
+            if changes.get("area_id"):
+                area_ids.add(changes["area_id"])
+
+        # Was from an area
+        area_ids.update(self._device_areas.get(device_id, ()))
+
+        # Is from an area
+        device_entry = devicereg_async_get(self.hass).async_get(device_id)
+        if device_entry and device_entry.area_id:
+            area_ids.add(device_entry.area_id)
+
+        self._async_notify(area_ids)
+
+    @callback
+    def _async_notify(self, area_ids: set[str]) -> None:
+        """Notify registered areas of a relevant registry change."""
+
+        # Bursts of changes are collapsed by the reload coordinator
+        for area_id in area_ids:
+            registration = self._areas.get(area_id)
+            if not registration:
+                continue
+
+            area, job = registration
+            _LOGGER.debug("%s: Relevant registry change detected", area.name)
+            self.hass.async_run_hass_job(job, area)
@@ -0,0 +1,343 @@
+"""Reload coordination for Magic Areas.
+
+Registry driven reloads are collected over a quiet window (the longest
+`reload_quiet_window` of the areas involved) and performed as a single
+batch, every affected area being reloaded once. Meta areas
+are updated from the areas' `AREA_LOADED` signals following the
+dependency order areas -> floors -> interior/exterior -> Global: a meta
+area is updated as soon as none of its children are loading and no meta
+area of a lower level is pending. Every area entry known when the
+coordinator starts is expected to load, so meta areas wait for all of
+their children on setup too. Updates happen in place, the meta area
+entry is only reloaded when entities have to be added or removed.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_ID
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.area_registry import async_get as areareg_async_get
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.singleton import singleton
+
+from custom_components.magic_areas.const import (
+    AREA_TYPE_META,
+    CONF_TYPE,
+    DATA_AREA_OBJECT,
+    DATA_RELOAD_COORDINATOR,
+    DOMAIN,
+    MODULE_DATA,
+    MagicAreasEvents,
+    MetaAreaAutoReloadSettings,
+    MetaAreaType,
+)
+
+if TYPE_CHECKING:
+    from custom_components.magic_areas.base.magic import MagicArea, MagicMetaArea
+
+_LOGGER = logging.getLogger(__name__)
+
+# Entry states of areas that are still expected to announce their load
+EXPECTED_ENTRY_STATES = (
+    ConfigEntryState.NOT_LOADED,
+    ConfigEntryState.SETUP_IN_PROGRESS,
+    ConfigEntryState.LOADED,
+)
+
+
+@callback
+@singleton(DATA_RELOAD_COORDINATOR)
+def async_get_reload_coordinator(hass: HomeAssistant) -> "ReloadCoordinator":
+    """Return the shared reload coordinator."""
+    return ReloadCoordinator(hass)
+
+
+def meta_area_level(meta_area: "MagicMetaArea") -> int:
+    """Return the reload order of a meta area (floors first, Global last)."""
+    if meta_area.floor_id:
+        return 0
+    if meta_area.id == MetaAreaType.GLOBAL:
+        return 2
+    return 1
+
+
+class ReloadCoordinator:
+    """Collect reload requests and perform them in dependency order."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        quiet_window: float = MetaAreaAutoReloadSettings.QUIET_WINDOW,
+    ) -> None:
+        """Initialize the coordinator, quiet_window is the default in seconds."""
+        self.hass = hass
+        self.quiet_window = quiet_window
+
+        # Area config entries waiting for the quiet window
+        self._dirty: set[str] = set()
+        # area_id -> (area_type, floor_id) of areas being (re)loaded
+        self._loading: dict[str, tuple[str | None, str | None]] = {}
+        # area_id -> entry_id of areas that haven't announced their first load
+        self._expected: dict[str, str] = {}
+        # Meta area config entries waiting on their dependencies
+        self._pending_metas: set[str] = set()
+        # entry_id -> level of meta areas being reloaded
+        self._reloading_metas: dict[str, int] = {}
+
+        self._lock = asyncio.Lock()
+        self._cancel_flush: CALLBACK_TYPE | None = None
+        self._flush_job = HassJob(self._async_flush, cancel_on_shutdown=True)
+
+        # Metrics
+        self.requested = 0
+        self.reloaded = 0
+        self.meta_updated = 0
+        self.meta_reloaded = 0
+        self.batches = 0
+
+        self._unsub_area_loaded = async_dispatcher_connect(
+            hass, MagicAreasEvents.AREA_LOADED, self._async_area_loaded
+        )
+
+        self._async_expect_area_entries()
+
+    @property
+    def collapsed(self) -> int:
+        """Return how many requests didn't need a reload of their own."""
+        return self.requested - self.reloaded
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Return reload metrics."""
+        return {
+            "requested": self.requested,
+            "reloaded": self.reloaded,
+            "meta_updated": self.meta_updated,
+            "meta_reloaded": self.meta_reloaded,
+            "collapsed": self.collapsed,
+            "batches": self.batches,
+        }
+
+    @callback
+    def async_request_reload(self, entry_id: str) -> None:
+        """Mark an area's config entry as dirty, (re)starting the quiet window."""
+
+        self.requested += 1
+        self._dirty.add(entry_id)
+
+        if self._cancel_flush:
+            self._cancel_flush()
+        self._cancel_flush = async_call_later(
+            self.hass, self._get_quiet_window(), self._flush_job
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening and drop pending reloads, once every area is unloaded."""
+
+        if self._cancel_flush:
+            self._cancel_flush()
+            self._cancel_flush = None
+        self._unsub_area_loaded()
+
+        self._dirty.clear()
+        self._pending_metas.clear()
+
+    @callback
+    def _async_expect_area_entries(self) -> None:
+        """Mark every regular area entry as loading until it announces itself."""
+
+        area_registry = areareg_async_get(self.hass)
+
+        for entry in self.hass.config_entries.async_entries(
+            DOMAIN, include_ignore=False, include_disabled=False
+        ):
+            area_type = entry.options.get(CONF_TYPE, entry.data.get(CONF_TYPE))
+            if area_type == AREA_TYPE_META:
+                continue
+
+            # Areas missing from the registry won't load
+            area_id = entry.data[ATTR_ID]
+            if (area := area_registry.async_get_area(area_id)) is None:
+                continue
+
+            self._loading[area_id] = (area_type, area.floor_id)
+            self._expected[area_id] = entry.entry_id
+
+    @callback
+    def _async_forget_failed_areas(self) -> None:
+        """Stop waiting for expected areas whose entry failed or went away."""
+
+        for area_id, entry_id in list(self._expected.items()):
+            entry = self.hass.config_entries.async_get_entry(entry_id)
+            if entry is not None and entry.state in EXPECTED_ENTRY_STATES:
+                continue
+
+            _LOGGER.debug("%s: Area won't load, not waiting for it", area_id)
+            del self._expected[area_id]
+            self._loading.pop(area_id, None)
+
+    def _get_quiet_window(self) -> float:
+        """Return the quiet window for the dirty areas."""
+        return max(
+            (
+                area.settings.reload_quiet_window
+                for area in self._get_areas(self._dirty)
+            ),
+            default=self.quiet_window,
+        )
+
+    async def _async_flush(self, *args: Any) -> None:
+        """Reload dirty areas, meta areas follow as they load."""
+
+        self._cancel_flush = None
+
+        # Don't interleave with a batch still in progress
+        async with self._lock:
+            entry_ids, self._dirty = self._dirty, set()
+
+            areas = self._get_areas(entry_ids)
+            if not areas:
+                return
+
+            self.batches += 1
+
+            for area in areas:
+                self._loading[area.id] = (area.area_type, area.floor_id)
+                self._mark_parents_pending(area.area_type, area.floor_id)
+
+            _LOGGER.debug(
+                "Reloading %d area(s) (%d requests so far, %d collapsed)",
+                len(areas),
+                self.requested,
+                self.collapsed,
+            )
+
+            results = await asyncio.gather(
+                *(
+                    self.hass.config_entries.async_reload(area.hass_config.entry_id)
+                    for area in areas
+                ),
+                return_exceptions=True,
+            )
+            self.reloaded += len(areas)
+
+            # Areas that failed to load won't announce themselves
+            for area, result in zip(areas, results, strict=True):
+                if result is not True:
+                    _LOGGER.warning("%s: Failed to reload area: %s", area.name, result)
+                    self._loading.pop(area.id, None)
+
+            self._async_reload_ready_metas()
+
+    @callback
+    def _async_area_loaded(
+        self, area_type: str | None, floor_id: str | None, area_id: str
+    ) -> None:
+        """Handle area loaded signals."""
+
+        if area_type == AREA_TYPE_META:
+            return
+
+        _LOGGER.debug("%s: Area loaded", area_id)
+
+        self._loading.pop(area_id, None)
+        self._expected.pop(area_id, None)
+        self._mark_parents_pending(area_type, floor_id)
+        self._async_reload_ready_metas()
+
+    def _mark_parents_pending(
+        self, area_type: str | None, floor_id: str | None
+    ) -> None:
+        """Mark meta areas depending on an area as pending."""
+        for meta_area in self._get_meta_areas():
+            if meta_area.is_parent_of(area_type, floor_id):
+                self._pending_metas.add(meta_area.hass_config.entry_id)
+
+    @callback
+    def _async_reload_ready_metas(self) -> None:
+        """Reload pending meta areas whose dependencies are loaded."""
+
+        if not self._pending_metas:
+            return
+
+        if self._expected:
+            self._async_forget_failed_areas()
+
+        meta_areas = {
+            meta_area.hass_config.entry_id: meta_area
+            for meta_area in self._get_meta_areas()
+        }
+
+        # Forget meta areas that went away
+        self._pending_metas &= meta_areas.keys()
+
+        waiting_levels = {
+            meta_area_level(meta_areas[entry_id]) for entry_id in self._pending_metas
+        }
+        waiting_levels.update(self._reloading_metas.values())
+
+        for entry_id in list(self._pending_metas):
+            # Picked up again once the running reload is done
+            if entry_id in self._reloading_metas:
+                continue
+
+            meta_area = meta_areas[entry_id]
+            level = meta_area_level(meta_area)
+
+            if any(waiting_level < level for waiting_level in waiting_levels):
+                continue
+
+            if any(
+                meta_area.is_parent_of(area_type, floor_id)
+                for area_type, floor_id in self._loading.values()
+            ):
+                continue
+
+            self._pending_metas.discard(entry_id)
+            self._reloading_metas[entry_id] = level
+            # Not started eagerly, an update finishing right away would start
+            # the next ones while this loop still goes through its snapshot
+            self.hass.async_create_task(
+                self._async_reload_meta(meta_area),
+                f"Update Magic Areas meta area {meta_area.name}",
+                eager_start=False,
+            )
+
+    async def _async_reload_meta(self, meta_area: "MagicMetaArea") -> None:
+        """Update (or reload) a meta area, then the ones waiting on it."""
+
+        entry_id = meta_area.hass_config.entry_id
+
+        try:
+            # Existing entities follow their children unless the layout changed
+            if await meta_area.async_update_membership():
+                self.meta_updated += 1
+            else:
+                _LOGGER.debug("%s: Entities changed, reloading", meta_area.name)
+                await self.hass.config_entries.async_reload(entry_id)
+                self.meta_reloaded += 1
+        finally:
+            self._reloading_metas.pop(entry_id, None)
+            self._async_reload_ready_metas()
+
+    def _get_areas(self, entry_ids: set[str]) -> list["MagicArea"]:
+        """Return loaded areas for the given config entries."""
+        data = self.hass.data.get(MODULE_DATA, {})
+        return [
+            data[entry_id][DATA_AREA_OBJECT]
+            for entry_id in entry_ids
+            if entry_id in data
+        ]
+
+    def _get_meta_areas(self) -> list["MagicMetaArea"]:
+        """Return loaded meta areas."""
+        return [
+            area_data[DATA_AREA_OBJECT]
+            for area_data in self.hass.data.get(MODULE_DATA, {}).values()
+            if area_data[DATA_AREA_OBJECT].is_meta()
+        ]
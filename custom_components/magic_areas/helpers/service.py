@@ -0,0 +1,88 @@
+"""Batched service calls for Magic Areas.
+
+Light groups of every area queue their turn on/off intents here instead of
+calling the service themselves. Intents queued within one event loop
+iteration are sent as a single service call per service, with the entity
+ids merged, so an area (or a whole meta area) going clear doesn't turn
+into one service call per group.
+"""
+
+import asyncio
+import logging
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.singleton import singleton
+
+from custom_components.magic_areas.const import DATA_SERVICE_BATCHER
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+@singleton(DATA_SERVICE_BATCHER)
+def async_get_service_batcher(hass: HomeAssistant) -> "ServiceCallBatcher":
+    """Return the shared service call batcher."""
+    return ServiceCallBatcher(hass)
+
+
+class ServiceCallBatcher:
+    """Merge service calls queued within the same loop iteration."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the batcher."""
+        self.hass = hass
+
+        # (domain, service) -> entity ids, in queue order
+        self._pending: dict[tuple[str, str], dict[str, None]] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    @callback
+    def async_queue(self, domain: str, service: str, entity_id: str) -> None:
+        """Queue a service call for an entity, sent on the next loop iteration."""
+
+        # The latest intent for an entity wins
+        for (pending_domain, _), entity_ids in self._pending.items():
+            if pending_domain == domain:
+                entity_ids.pop(entity_id, None)
+
+        self._pending.setdefault((domain, service), {})[entity_id] = None
+
+        if self._flush_task is None:
+            # Tracked by hass, so waiting for hass to be idle includes the calls
+            self._flush_task = self.hass.async_create_task(
+                self._async_flush(), "Magic Areas service calls", eager_start=False
+            )
+
+    async def _async_flush(self) -> None:
+        """Send one service call per queued service."""
+
+        self._flush_task = None
+        pending, self._pending = self._pending, {}
+
+        for (domain, service), entity_ids in pending.items():
+            if not entity_ids:
+                continue
+
+            _LOGGER.debug(
+                "Calling %s.%s for %d entities: %s",
+                domain,
+                service,
+                len(entity_ids),
+                entity_ids.keys(),
+            )
+            self.hass.async_create_task(
+                self._async_call(domain, service, list(entity_ids))
+            )
+
+    async def _async_call(
+        self, domain: str, service: str, entity_ids: list[str]
+    ) -> None:
+        """Call a service, logging instead of raising on errors."""
+        try:
+            await self.hass.services.async_call(
+                domain, service, {ATTR_ENTITY_ID: entity_ids}
+            )
+        except HomeAssistantError as e:
+            _LOGGER.error("Error calling %s.%s: %s", domain, service, e)
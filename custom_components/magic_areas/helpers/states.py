@@ -0,0 +1,33 @@
+"""Bitmask helpers for area states.
+
+Each `AreaStates` member maps to one bit, so sets of states can be
+compared, intersected and diffed with integer operations.
+"""
+
+from collections.abc import Iterable
+
+from custom_components.magic_areas.const import AREA_PRIORITY_STATES, AreaStates
+
+AREA_STATE_BITS: dict[AreaStates, int] = {
+    state: 1 << index for index, state in enumerate(AreaStates)
+}
+
+
+def states_mask(states: Iterable[str]) -> int:
+    """Return the bitmask of the given states, ignoring unknown ones."""
+    mask = 0
+    for state in states:
+        mask |= AREA_STATE_BITS.get(state, 0)
+    return mask
+
+
+def mask_states(mask: int) -> list[AreaStates]:
+    """Return the states set in a bitmask, in `AreaStates` order."""
+    return [state for state, bit in AREA_STATE_BITS.items() if mask & bit]
+
+
+MASK_CLEAR = AREA_STATE_BITS[AreaStates.CLEAR]
+MASK_OCCUPIED = AREA_STATE_BITS[AreaStates.OCCUPIED]
+MASK_DARK = AREA_STATE_BITS[AreaStates.DARK]
+MASK_BRIGHT = AREA_STATE_BITS[AreaStates.BRIGHT]
+MASK_PRIORITY = states_mask(AREA_PRIORITY_STATES)
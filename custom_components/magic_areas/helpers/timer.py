@@ -1,14 +1,209 @@
-"""Reusable Timer helper for Magic Areas."""
+"""Timer helpers for Magic Areas.
+
+Timers of every area (clear timeouts, presence hold, wasp in a box) are
+kept in one hashed timer wheel. Arming or cancelling a timer is a dict
+operation on its bucket, and the whole wheel is driven by a single loop
+handle armed for the earliest pending deadline. Deadlines are kept on the
+event loop clock, so wall clock jumps don't move them.
+"""
 
 from collections.abc import Awaitable, Callable
 from datetime import datetime
 import logging
+import math
+from typing import Any
 
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util import dt as dt_util
+
+from custom_components.magic_areas.const import DATA_TIMER_WHEEL
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Width of a wheel bucket, in seconds
+TIMER_WHEEL_RESOLUTION = 1.0
+# Number of buckets, timers further out than a full turn wait for later turns
+TIMER_WHEEL_SLOTS = 512
+
+
+class WheelTimer:
+    """A timer scheduled on the timer wheel."""
+
+    __slots__ = ("_wheel", "deadline", "job", "tick")
+
+    def __init__(
+        self,
+        wheel: "TimerWheel",
+        deadline: float,
+        tick: int,
+        job: HassJob[[datetime], Any],
+    ) -> None:
+        """Initialize the timer."""
+        self._wheel = wheel
+        self.deadline = deadline
+        self.tick = tick
+        self.job = job
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel the timer, does nothing if it already fired."""
+        self._wheel.async_cancel(self)
+
+
+class TimerWheel:
+    """Hashed timer wheel shared by every area."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        resolution: float = TIMER_WHEEL_RESOLUTION,
+        slots: int = TIMER_WHEEL_SLOTS,
+    ) -> None:
+        """Initialize an empty wheel."""
+        self.hass = hass
+        self._resolution = resolution
+        self._slots = slots
+        self._buckets: list[dict[WheelTimer, None]] = [{} for _ in range(slots)]
+        self._pending: int = 0
+
+        # Every bucket up to this tick has been expired
+        self._processed: int = math.floor(self._now() / resolution)
+
+        self._wake_at: float | None = None
+        self._cancel_wake: CALLBACK_TYPE | None = None
+        self._wake_job = HassJob(
+            self._async_wake, "Magic Areas timer wheel", cancel_on_shutdown=True
+        )
+
+    @property
+    def pending(self) -> int:
+        """Return the number of pending timers."""
+        return self._pending
+
+    def _now(self) -> float:
+        return self.hass.loop.time()
+
+    @callback
+    def async_schedule(
+        self, delay: float, action: Callable[[datetime], Any]
+    ) -> CALLBACK_TYPE:
+        """Run an action after a delay in seconds, return a cancel callback."""
+
+        deadline = self._now() + max(delay, 0)
+        # Bucket k holds deadlines in ((k - 1) * resolution, k * resolution]
+        tick = max(math.ceil(deadline / self._resolution), self._processed + 1)
+
+        timer = WheelTimer(self, deadline, tick, HassJob(action))
+        self._buckets[tick % self._slots][timer] = None
+        self._pending += 1
+
+        if self._wake_at is None or deadline < self._wake_at:
+            self._async_arm(deadline)
+
+        return timer.cancel
+
+    @callback
+    def async_cancel(self, timer: WheelTimer) -> None:
+        """Remove a timer from the wheel."""
+
+        bucket = self._buckets[timer.tick % self._slots]
+        if timer not in bucket:
+            return
+
+        del bucket[timer]
+        self._pending -= 1
+        if not self._pending:
+            self._async_disarm()
+
+    @callback
+    def _async_wake(self, _now: datetime) -> None:
+        """Expire due timers and arm the next wake up."""
+
+        wake_at = self._wake_at
+        self._cancel_wake = None
+        self._wake_at = None
+
+        # The loop may run handles up to its clock resolution early
+        now = self._now() if wake_at is None else max(self._now(), wake_at)
+        last_tick = math.ceil(now / self._resolution)
+        # A full turn visits every bucket
+        first_tick = max(self._processed + 1, last_tick - self._slots + 1)
+
+        due: list[WheelTimer] = []
+        for tick in range(first_tick, last_tick + 1):
+            bucket = self._buckets[tick % self._slots]
+            if not bucket:
+                continue
+            expired = [timer for timer in bucket if timer.deadline <= now]
+            for timer in expired:
+                del bucket[timer]
+            due.extend(expired)
+
+        # The current bucket may still hold timers due later in this tick
+        self._processed = max(self._processed, math.floor(now / self._resolution))
+        self._pending -= len(due)
+
+        due.sort(key=lambda timer: timer.deadline)
+        for timer in due:
+            try:
+                self.hass.async_run_hass_job(timer.job, dt_util.utcnow())
+            except Exception:  # pylint: disable=broad-exception-caught
+                LOGGER.exception("Error running timer %s", timer.job)
+
+        if self._pending:
+            self._async_arm(self._next_deadline())
+
+    def _next_deadline(self) -> float:
+        """Return the earliest deadline within the next turn of the wheel."""
+
+        for tick in range(self._processed + 1, self._processed + self._slots + 1):
+            bucket = self._buckets[tick % self._slots]
+            deadlines = [timer.deadline for timer in bucket if timer.tick <= tick]
+            if deadlines:
+                return min(deadlines)
+
+        # Only timers for later turns, check back after a full turn
+        return (self._processed + self._slots) * self._resolution
+
+    @callback
+    def _async_arm(self, wake_at: float) -> None:
+        """Arm the loop handle for the given time."""
+        self._async_disarm()
+        self._wake_at = wake_at
+        self._cancel_wake = async_call_later(
+            self.hass, max(wake_at - self._now(), 0), self._wake_job
+        )
+
+    @callback
+    def _async_disarm(self) -> None:
+        """Cancel the loop handle."""
+        if self._cancel_wake:
+            self._cancel_wake()
+            self._cancel_wake = None
+        self._wake_at = None
+
+
+@callback
+@singleton(DATA_TIMER_WHEEL)
+def async_get_timer_wheel(hass: HomeAssistant) -> TimerWheel:
+    """Return the shared timer wheel."""
+    return TimerWheel(hass)
+
+
+@callback
+def async_schedule_timer(
+    hass: HomeAssistant, delay: float, action: Callable[[datetime], Any]
+) -> CALLBACK_TYPE:
+    """Run an action after a delay in seconds on the shared timer wheel."""
+    return async_get_timer_wheel(hass).async_schedule(delay, action)
+
 
 class ReusableTimer:
     """Single active reusable timer with fixed delay and callback."""
@@ -29,7 +224,7 @@ class ReusableTimer:
         LOGGER.debug(
             "Initialized logger with delay=%d and callback=%s",
             self._delay,
-            str(self._callback),
+            self._callback,
         )
 
     def start(self) -> None:
@@ -47,13 +242,13 @@ class ReusableTimer:
             await self._callback(now)
             LOGGER.debug("Timer fired.")
 
-        self._handle = async_call_later(self.hass, self._delay, _scheduled)
+        self._handle = async_schedule_timer(self.hass, self._delay, _scheduled)
         LOGGER.debug("Timer started.")
 
     def cancel(self) -> None:
         """Cancel the timer if running."""
         if self._handle:
-            self._handle()  # async_call_later returns a cancel function
+            self._handle()  # async_schedule_timer returns a cancel function
             self._handle = None
             LOGGER.debug("Timer cancelled.")
 
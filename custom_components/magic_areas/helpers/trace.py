@@ -0,0 +1,116 @@
+"""Debug logging guards and per-area tracing for Magic Areas.
+
+Hot paths check a `LogGuard`, which caches whether a logger is enabled
+for debug, instead of building log arguments on every event. Guards are
+refreshed when Home Assistant reports logging changes.
+
+Tracing is enabled for a single area by setting its trace logger,
+`custom_components.magic_areas.helpers.trace.<area_id>`, to debug. Traced
+areas keep compact records of their evaluations in a ring buffer and log
+them, while untraced areas only pay for a flag check.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+from weakref import WeakSet
+
+from homeassistant.const import EVENT_LOGGING_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+from custom_components.magic_areas.const import DATA_LOG_GUARDS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of trace records kept per area
+TRACE_BUFFER_SIZE = 200
+
+_GUARDS: WeakSet["LogGuard"] = WeakSet()
+
+
+class LogGuard:
+    """Cached debug check of a logger."""
+
+    __slots__ = ("__weakref__", "enabled", "logger")
+
+    def __init__(self, logger: logging.Logger) -> None:
+        """Initialize the guard."""
+        self.logger = logger
+        self.enabled = False
+        self.refresh()
+        _GUARDS.add(self)
+
+    def refresh(self) -> None:
+        """Read the logger level again."""
+        self.enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+
+@dataclass(frozen=True, slots=True)
+class TraceRecord:
+    """A traced area event."""
+
+    timestamp: float
+    area: str
+    event: str
+    duration: float | None = None
+    states: tuple[str, ...] = ()
+    detail: Any = None
+
+
+class AreaTracer(LogGuard):
+    """Trace buffer of an area, active while its trace logger is on debug."""
+
+    __slots__ = ("area_id", "records")
+
+    def __init__(self, area_id: str) -> None:
+        """Initialize the tracer."""
+        self.area_id = area_id
+        self.records: deque[TraceRecord] = deque(maxlen=TRACE_BUFFER_SIZE)
+        super().__init__(_LOGGER.getChild(area_id))
+
+    @callback
+    def trace(
+        self,
+        event: str,
+        *,
+        states: list[str] | None = None,
+        duration: float | None = None,
+        detail: Any = None,
+    ) -> None:
+        """Record an event if tracing is enabled for the area."""
+
+        if not self.enabled:
+            return
+
+        record = TraceRecord(
+            time.time(),
+            self.area_id,
+            event,
+            duration,
+            tuple(states) if states else (),
+            detail,
+        )
+        self.records.append(record)
+        self.logger.debug("%s", record)
+
+
+def refresh_log_guards() -> None:
+    """Refresh every guard after a logging change."""
+    for guard in list(_GUARDS):
+        guard.refresh()
+
+
+@callback
+@singleton(DATA_LOG_GUARDS)
+def async_setup_log_guards(hass: HomeAssistant) -> CALLBACK_TYPE:
+    """Refresh log guards whenever logger levels change."""
+
+    @callback
+    def _async_logging_changed(event: Event) -> None:
+        refresh_log_guards()
+
+    refresh_log_guards()
+    return hass.bus.async_listen(EVENT_LOGGING_CHANGED, _async_logging_changed)
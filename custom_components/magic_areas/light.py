@@ -1,10 +1,10 @@
 """Platform file for Magic Area's light entities."""
 
+from enum import IntEnum
 import logging
 
 from homeassistant.components.group.light import FORWARDED_ATTRIBUTES, LightGroup
 from homeassistant.components.light.const import DOMAIN as LIGHT_DOMAIN
-from homeassistant.components.switch.const import DOMAIN as SWITCH_DOMAIN
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     SERVICE_TURN_OFF,
@@ -12,16 +12,18 @@ from homeassistant.const import (
     STATE_OFF,
     STATE_ON,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import async_track_state_change_event
 
-from custom_components.magic_areas.base.entities import MagicEntity
-from custom_components.magic_areas.base.magic import MagicArea
+from custom_components.magic_areas.base.entities import (
+    MagicGroupEntity,
+    async_update_group_members,
+)
+from custom_components.magic_areas.base.magic import MagicArea, MagicMetaArea
 from custom_components.magic_areas.const import (
-    AREA_PRIORITY_STATES,
     DEFAULT_LIGHT_GROUP_ACT_ON,
     EMPTY_STRING,
-    EVENT_MAGICAREAS_AREA_STATE_CHANGED,
     LIGHT_GROUP_ACT_ON,
     LIGHT_GROUP_ACT_ON_OCCUPANCY_CHANGE,
     LIGHT_GROUP_ACT_ON_STATE_CHANGE,
@@ -31,13 +33,25 @@ from custom_components.magic_areas.const import (
     LIGHT_GROUP_STATES,
     AreaStates,
     LightGroupCategory,
+    MagicAreasEvents,
     MagicAreasFeatureInfoLightGroups,
     MagicAreasFeatures,
 )
 from custom_components.magic_areas.helpers.area import get_area_from_config_entry
-from custom_components.magic_areas.util import cleanup_removed_entries
+from custom_components.magic_areas.helpers.service import async_get_service_batcher
+from custom_components.magic_areas.helpers.states import (
+    MASK_BRIGHT,
+    MASK_CLEAR,
+    MASK_DARK,
+    MASK_OCCUPIED,
+    MASK_PRIORITY,
+    states_mask,
+)
+from custom_components.magic_areas.helpers.trace import LogGuard
+from custom_components.magic_areas.util import area_signal, cleanup_removed_entries
 
 _LOGGER = logging.getLogger(__name__)
+_DEBUG = LogGuard(_LOGGER)
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
@@ -50,24 +64,51 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     if not area.has_feature(MagicAreasFeatures.LIGHT_GROUPS):
         return
 
+    light_groups = create_light_groups(area)
+
+    # Create all groups
+    if light_groups:
+        async_add_entities(light_groups)
+
+    # Follow child area changes in place
+    if isinstance(area, MagicMetaArea):
+
+        @callback
+        def _async_update_membership() -> bool:
+            return async_update_group_members(
+                light_groups, get_meta_light_group_members(area)
+            )
+
+        config_entry.async_on_unload(
+            area.async_register_membership_updater(_async_update_membership)
+        )
+
+    if LIGHT_DOMAIN in area.magic_entities:
+        cleanup_removed_entries(
+            area.hass, light_groups, area.magic_entities[LIGHT_DOMAIN]
+        )
+
+
+def create_light_groups(area: MagicArea) -> list["MagicLightGroup"]:
+    """Create the light groups for the area."""
+
     # Check if there are any lights
     if not area.has_entities(LIGHT_DOMAIN):
         _LOGGER.debug("%s: No %s entities for area.", area.name, LIGHT_DOMAIN)
-        return
+        return []
 
-    light_entities = [e["entity_id"] for e in area.entities[LIGHT_DOMAIN]]
+    light_entities = [e.entity_id for e in area.entities[LIGHT_DOMAIN]]
 
-    light_groups = []
+    light_groups: list[MagicLightGroup] = []
 
     # Create light groups
     if area.is_meta():
-        light_groups.append(
-            MagicLightGroup(
-                area, light_entities, translation_key=LightGroupCategory.ALL
-            )
+        light_groups.extend(
+            MagicLightGroup(area, members, translation_key=category)
+            for category, members in get_meta_light_group_members(area).items()
         )
     else:
-        light_group_ids = []
+        child_groups: list[AreaLightGroup] = []
 
         # Create extended light groups
         for category in LIGHT_GROUP_CATEGORIES:
@@ -86,45 +127,125 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                     category,
                     category_lights,
                 )
-                light_group_object = AreaLightGroup(area, category_lights, category)
-                light_groups.append(light_group_object)
+                child_groups.append(AreaLightGroup(area, category_lights, category))
 
-                # Infer light group entity id from name
-                light_group_id = f"{LIGHT_DOMAIN}.magic_areas_light_groups_{area.slug}_lights_{category.lower()}"
-                light_group_ids.append(light_group_id)
+        light_groups.extend(child_groups)
 
         _LOGGER.debug(
             "%s: Creating Area light group for area with lights: %s",
             area.name,
-            str(light_group_ids),
+            light_entities,
         )
         light_groups.append(
             AreaLightGroup(
                 area,
                 light_entities,
                 category=LightGroupCategory.ALL,
-                child_ids=light_group_ids,
+                child_groups=child_groups,
             )
         )
 
-    # Create all groups
-    if light_groups:
-        async_add_entities(light_groups)
+    return light_groups
 
-    if LIGHT_DOMAIN in area.magic_entities:
-        cleanup_removed_entries(
-            area.hass, light_groups, area.magic_entities[LIGHT_DOMAIN]
-        )
 
+def get_meta_light_group_members(area: MagicArea) -> dict[str, list[str]]:
+    """Return the members of the meta area's light groups by category."""
 
-class MagicLightGroup(MagicEntity, LightGroup):
+    if not area.has_entities(LIGHT_DOMAIN):
+        return {}
+
+    return {LightGroupCategory.ALL: [e.entity_id for e in area.entities[LIGHT_DOMAIN]]}
+
+
+class LightGroupAction(IntEnum):
+    """Action of a light group on an area state change."""
+
+    NONE = 0
+    TURN_ON = 1
+    TURN_OFF = 2
+    RESET = 3
+
+
+class LightGroupDecisions:
+    """Secondary state decisions of a light group, compiled to bitmasks.
+
+    The group's assigned states and act on settings are resolved once, so
+    each area state change is decided with a few integer operations on the
+    new, lost and current state masks.
+    """
+
+    __slots__ = (
+        "_act_on_occupancy",
+        "_act_on_state",
+        "_assigned",
+        "_has_assigned",
+        "_priority",
+    )
+
+    def __init__(self, assigned_states: list[str], act_on: list[str]) -> None:
+        """Compile the group settings."""
+        self._has_assigned = bool(assigned_states)
+        self._assigned = states_mask(assigned_states)
+        self._priority = self._assigned & MASK_PRIORITY
+        self._act_on_occupancy = LIGHT_GROUP_ACT_ON_OCCUPANCY_CHANGE in act_on
+        self._act_on_state = LIGHT_GROUP_ACT_ON_STATE_CHANGE in act_on
+
+    def decide(self, new: int, lost: int, current: int) -> LightGroupAction:
+        """Return the action for an area state change."""
+
+        # Area clear, reset control state (main group turns lights off)
+        if new & MASK_CLEAR:
+            return LightGroupAction.RESET
+
+        # Only turn off lights when bright if the room was already occupied
+        if current & MASK_BRIGHT:
+            if new & MASK_BRIGHT and not new & MASK_OCCUPIED:
+                return LightGroupAction.TURN_OFF
+            return LightGroupAction.NONE
+
+        # Only react to actual secondary state changes, for groups tied to a
+        # state, while the area is occupied
+        if not (new | lost) or not self._has_assigned or not current & MASK_OCCUPIED:
+            return LightGroupAction.NONE
+
+        # Act on occupancy or state changes only if configured to
+        if new & MASK_OCCUPIED:
+            if not self._act_on_occupancy:
+                return LightGroupAction.NONE
+        elif not self._act_on_state:
+            return LightGroupAction.NONE
+
+        # Valid states, preferring priority states when present
+        valid = self._assigned & current
+        if current & MASK_PRIORITY:
+            valid &= MASK_PRIORITY
+
+        if valid:
+            return LightGroupAction.TURN_ON
+
+        # Only turn lights off if not going into dark state
+        if new & MASK_DARK:
+            return LightGroupAction.NONE
+
+        # Turn off when coming out of an assigned priority state
+        if self._priority & lost:
+            return LightGroupAction.TURN_OFF
+
+        # Do not turn off if no new priority states
+        if not new & MASK_PRIORITY:
+            return LightGroupAction.NONE
+
+        return LightGroupAction.TURN_OFF
+
+
+class MagicLightGroup(MagicGroupEntity, LightGroup):
     """Magic Light Group for Meta-areas."""
 
     feature_info = MagicAreasFeatureInfoLightGroups()
 
     def __init__(self, area, entities, translation_key: str | None = None):
         """Initialize parent class and state."""
-        MagicEntity.__init__(
+        MagicGroupEntity.__init__(
             self, area, domain=LIGHT_DOMAIN, translation_key=translation_key
         )
         LightGroup.__init__(
@@ -160,7 +281,7 @@ class MagicLightGroup(MagicEntity, LightGroup):
         _LOGGER.debug(
             "%s: restricting call to active lights: %s",
             self.area.name,
-            str(active_lights),
+            active_lights,
         )
 
         data[ATTR_ENTITY_ID] = active_lights
@@ -179,12 +300,12 @@ class MagicLightGroup(MagicEntity, LightGroup):
 class AreaLightGroup(MagicLightGroup):
     """Magic Light Group."""
 
-    def __init__(self, area, entities, category=None, child_ids=None):
+    def __init__(self, area, entities, category=None, child_groups=None):
         """Initialize light group."""
 
         MagicLightGroup.__init__(self, area, entities, translation_key=category)
 
-        self._child_ids = child_ids
+        self._child_groups: list[AreaLightGroup] = child_groups or []
 
         self.category = category
         self.assigned_states = []
@@ -207,18 +328,22 @@ class AreaLightGroup(MagicLightGroup):
                 LIGHT_GROUP_ACT_ON[self.category], DEFAULT_LIGHT_GROUP_ACT_ON
             )
 
+        self._decisions = LightGroupDecisions(self.assigned_states, self.act_on)
+
         # Add static attributes
         self._attr_extra_state_attributes["lights"] = self._entity_ids
         self._attr_extra_state_attributes["controlling"] = self.controlling
 
         if self.category == LightGroupCategory.ALL:
-            self._attr_extra_state_attributes["child_ids"] = self._child_ids
+            self._attr_extra_state_attributes["child_ids"] = [
+                group.entity_id for group in self._child_groups
+            ]
 
         self.logger.debug(
             "%s: Light group (%s) created with entities: %s",
             self.area.name,
             category,
-            str(self._entity_ids),
+            self._entity_ids,
         )
 
     @property
@@ -253,8 +378,12 @@ class AreaLightGroup(MagicLightGroup):
 
     async def _setup_listeners(self, _=None) -> None:
         """Set up listeners for area state chagne."""
-        async_dispatcher_connect(
-            self.hass, EVENT_MAGICAREAS_AREA_STATE_CHANGED, self.area_state_changed
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                area_signal(MagicAreasEvents.AREA_STATE_CHANGED, self.area.id),
+                self.area_state_changed,
+            )
         )
         self.async_on_remove(
             async_track_state_change_event(
@@ -268,27 +397,21 @@ class AreaLightGroup(MagicLightGroup):
 
     # State Change Handling
 
+    @callback
     def area_state_changed(self, area_id, states_tuple):
         """Handle area state change event."""
-        if area_id != self.area.id:
-            self.logger.debug(
-                "%s: Area state change event not for us. Skipping. (req: %s/self: %s)",
-                self.name,
-                area_id,
-                self.area.id,
-            )
-            return
-
         automatic_control = self.is_control_enabled()
 
         if not automatic_control:
-            self.logger.debug(
-                "%s: Automatic control for light group is disabled, skipping...",
-                self.name,
-            )
+            if _DEBUG.enabled:
+                self.logger.debug(
+                    "%s: Automatic control for light group is disabled, skipping...",
+                    self.name,
+                )
             return False
 
-        self.logger.debug("%s: Light group detected area state change", self.name)
+        if _DEBUG.enabled:
+            self.logger.debug("%s: Light group detected area state change", self.name)
 
         # Handle all lights group
         if self.category == LightGroupCategory.ALL:
@@ -297,6 +420,7 @@ class AreaLightGroup(MagicLightGroup):
         # Handle light category
         return self.state_change_secondary(states_tuple)
 
+    @callback
     def state_change_primary(self, states_tuple):
         """Handle primary state change."""
         # pylint: disable-next=unused-variable
@@ -310,131 +434,41 @@ class AreaLightGroup(MagicLightGroup):
 
         return False
 
+    @callback
     def state_change_secondary(self, states_tuple):
         """Handle secondary state change."""
         new_states, lost_states = states_tuple
 
-        if AreaStates.CLEAR in new_states:
-            self.logger.debug(
-                "%s: Area is clear, reset control state and Noop!", self.name
-            )
-            self.reset_control()
-            return False
-
-        if self.area.has_state(AreaStates.BRIGHT):
-            # Only turn off lights when bright if the room was already occupied
-            if (
-                AreaStates.BRIGHT in new_states
-                and AreaStates.OCCUPIED not in new_states
-            ):
-                self.controlled = True
-                self._turn_off()
-            return False
-
-        # Only react to actual secondary state changes
-        if not new_states and not lost_states:
-            self.logger.debug("%s: No new or lost states, noop.", self.name)
-            return False
-
-        # Do not handle lights that are not tied to a state
-        if not self.assigned_states:
-            self.logger.debug("%s: No assigned states. noop.", self.name)
-            return False
-
-        # If area clear, do nothing (main group will)
-        if not self.area.is_occupied():
-            self.logger.debug("%s: Area not occupied, ignoring.", self.name)
-            return False
-
-        self.logger.debug(
-            "%s: Assigned states: %s. New states: %s / Lost states %s",
-            self.name,
-            str(self.assigned_states),
-            str(new_states),
-            str(lost_states),
+        action = self._decisions.decide(
+            states_mask(new_states),
+            states_mask(lost_states),
+            self.area.state_mask,
         )
 
-        # Calculate valid states (if area has states we listen to)
-        # and check if area is under one or more priority state
-        valid_states = [
-            state for state in self.assigned_states if self.area.has_state(state)
-        ]
-        has_priority_states = any(
-            self.area.has_state(state) for state in AREA_PRIORITY_STATES
-        )
-        non_priority_states = [
-            state for state in valid_states if state not in AREA_PRIORITY_STATES
-        ]
+        self.area.tracer.trace("light_group", detail=(self.entity_id, action))
 
-        self.logger.debug(
-            "%s: Has priority states? %s. Non-priority states: %s",
-            self.name,
-            has_priority_states,
-            str(non_priority_states),
-        )
-
-        # ACT ON Control
-        # Do not act on occupancy change if not defined on act_on
-        if (
-            AreaStates.OCCUPIED in new_states
-            and LIGHT_GROUP_ACT_ON_OCCUPANCY_CHANGE not in self.act_on
-        ):
+        if _DEBUG.enabled:
             self.logger.debug(
-                "Area occupancy change detected but not configured to act on. Skipping."
+                "%s: New states: %s / Lost states %s, action: %s",
+                self.name,
+                new_states,
+                lost_states,
+                action,
             )
-            return False
 
-        # Do not act on state change if not defined on act_on
-        if (
-            AreaStates.OCCUPIED not in new_states
-            and LIGHT_GROUP_ACT_ON_STATE_CHANGE not in self.act_on
-        ):
-            self.logger.debug(
-                "Area state change detected but not configured to act on. Skipping."
-            )
+        if action == LightGroupAction.RESET:
+            self.reset_control()
             return False
 
-        # Prefer priority states when present
-        if has_priority_states:
-            for non_priority_state in non_priority_states:
-                valid_states.remove(non_priority_state)
-
-        if valid_states:
-            self.logger.debug(
-                "%s: Area has valid states (%s), Group should turn on!",
-                self.name,
-                str(valid_states),
-            )
+        if action == LightGroupAction.TURN_ON:
             self.controlled = True
             return self._turn_on()
 
-        # Only turn lights off if not going into dark state
-        if AreaStates.DARK in new_states:
-            self.logger.debug(
-                "%s: Entering %s state, noop.", self.name, AreaStates.DARK
-            )
-            return False
-
-        # Turn off if we're a PRIORITY_STATE and we're coming out of it
-        out_of_priority_states = [
-            state
-            for state in AREA_PRIORITY_STATES
-            if state in self.assigned_states and state in lost_states
-        ]
-        if out_of_priority_states:
+        if action == LightGroupAction.TURN_OFF:
             self.controlled = True
             return self._turn_off()
 
-        # Do not turn off if no new PRIORITY_STATES
-        new_priority_states = [
-            state for state in AREA_PRIORITY_STATES if state in new_states
-        ]
-        if not new_priority_states:
-            self.logger.debug("%s: No new priority states. Noop.", self.name)
-            return False
-
-        self.controlled = True
-        return self._turn_off()
+        return False
 
     def relevant_states(self):
         """Return relevant states and remove irrelevant ones (opinionated)."""
@@ -460,8 +494,9 @@ class AreaLightGroup(MagicLightGroup):
 
         self.controlled = True
 
-        service_data = {ATTR_ENTITY_ID: self.entity_id}
-        self.hass.services.call(LIGHT_DOMAIN, SERVICE_TURN_ON, service_data)
+        async_get_service_batcher(self.hass).async_queue(
+            LIGHT_DOMAIN, SERVICE_TURN_ON, self.entity_id
+        )
 
         return True
 
@@ -473,25 +508,17 @@ class AreaLightGroup(MagicLightGroup):
         if not self.is_on:
             return False
 
-        service_data = {ATTR_ENTITY_ID: self.entity_id}
-        self.hass.services.call(LIGHT_DOMAIN, SERVICE_TURN_OFF, service_data)
+        async_get_service_batcher(self.hass).async_queue(
+            LIGHT_DOMAIN, SERVICE_TURN_OFF, self.entity_id
+        )
 
         return True
 
     # Control Release
 
     def is_control_enabled(self):
-        """Check if light control is enabled by checking light control switch state."""
-        entity_id = (
-            f"{SWITCH_DOMAIN}.magic_areas_light_groups_{self.area.slug}_light_control"
-        )
-
-        switch_entity = self.hass.states.get(entity_id)
-
-        if not switch_entity:
-            return False
-
-        return switch_entity.state.lower() == STATE_ON
+        """Check if light control is enabled, as kept by the light control switch."""
+        return self.area.light_control
 
     def reset_control(self):
         """Reset control status."""
@@ -500,29 +527,19 @@ class AreaLightGroup(MagicLightGroup):
         self.schedule_update_ha_state()
         self.logger.debug("{self.name}: Control Reset.")
 
-    def is_child_controllable(self, entity_id):
-        """Check if child entity is controllable."""
-        entity_object = self.hass.states.get(entity_id)
-        if not entity_object:
-            return False
-        if "controlling" in entity_object.attributes:
-            return entity_object.attributes["controlling"]
-
-        return False
+    def is_child_controllable(self, group):
+        """Check if child group is controllable."""
+        return group.hass is not None and group.controlling
 
     def handle_group_state_change_primary(self):
         """Handle group state change for primary area state events."""
-        controlling = False
 
-        if not self._child_ids:
+        if not self._child_groups:
             return
 
-        for entity_id in self._child_ids:
-            if self.is_child_controllable(entity_id):
-                controlling = True
-                break
-
-        self.controlling = controlling
+        self.controlling = any(
+            self.is_child_controllable(group) for group in self._child_groups
+        )
         self.schedule_update_ha_state()
 
     def handle_group_state_change_secondary(self):
@@ -4,9 +4,10 @@ import logging
 
 from homeassistant.components.group.media_player import MediaPlayerGroup
 from homeassistant.components.media_player.const import DOMAIN as MEDIA_PLAYER_DOMAIN
+from homeassistant.core import callback
 
 from custom_components.magic_areas.base.entities import MagicEntity
-from custom_components.magic_areas.base.magic import MagicArea
+from custom_components.magic_areas.base.magic import MagicArea, MagicMetaArea
 from custom_components.magic_areas.const import (
     CONF_FEATURE_AREA_AWARE_MEDIA_PLAYER,
     CONF_FEATURE_MEDIA_PLAYER_GROUPS,
@@ -15,11 +16,13 @@ from custom_components.magic_areas.const import (
     EMPTY_STRING,
     META_AREA_GLOBAL,
     MODULE_DATA,
+    MagicAreasFeatureInfoAreaAwareMediaPlayer,
     MagicAreasFeatureInfoMediaPlayerGroups,
 )
 from custom_components.magic_areas.helpers.area import get_area_from_config_entry
 from custom_components.magic_areas.media_player.area_aware_media_player import (
     AreaAwareMediaPlayer,
+    get_tracked_media_players,
 )
 from custom_components.magic_areas.util import cleanup_removed_entries
 
@@ -32,6 +35,68 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     area: MagicArea | None = get_area_from_config_entry(hass, config_entry)
     assert area is not None
 
+    entities_to_add = create_media_player_entities(area)
+
+    if entities_to_add:
+        async_add_entities(entities_to_add)
+
+    # Nothing to update in place here, only check whether members changed
+    if isinstance(area, MagicMetaArea):
+
+        @callback
+        def _async_update_membership() -> bool:
+            return _get_members(entities_to_add) == get_media_player_members(area)
+
+        config_entry.async_on_unload(
+            area.async_register_membership_updater(_async_update_membership)
+        )
+
+    if MEDIA_PLAYER_DOMAIN in area.magic_entities:
+        cleanup_removed_entries(
+            area.hass, entities_to_add, area.magic_entities[MEDIA_PLAYER_DOMAIN]
+        )
+
+
+def _get_members(
+    entities: list["AreaAwareMediaPlayer | AreaMediaPlayerGroup"],
+) -> dict[str, list[str]]:
+    """Return media players used by each entity, by feature."""
+    return {
+        entity.feature_info.id: (
+            entity.tracked_entities
+            if isinstance(entity, AreaAwareMediaPlayer)
+            else entity.group_members
+        )
+        for entity in entities
+    }
+
+
+def get_media_player_members(area: MagicArea) -> dict[str, list[str]]:
+    """Return media players the area's entities should use, by feature."""
+
+    members: dict[str, list[str]] = {}
+
+    if area.has_feature(CONF_FEATURE_MEDIA_PLAYER_GROUPS) and area.has_entities(
+        MEDIA_PLAYER_DOMAIN
+    ):
+        members[MagicAreasFeatureInfoMediaPlayerGroups.id] = [
+            e.entity_id for e in area.entities[MEDIA_PLAYER_DOMAIN]
+        ]
+
+    if area.is_meta() and area.id == META_AREA_GLOBAL.lower():
+        if areas := get_area_aware_media_player_areas(area):
+            members[MagicAreasFeatureInfoAreaAwareMediaPlayer.id] = (
+                get_tracked_media_players(areas)
+            )
+
+    return members
+
+
+def create_media_player_entities(
+    area: MagicArea,
+) -> list["AreaAwareMediaPlayer | AreaMediaPlayerGroup"]:
+    """Create the media player entities for the area."""
+
     entities_to_add: list[AreaAwareMediaPlayer | AreaMediaPlayerGroup] = []
 
     # Media Player Groups
@@ -45,13 +110,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         _LOGGER.debug("%s: Setting up Area-Aware media player", area.name)
         entities_to_add.extend(setup_area_aware_media_player(area))
 
-    if entities_to_add:
-        async_add_entities(entities_to_add)
-
-    if MEDIA_PLAYER_DOMAIN in area.magic_entities:
-        cleanup_removed_entries(
-            area.hass, entities_to_add, area.magic_entities[MEDIA_PLAYER_DOMAIN]
-        )
+    return entities_to_add
 
 
 def setup_media_player_group(area):
@@ -61,13 +120,33 @@ def setup_media_player_group(area):
         _LOGGER.debug("%s: No %s entities.", area.name, MEDIA_PLAYER_DOMAIN)
         return []
 
-    media_player_entities = [e["entity_id"] for e in area.entities[MEDIA_PLAYER_DOMAIN]]
+    media_player_entities = [e.entity_id for e in area.entities[MEDIA_PLAYER_DOMAIN]]
 
     return [AreaMediaPlayerGroup(area, media_player_entities)]
 
 
 def setup_area_aware_media_player(area):
     """Create Area-aware media player."""
+    areas_with_media_players = get_area_aware_media_player_areas(area)
+
+    if not areas_with_media_players:
+        _LOGGER.debug(
+            "No areas with %s entities. Skipping creation of area-aware-media-player",
+            MEDIA_PLAYER_DOMAIN,
+        )
+        return []
+
+    area_names = [i.name for i in areas_with_media_players]
+
+    _LOGGER.debug(
+        "%s: Setting up area-aware media player with areas: %s", area.name, area_names
+    )
+
+    return [AreaAwareMediaPlayer(area, areas_with_media_players)]
+
+
+def get_area_aware_media_player_areas(area: MagicArea) -> list[MagicArea]:
+    """Return the areas the area-aware media player plays on."""
     ma_data = area.hass.data[MODULE_DATA]
 
     # Check if we have areas with MEDIA_PLAYER_DOMAIN entities
@@ -110,20 +189,7 @@ def setup_area_aware_media_player(area):
         # If all passes, we add this valid area to the list
         areas_with_media_players.append(current_area)
 
-    if not areas_with_media_players:
-        _LOGGER.debug(
-            "No areas with %s entities. Skipping creation of area-aware-media-player",
-            MEDIA_PLAYER_DOMAIN,
-        )
-        return []
-
-    area_names = [i.name for i in areas_with_media_players]
-
-    _LOGGER.debug(
-        "%s: Setting up area-aware media player with areas: %s", area.name, area_names
-    )
-
-    return [AreaAwareMediaPlayer(area, areas_with_media_players)]
+    return areas_with_media_players
 
 
 class AreaMediaPlayerGroup(MagicEntity, MediaPlayerGroup):
@@ -140,3 +206,8 @@ class AreaMediaPlayerGroup(MagicEntity, MediaPlayerGroup):
             unique_id=self._attr_unique_id,
             entities=entities,
         )
+
+    @property
+    def group_members(self) -> list[str]:
+        """Return the entity ids in the group."""
+        return self._entities
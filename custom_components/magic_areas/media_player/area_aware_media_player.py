@@ -27,6 +27,40 @@ from custom_components.magic_areas.const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def get_media_players_for_area(area) -> set[str]:
+    """Return the notification media players of a given area."""
+    entity_ids = []
+
+    notification_devices = area.feature_config(
+        MagicAreasFeatures.AREA_AWARE_MEDIA_PLAYER
+    ).get(CONF_NOTIFICATION_DEVICES, DEFAULT_NOTIFICATION_DEVICES)
+
+    _LOGGER.debug("%s: Notification devices: %s", area.name, notification_devices)
+
+    area_media_players = [
+        entity.entity_id for entity in area.entities[MEDIA_PLAYER_DOMAIN]
+    ]
+
+    # Check if media_player entities are notification devices
+    for mp in area_media_players:
+        if mp in notification_devices:
+            entity_ids.append(mp)
+
+    return set(entity_ids)
+
+
+def get_tracked_media_players(areas) -> list[str]:
+    """Return the media players the area-aware media player forwards to."""
+    tracked_entities: list[str] = []
+
+    for area in areas:
+        entity_list = get_media_players_for_area(area)
+        if entity_list:
+            tracked_entities.extend(entity_list)
+
+    return tracked_entities
+
+
 class AreaAwareMediaPlayer(MagicEntity, MediaPlayerEntity):
     """Area-aware media player."""
 
@@ -42,15 +76,15 @@ class AreaAwareMediaPlayer(MagicEntity, MediaPlayerEntity):
 
         self.areas = areas
         self.area = area
-        self._tracked_entities = []
-
-        for area_obj in self.areas:
-            entity_list = self.get_media_players_for_area(area_obj)
-            if entity_list:
-                self._tracked_entities.extend(entity_list)
+        self._tracked_entities = get_tracked_media_players(self.areas)
 
         _LOGGER.debug("AreaAwareMediaPlayer loaded.")
 
+    @property
+    def tracked_entities(self) -> list[str]:
+        """Return the media players this entity forwards to."""
+        return self._tracked_entities
+
     def update_attributes(self):
         """Update entity attributes."""
         self._attr_extra_state_attributes["areas"] = [
@@ -61,24 +95,7 @@ class AreaAwareMediaPlayer(MagicEntity, MediaPlayerEntity):
 
     def get_media_players_for_area(self, area):
         """Return media players for a given area."""
-        entity_ids = []
-
-        notification_devices = area.feature_config(
-            MagicAreasFeatures.AREA_AWARE_MEDIA_PLAYER
-        ).get(CONF_NOTIFICATION_DEVICES, DEFAULT_NOTIFICATION_DEVICES)
-
-        _LOGGER.debug("%s: Notification devices: %s", area.name, notification_devices)
-
-        area_media_players = [
-            entity["entity_id"] for entity in area.entities[MEDIA_PLAYER_DOMAIN]
-        ]
-
-        # Check if media_player entities are notification devices
-        for mp in area_media_players:
-            if mp in notification_devices:
-                entity_ids.append(mp)
-
-        return set(entity_ids)
+        return get_media_players_for_area(area)
 
     async def async_added_to_hass(self):
         """Call when entity about to be added to hass."""
@@ -5,16 +5,13 @@ import logging
 
 from homeassistant.components.sensor.const import DOMAIN as SENSOR_DOMAIN
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    ATTR_DEVICE_CLASS,
-    ATTR_ENTITY_ID,
-    ATTR_UNIT_OF_MEASUREMENT,
-)
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from custom_components.magic_areas.base.magic import MagicArea
+from custom_components.magic_areas.base.entities import async_update_group_members
+from custom_components.magic_areas.base.magic import MagicArea, MagicMetaArea
+from custom_components.magic_areas.base.record import AreaEntityRecord
 from custom_components.magic_areas.const import (
     CONF_AGGREGATES_MIN_ENTITIES,
     CONF_AGGREGATES_SENSOR_DEVICE_CLASSES,
@@ -48,6 +45,19 @@ async def async_setup_entry(
     if entities_to_add:
         async_add_entities(entities_to_add)
 
+    # Follow child area changes in place
+    if isinstance(area, MagicMetaArea):
+
+        @callback
+        def _async_update_membership() -> bool:
+            return async_update_group_members(
+                entities_to_add, get_aggregate_sensor_members(area)
+            )
+
+        config_entry.async_on_unload(
+            area.async_register_membership_updater(_async_update_membership)
+        )
+
     if SENSOR_DOMAIN in area.magic_entities:
         cleanup_removed_entries(
             area.hass, entities_to_add, area.magic_entities[SENSOR_DOMAIN]
@@ -57,87 +67,26 @@ async def async_setup_entry(
 def create_aggregate_sensors(area: MagicArea) -> list[Entity]:
     """Create the aggregate sensors for the area."""
 
-    eligible_entities: dict[str, list[str]] = {}
-    unit_of_measurement_map: dict[str, list[str]] = {}
-
     aggregates = []
 
-    if SENSOR_DOMAIN not in area.entities:
-        return []
-
-    if not area.has_feature(CONF_FEATURE_AGGREGATION):
-        return []
-
-    for entity in area.entities[SENSOR_DOMAIN]:
-        entity_state = area.hass.states.get(entity[ATTR_ENTITY_ID])
-        if not entity_state:
-            continue
-
-        if (
-            ATTR_DEVICE_CLASS not in entity_state.attributes
-            or not entity_state.attributes[ATTR_DEVICE_CLASS]
-        ):
-            _LOGGER.debug(
-                "Entity %s does not have device_class defined",
-                entity[ATTR_ENTITY_ID],
-            )
-            continue
-
-        if (
-            ATTR_UNIT_OF_MEASUREMENT not in entity_state.attributes
-            or not entity_state.attributes[ATTR_UNIT_OF_MEASUREMENT]
-        ):
-            _LOGGER.debug(
-                "Entity %s does not have unit_of_measurement defined",
-                entity[ATTR_ENTITY_ID],
-            )
-            continue
-
-        device_class = entity_state.attributes[ATTR_DEVICE_CLASS]
-
-        # Dictionary of sensors by device class.
-        if device_class not in eligible_entities:
-            eligible_entities[device_class] = []
-
-        # Dictionary of seen unit of measurements by device class.
-        if device_class not in unit_of_measurement_map:
-            unit_of_measurement_map[device_class] = []
-
-        unit_of_measurement_map[device_class].append(
-            entity_state.attributes[ATTR_UNIT_OF_MEASUREMENT]
-        )
-        eligible_entities[device_class].append(entity[ATTR_ENTITY_ID])
-
-    # Create aggregates
-    for device_class, entities in eligible_entities.items():
-        if len(entities) < area.feature_config(CONF_FEATURE_AGGREGATION).get(
-            CONF_AGGREGATES_MIN_ENTITIES, DEFAULT_AGGREGATES_MIN_ENTITIES
-        ):
-            continue
-
-        if device_class not in area.feature_config(CONF_FEATURE_AGGREGATION).get(
-            CONF_AGGREGATES_SENSOR_DEVICE_CLASSES,
-            DEFAULT_AGGREGATES_SENSOR_DEVICE_CLASSES,
-        ):
-            continue
-
+    for device_class, records in _get_aggregate_sensor_records(area).items():
         _LOGGER.debug(
             "%s: Creating aggregate sensor for device_class '%s' with %d entities",
             area.slug,
             device_class,
-            len(entities),
+            len(records),
         )
 
         try:
             # Infer most-popular unit of measurement
-            unit_of_measurements = Counter(unit_of_measurement_map[device_class])
+            unit_of_measurements = Counter(record.unit for record in records)
             most_common_unit_of_measurement = unit_of_measurements.most_common(1)[0][0]
 
             aggregates.append(
                 AreaAggregateSensor(
                     area=area,
                     device_class=device_class,
-                    entity_ids=entities,
+                    entity_ids=[record.entity_id for record in records],
                     unit_of_measurement=most_common_unit_of_measurement,
                 )
             )
@@ -152,6 +101,67 @@ def create_aggregate_sensors(area: MagicArea) -> list[Entity]:
     return aggregates
 
 
+def get_aggregate_sensor_members(area: MagicArea) -> dict[str, list[str]]:
+    """Return the members of the area's aggregate sensors by device class."""
+    return {
+        device_class: [record.entity_id for record in records]
+        for device_class, records in _get_aggregate_sensor_records(area).items()
+    }
+
+
+def _get_aggregate_sensor_records(
+    area: MagicArea,
+) -> dict[str, list[AreaEntityRecord]]:
+    """Return the entities to aggregate by device class."""
+
+    eligible_entities: dict[str, list[AreaEntityRecord]] = {}
+
+    if SENSOR_DOMAIN not in area.entities:
+        return {}
+
+    if not area.has_feature(CONF_FEATURE_AGGREGATION):
+        return {}
+
+    for device_class, entities in area.get_entities_by_device_class(
+        SENSOR_DOMAIN
+    ).items():
+        for entity in entities:
+            if not device_class:
+                _LOGGER.debug(
+                    "Entity %s does not have device_class defined",
+                    entity.entity_id,
+                )
+                continue
+
+            if not entity.unit:
+                _LOGGER.debug(
+                    "Entity %s does not have unit_of_measurement defined",
+                    entity.entity_id,
+                )
+                continue
+
+            # Dictionary of sensors by device class.
+            eligible_entities.setdefault(device_class, []).append(entity)
+
+    aggregated_entities: dict[str, list[AreaEntityRecord]] = {}
+
+    for device_class, entities in eligible_entities.items():
+        if len(entities) < area.feature_config(CONF_FEATURE_AGGREGATION).get(
+            CONF_AGGREGATES_MIN_ENTITIES, DEFAULT_AGGREGATES_MIN_ENTITIES
+        ):
+            continue
+
+        if device_class not in area.feature_config(CONF_FEATURE_AGGREGATION).get(
+            CONF_AGGREGATES_SENSOR_DEVICE_CLASSES,
+            DEFAULT_AGGREGATES_SENSOR_DEVICE_CLASSES,
+        ):
+            continue
+
+        aggregated_entities[device_class] = entities
+
+    return aggregated_entities
+
+
 class AreaAggregateSensor(AreaSensorGroupSensor):
     """Aggregate sensor for the area."""
 
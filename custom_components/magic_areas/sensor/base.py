@@ -1,6 +1,7 @@
 """Base classes for sensor component."""
 
 import logging
+import time
 
 from homeassistant.components.group.sensor import ATTR_MEAN, ATTR_SUM, SensorGroup
 from homeassistant.components.sensor.const import (
@@ -8,22 +9,42 @@ from homeassistant.components.sensor.const import (
     SensorDeviceClass,
     SensorStateClass,
 )
+from homeassistant.core import CALLBACK_TYPE, HassJob, State, callback
+from homeassistant.helpers.event import async_call_later
 
-from custom_components.magic_areas.base.entities import MagicEntity
+from custom_components.magic_areas.base.entities import MagicGroupEntity
 from custom_components.magic_areas.base.magic import MagicArea
 from custom_components.magic_areas.const import (
     AGGREGATE_MODE_SUM,
     AGGREGATE_MODE_TOTAL_INCREASING_SENSOR,
     AGGREGATE_MODE_TOTAL_SENSOR,
+    CONF_AGGREGATES_MAX_STALENESS,
+    CONF_AGGREGATES_MIN_PUBLISH_INTERVAL,
+    CONF_AGGREGATES_PUBLISH_DELTA,
+    CONF_FEATURE_AGGREGATION,
+    DEFAULT_AGGREGATES_MAX_STALENESS,
+    DEFAULT_AGGREGATES_MIN_PUBLISH_INTERVAL,
+    DEFAULT_AGGREGATES_PUBLISH_DELTA,
     DEFAULT_SENSOR_PRECISION,
     EMPTY_STRING,
 )
+from custom_components.magic_areas.helpers.aggregate import (
+    PublishPolicy,
+    RunningAggregate,
+    normalize_state_value,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class AreaSensorGroupSensor(MagicEntity, SensorGroup):
-    """Sensor for the magic area, group sensor with all the stuff in it."""
+class AreaSensorGroupSensor(MagicGroupEntity, SensorGroup):
+    """Sensor for the magic area, group sensor with all the stuff in it.
+
+    The group's value is kept as a running aggregate updated from the
+    member that changed, instead of recomputing it over all members.
+    State writes are rate limited according to the aggregates feature's
+    publishing options.
+    """
 
     def __init__(
         self,
@@ -34,7 +55,7 @@ class AreaSensorGroupSensor(MagicEntity, SensorGroup):
     ) -> None:
         """Initialize an area sensor group sensor."""
 
-        MagicEntity.__init__(
+        MagicGroupEntity.__init__(
             self, area=area, domain=SENSOR_DOMAIN, translation_key=device_class
         )
 
@@ -61,16 +82,103 @@ class AreaSensorGroupSensor(MagicEntity, SensorGroup):
         elif device_class in AGGREGATE_MODE_TOTAL_SENSOR:
             state_class = SensorStateClass.TOTAL
 
+        self._aggregate = RunningAggregate()
+        self._aggregate_sum = device_class in AGGREGATE_MODE_SUM
+        self._aggregate_unit = final_unit_of_measurement
+
+        aggregates_config = area.feature_config(CONF_FEATURE_AGGREGATION)
+        self._publish_policy = PublishPolicy(
+            min_interval=aggregates_config.get(
+                CONF_AGGREGATES_MIN_PUBLISH_INTERVAL,
+                DEFAULT_AGGREGATES_MIN_PUBLISH_INTERVAL,
+            ),
+            delta_percent=aggregates_config.get(
+                CONF_AGGREGATES_PUBLISH_DELTA, DEFAULT_AGGREGATES_PUBLISH_DELTA
+            ),
+            max_staleness=aggregates_config.get(
+                CONF_AGGREGATES_MAX_STALENESS, DEFAULT_AGGREGATES_MAX_STALENESS
+            ),
+        )
+        self._cancel_publish: CALLBACK_TYPE | None = None
+        self._publish_job = HassJob(self._async_publish, cancel_on_shutdown=True)
+
         SensorGroup.__init__(
             self,
             hass=area.hass,
             device_class=sensor_device_class,
             entity_ids=entity_ids,
             ignore_non_numeric=True,
-            sensor_type=ATTR_SUM if device_class in AGGREGATE_MODE_SUM else ATTR_MEAN,
+            sensor_type=ATTR_SUM if self._aggregate_sum else ATTR_MEAN,
             state_class=state_class,
             unit_of_measurement=final_unit_of_measurement,
             name=EMPTY_STRING,
             unique_id=self._attr_unique_id,
         )
         delattr(self, "_attr_name")
+
+    @callback
+    def async_update_supported_features(
+        self, entity_id: str, new_state: State | None
+    ) -> None:
+        """Apply a member's new value to the running aggregate."""
+        super().async_update_supported_features(entity_id, new_state)
+
+        self._aggregate.update(
+            entity_id,
+            normalize_state_value(new_state, self.device_class, self._aggregate_unit),
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Cancel pending publishes on removal."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_publish)
+
+    @property
+    def _aggregate_value(self) -> float | None:
+        """Return the current aggregate value, None without numeric members."""
+        if not self._aggregate.count:
+            return None
+        if self._aggregate_sum:
+            return self._aggregate.sum
+        return self._aggregate.mean
+
+    @callback
+    def async_update_group_state(self) -> None:
+        """Update the state from the running aggregate."""
+
+        # Unavailable if no member has a numeric value
+        self._attr_available = self._aggregate.count > 0
+        self._attr_native_value = self._aggregate_value
+
+    @callback
+    def async_defer_or_update_ha_state(self) -> None:
+        """Publish member changes according to the publish policy."""
+        if not self.hass.is_running:
+            return
+        self._async_publish()
+
+    @callback
+    def _async_publish(self, *args) -> None:
+        """Publish the aggregate if due, check again later otherwise."""
+
+        self._async_cancel_publish()
+
+        value = self._aggregate_value
+        now = time.monotonic()
+
+        if not self._publish_policy.is_due(value, now):
+            if (delay := self._publish_policy.next_check(now)) is not None:
+                self._cancel_publish = async_call_later(
+                    self.hass, delay, self._publish_job
+                )
+            return
+
+        self.async_update_group_state()
+        self.async_write_ha_state()
+        self._publish_policy.published(value, now)
+
+    @callback
+    def _async_cancel_publish(self) -> None:
+        if self._cancel_publish:
+            self._cancel_publish()
+            self._cancel_publish = None
@@ -90,3 +90,23 @@ class LightControlSwitch(SwitchBase):
 
     feature_info = MagicAreasFeatureInfoLightGroups()
     _attr_entity_category = EntityCategory.CONFIG
+
+    async def async_added_to_hass(self) -> None:
+        """Restore state and share it with the area's light groups."""
+        await super().async_added_to_hass()
+        self.area.light_control = bool(self._attr_is_on)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Disable light control when the switch goes away."""
+        await super().async_will_remove_from_hass()
+        self.area.light_control = False
+
+    async def async_turn_on(self, **kwargs) -> None:
+        """Enable light control."""
+        await super().async_turn_on(**kwargs)
+        self.area.light_control = True
+
+    async def async_turn_off(self, **kwargs) -> None:
+        """Disable light control."""
+        await super().async_turn_off(**kwargs)
+        self.area.light_control = False
@@ -3,11 +3,11 @@
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.components.switch.const import DOMAIN as SWITCH_DOMAIN
 from homeassistant.const import STATE_OFF, STATE_ON
-from homeassistant.helpers.event import async_call_later
 
 from custom_components.magic_areas.base.entities import MagicEntity
 from custom_components.magic_areas.base.magic import MagicArea
 from custom_components.magic_areas.const import ONE_MINUTE
+from custom_components.magic_areas.helpers.timer import async_schedule_timer
 
 
 class SwitchBase(MagicEntity, SwitchEntity):
@@ -80,7 +80,7 @@ class ResettableSwitchBase(SwitchBase):
         self.schedule_update_ha_state()
 
         if self.timeout and not self._timeout_callback:
-            self._timeout_callback = async_call_later(
+            self._timeout_callback = async_schedule_timer(
                 self.hass, self.timeout * ONE_MINUTE, self._timeout_turn_off
             )
 
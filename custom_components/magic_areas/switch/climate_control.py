@@ -27,6 +27,7 @@ from custom_components.magic_areas.const import (
     MagicAreasFeatures,
 )
 from custom_components.magic_areas.switch.base import SwitchBase
+from custom_components.magic_areas.util import area_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,7 +84,9 @@ class ClimateControlSwitch(SwitchBase):
 
         self.async_on_remove(
             async_dispatcher_connect(
-                self.hass, MagicAreasEvents.AREA_STATE_CHANGED, self.area_state_changed
+                self.hass,
+                area_signal(MagicAreasEvents.AREA_STATE_CHANGED, self.area.id),
+                self.area_state_changed,
             )
         )
 
@@ -94,15 +97,6 @@ class ClimateControlSwitch(SwitchBase):
             self.logger.debug("%s: Control disabled. Skipping.", self.name)
             return
 
-        if area_id != self.area.id:
-            _LOGGER.debug(
-                "%s: Area state change event not for us. Skipping. (event: %s/self: %s)",
-                self.name,
-                area_id,
-                self.area.id,
-            )
-            return
-
         priority_states: list[str] = [
             AreaStates.SLEEP,
             AreaStates.EXTENDED,
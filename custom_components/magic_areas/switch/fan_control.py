@@ -29,6 +29,7 @@ from custom_components.magic_areas.const import (
     MagicAreasFeatures,
 )
 from custom_components.magic_areas.switch.base import SwitchBase
+from custom_components.magic_areas.util import area_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ class FanControlSwitch(SwitchBase):
 
     setpoint: float = 0.0
     tracked_entity_id: str
+    required_state: str
 
     def __init__(self, area: MagicArea) -> None:
         """Initialize the Fan control switch."""
@@ -61,13 +63,19 @@ class FanControlSwitch(SwitchBase):
             )
         )
 
+        self.required_state = self.area.feature_config(
+            MagicAreasFeatures.FAN_GROUPS
+        ).get(CONF_FAN_GROUPS_REQUIRED_STATE, DEFAULT_FAN_GROUPS_REQUIRED_STATE)
+
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
         await super().async_added_to_hass()
 
         self.async_on_remove(
             async_dispatcher_connect(
-                self.hass, MagicAreasEvents.AREA_STATE_CHANGED, self.area_state_changed
+                self.hass,
+                area_signal(MagicAreasEvents.AREA_STATE_CHANGED, self.area.id),
+                self.area_state_changed,
             )
         )
         self.async_on_remove(
@@ -88,15 +96,6 @@ class FanControlSwitch(SwitchBase):
     async def area_state_changed(self, area_id, states_tuple):
         """Handle area state change event."""
 
-        if area_id != self.area.id:
-            _LOGGER.debug(
-                "%s: Area state change event not for us. Skipping. (event: %s/self: %s)",
-                self.name,
-                area_id,
-                self.area.id,
-            )
-            return
-
         # pylint: disable-next=unused-variable
         new_states, lost_states = states_tuple
         await self.run_logic(states=new_states)
@@ -119,16 +118,14 @@ class FanControlSwitch(SwitchBase):
             )
             return
 
-        required_state = self.area.feature_config(MagicAreasFeatures.FAN_GROUPS).get(
-            CONF_FAN_GROUPS_REQUIRED_STATE, DEFAULT_FAN_GROUPS_REQUIRED_STATE
-        )
+        required_state = self.required_state
 
         if required_state not in states:
             _LOGGER.debug(
                 "%s: Area not in required state '%s' (states: %s)",
                 self.name,
                 required_state,
-                str(states),
+                states,
             )
             return
 
@@ -13,6 +13,7 @@ from custom_components.magic_areas.const import (
     MagicAreasFeatureInfoMediaPlayerGroups,
 )
 from custom_components.magic_areas.switch.base import SwitchBase
+from custom_components.magic_areas.util import area_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,7 +39,9 @@ class MediaPlayerControlSwitch(SwitchBase):
 
         self.async_on_remove(
             async_dispatcher_connect(
-                self.hass, MagicAreasEvents.AREA_STATE_CHANGED, self.area_state_changed
+                self.hass,
+                area_signal(MagicAreasEvents.AREA_STATE_CHANGED, self.area.id),
+                self.area_state_changed,
             )
         )
 
@@ -49,15 +52,6 @@ class MediaPlayerControlSwitch(SwitchBase):
             self.logger.debug("%s: Control disabled. Skipping.", self.name)
             return
 
-        if area_id != self.area.id:
-            _LOGGER.debug(
-                "%s: Area state change event not for us. Skipping. (event: %s/self: %s)",
-                self.name,
-                area_id,
-                self.area.id,
-            )
-            return
-
         # pylint: disable-next=unused-variable
         new_states, lost_states = states_tuple
 
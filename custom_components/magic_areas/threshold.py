@@ -1,18 +1,24 @@
 """Platform file for Magic Areas threhsold sensors."""
 
+from collections.abc import Callable
 import logging
 
 from homeassistant.components.binary_sensor import (
     DOMAIN as BINARY_SENSOR_DOMAIN,
     BinarySensorDeviceClass,
+    BinarySensorEntity,
 )
-from homeassistant.components.sensor.const import (
-    DOMAIN as SENSOR_DOMAIN,
-    SensorDeviceClass,
+from homeassistant.components.sensor.const import SensorDeviceClass
+from homeassistant.components.threshold.const import ATTR_HYSTERESIS, ATTR_UPPER
+from homeassistant.const import ATTR_ENTITY_ID, LIGHT_LUX
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
 )
-from homeassistant.components.threshold.binary_sensor import ThresholdSensor
-from homeassistant.const import ATTR_DEVICE_CLASS
-from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.entity import Entity
 
 from custom_components.magic_areas.base.entities import MagicEntity
@@ -20,20 +26,22 @@ from custom_components.magic_areas.base.magic import MagicArea
 from custom_components.magic_areas.const import (
     CONF_AGGREGATES_ILLUMINANCE_THRESHOLD,
     CONF_AGGREGATES_ILLUMINANCE_THRESHOLD_HYSTERESIS,
-    CONF_AGGREGATES_SENSOR_DEVICE_CLASSES,
     CONF_FEATURE_AGGREGATION,
     DEFAULT_AGGREGATES_ILLUMINANCE_THRESHOLD,
     DEFAULT_AGGREGATES_ILLUMINANCE_THRESHOLD_HYSTERESIS,
-    DEFAULT_AGGREGATES_SENSOR_DEVICE_CLASSES,
-    EMPTY_STRING,
     MagicAreasFeatureInfoThrehsold,
 )
+from custom_components.magic_areas.helpers.aggregate import (
+    RunningAggregate,
+    normalize_state_value,
+)
+from custom_components.magic_areas.sensor import get_aggregate_sensor_members
 
 _LOGGER = logging.getLogger(__name__)
 
 
 def create_illuminance_threshold(hass: HomeAssistant, area: MagicArea) -> Entity | None:
-    """Create threhsold light binary sensor based off illuminance aggregate."""
+    """Create threhsold light binary sensor based off illuminance sensors."""
 
     if not area.has_feature(CONF_FEATURE_AGGREGATION):
         return None
@@ -45,22 +53,7 @@ def create_illuminance_threshold(hass: HomeAssistant, area: MagicArea) -> Entity
     if illuminance_threshold == 0:
         return None
 
-    if SensorDeviceClass.ILLUMINANCE not in area.feature_config(
-        CONF_FEATURE_AGGREGATION
-    ).get(
-        CONF_AGGREGATES_SENSOR_DEVICE_CLASSES, DEFAULT_AGGREGATES_SENSOR_DEVICE_CLASSES
-    ):
-        return None
-
-    if SENSOR_DOMAIN not in area.entities:
-        return None
-
-    illuminance_sensors = [
-        sensor
-        for sensor in area.entities[SENSOR_DOMAIN]
-        if ATTR_DEVICE_CLASS in sensor
-        and sensor[ATTR_DEVICE_CLASS] == SensorDeviceClass.ILLUMINANCE
-    ]
+    illuminance_sensors = get_illuminance_threshold_sensors(area)
 
     if not illuminance_sensors:
         return None
@@ -78,10 +71,6 @@ def create_illuminance_threshold(hass: HomeAssistant, area: MagicArea) -> Entity
             illuminance_threshold_hysteresis_percentage / 100
         )
 
-    illuminance_aggregate_entity_id = (
-        f"{SENSOR_DOMAIN}.magic_areas_aggregates_{area.slug}_aggregate_illuminance"
-    )
-
     _LOGGER.debug(
         "Creating illuminance threhsold sensor for area '%s': Threhsold: %d, Hysteresis: %d (%d%%)",
         area.slug,
@@ -95,7 +84,7 @@ def create_illuminance_threshold(hass: HomeAssistant, area: MagicArea) -> Entity
             hass=hass,
             area=area,
             device_class=BinarySensorDeviceClass.LIGHT,
-            entity_id=illuminance_aggregate_entity_id,
+            entity_ids=illuminance_sensors,
             upper=illuminance_threshold,
             hysteresis=illuminance_threshold_hysteresis,
         )
@@ -108,8 +97,31 @@ def create_illuminance_threshold(hass: HomeAssistant, area: MagicArea) -> Entity
         return None
 
 
-class AreaThresholdSensor(MagicEntity, ThresholdSensor):
-    """Threshold sensor based off aggregates."""
+def get_illuminance_threshold_sensors(area: MagicArea) -> list[str]:
+    """Return the illuminance sensors for the area's threshold sensor.
+
+    Empty if the area shouldn't have a threshold sensor.
+    """
+
+    if not area.has_feature(CONF_FEATURE_AGGREGATION):
+        return []
+
+    if not area.feature_config(CONF_FEATURE_AGGREGATION).get(
+        CONF_AGGREGATES_ILLUMINANCE_THRESHOLD, DEFAULT_AGGREGATES_ILLUMINANCE_THRESHOLD
+    ):
+        return []
+
+    # Same sensors as the illuminance aggregate, minimum count and units included
+    return get_aggregate_sensor_members(area).get(SensorDeviceClass.ILLUMINANCE, [])
+
+
+class AreaThresholdSensor(MagicEntity, BinarySensorEntity):
+    """Threshold sensor based off the area's illuminance sensors.
+
+    Member readings are folded into a running mean as they change, so the
+    threshold reacts to the sensors directly instead of waiting on the
+    aggregate sensor's state. State is only written when it flips.
+    """
 
     feature_info = MagicAreasFeatureInfoThrehsold()
 
@@ -119,25 +131,123 @@ class AreaThresholdSensor(MagicEntity, ThresholdSensor):
         hass: HomeAssistant,
         area: MagicArea,
         device_class: BinarySensorDeviceClass,
-        entity_id: str,
-        upper: int | None = None,
-        lower: int | None = None,
-        hysteresis: int = 0,
+        entity_ids: list[str],
+        upper: float,
+        hysteresis: float = 0,
     ) -> None:
-        """Initialize an area sensor group binary sensor."""
+        """Initialize an area threshold binary sensor."""
 
         MagicEntity.__init__(
             self, area, domain=BINARY_SENSOR_DOMAIN, translation_key=device_class
         )
-        ThresholdSensor.__init__(
-            self,
-            hass=hass,
-            entity_id=entity_id,
-            name=EMPTY_STRING,
-            unique_id=self.unique_id,
-            lower=lower,
-            upper=upper,
-            hysteresis=hysteresis,
-            device_class=device_class,
+        BinarySensorEntity.__init__(self)
+
+        self._entity_ids = entity_ids
+        self._upper = upper
+        self._hysteresis = hysteresis
+        self._aggregate = RunningAggregate()
+        self._remove_listener: Callable[[], None] | None = None
+
+        self._attr_device_class = device_class
+        self._attr_is_on: bool | None = None
+        self._attr_extra_state_attributes = {
+            ATTR_ENTITY_ID: self._entity_ids,
+            ATTR_UPPER: upper,
+            ATTR_HYSTERESIS: hysteresis,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Call to add the system to hass."""
+        await super().async_added_to_hass()
+
+        self._track_sensors()
+        self.async_on_remove(self._untrack_sensors)
+
+        self._update_state()
+
+    @callback
+    def async_update_sensors(self) -> None:
+        """Reload illuminance sensors from the area and re-evaluate in place."""
+
+        entity_ids = get_illuminance_threshold_sensors(self.area)
+
+        if entity_ids == self._entity_ids:
+            return
+
+        self._entity_ids = entity_ids
+        self._attr_extra_state_attributes[ATTR_ENTITY_ID] = entity_ids
+
+        # Not added yet, listeners will pick up the new list
+        if self.hass is None:
+            return
+
+        self._track_sensors()
+        self._update_state()
+        self.async_write_ha_state()
+
+    # Sensor tracking
+
+    @callback
+    def _track_sensors(self) -> None:
+        """Seed the aggregate and follow the illuminance sensors."""
+
+        self._untrack_sensors()
+
+        self._aggregate.clear()
+        for entity_id in self._entity_ids:
+            self._update_value(entity_id, self.hass.states.get(entity_id))
+
+        self._remove_listener = async_track_state_change_event(
+            self.hass, self._entity_ids, self._sensor_state_change
         )
-        delattr(self, "_attr_name")
+
+    @callback
+    def _untrack_sensors(self) -> None:
+        """Stop following the illuminance sensors."""
+        if self._remove_listener:
+            self._remove_listener()
+            self._remove_listener = None
+
+    @callback
+    def _sensor_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Fold a sensor change into the aggregate and re-evaluate."""
+
+        self._update_value(event.data["entity_id"], event.data["new_state"])
+
+        if self._update_state():
+            self.async_write_ha_state()
+
+    def _update_value(self, entity_id: str, state: State | None) -> None:
+        """Set a sensor's value in the aggregate."""
+        self._aggregate.update(
+            entity_id,
+            normalize_state_value(state, SensorDeviceClass.ILLUMINANCE, LIGHT_LUX),
+        )
+
+    @callback
+    def _update_state(self) -> bool:
+        """Apply the threshold to the aggregate, return whether state changed."""
+
+        value = self._aggregate.mean
+        is_on = self._attr_is_on
+
+        if value is None:
+            is_on = None
+        elif value > self._upper + self._hysteresis:
+            is_on = True
+        elif value < self._upper - self._hysteresis or is_on is None:
+            is_on = False
+
+        if is_on == self._attr_is_on:
+            return False
+
+        _LOGGER.debug(
+            "%s: Illuminance threshold state change: %s -> %s (%s lx)",
+            self.area.name,
+            self._attr_is_on,
+            is_on,
+            value,
+        )
+        self._attr_is_on = is_on
+
+        return True
@@ -6,16 +6,22 @@ Small helper functions that are used more than once.
 from collections.abc import Sequence
 import logging
 
-from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_registry import async_get as entityreg_async_get
 
+from custom_components.magic_areas.base.record import AreaEntityRecord
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def area_signal(signal: str, area_id: str) -> str:
+    """Return a dispatcher signal scoped to a single area."""
+    return f"{signal}_{area_id}"
+
+
 def cleanup_removed_entries(
-    hass: HomeAssistant, entity_list: Sequence[Entity], old_ids: list[dict[str, str]]
+    hass: HomeAssistant, entity_list: Sequence[Entity], old_ids: list[AreaEntityRecord]
 ) -> None:
     """Clean up old magic entities."""
     new_ids = [entity.entity_id for entity in entity_list]
@@ -25,8 +31,8 @@ def cleanup_removed_entries(
         new_ids,
     )
     entity_registry = entityreg_async_get(hass)
-    for entity_dict in old_ids:
-        entity_id = entity_dict[ATTR_ENTITY_ID]
+    for entity in old_ids:
+        entity_id = entity.entity_id
         if entity_id in new_ids:
             continue
         _LOGGER.debug("Cleaning up old entity %s", entity_id)
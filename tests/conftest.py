@@ -52,9 +52,9 @@ async def auto_enable_custom_integrations(
 
 @pytest.fixture
 def patch_async_call_later(hass):
-    """Automatically patch async_call_later for ReusableTimer tests."""
+    """Patch async_schedule_timer to fire immediately for ReusableTimer tests."""
     with patch(
-        "custom_components.magic_areas.helpers.timer.async_call_later",
+        "custom_components.magic_areas.helpers.timer.async_schedule_timer",
         side_effect=immediate_call_factory(hass),
     ):
         yield
@@ -393,7 +393,7 @@ def assert_in_attribute(
 
 
 def immediate_call_factory(hass, callback_key="callback"):
-    """Return a side_effect function for patching async_call_later that fires immediately but respects cancel."""
+    """Return a side_effect function for patching async_schedule_timer that fires immediately but respects cancel."""
 
     def immediate_call(hass_arg, delay_arg, callback_arg):
         canceled = False
@@ -0,0 +1,183 @@
+"""Test the incremental aggregation helpers."""
+
+import math
+import random
+
+from homeassistant.components.sensor.const import SensorDeviceClass
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    UnitOfPower,
+    UnitOfTemperature,
+)
+from homeassistant.core import State
+
+from custom_components.magic_areas.helpers.aggregate import (
+    BinaryStateCounter,
+    PublishPolicy,
+    RunningAggregate,
+    normalize_state_value,
+)
+
+# Tests
+
+
+def test_running_aggregate_applies_deltas() -> None:
+    """Test member updates, removals and non-numeric values."""
+
+    aggregate = RunningAggregate()
+    assert aggregate.count == 0
+    assert aggregate.mean is None
+
+    aggregate.update("sensor.a", 10.0)
+    aggregate.update("sensor.b", 20.0)
+    assert aggregate.count == 2
+    assert aggregate.sum == 30.0
+    assert aggregate.mean == 15.0
+
+    # Changed value
+    aggregate.update("sensor.a", 16.0)
+    assert aggregate.sum == 36.0
+
+    # Became unavailable
+    aggregate.update("sensor.b", None)
+    assert aggregate.count == 1
+    assert aggregate.mean == 16.0
+
+    aggregate.clear()
+    assert aggregate.count == 0
+    assert aggregate.sum == 0.0
+
+
+def test_running_aggregate_matches_full_recomputation() -> None:
+    """Test the running sum doesn't drift from the actual sum."""
+
+    rng = random.Random(1234)
+    members = [f"sensor.power_{i}" for i in range(300)]
+    values: dict[str, float] = {}
+    aggregate = RunningAggregate()
+
+    for _ in range(20000):
+        member = rng.choice(members)
+        value = None if rng.random() < 0.05 else rng.uniform(0, 3000)
+        aggregate.update(member, value)
+        if value is None:
+            values.pop(member, None)
+        else:
+            values[member] = value
+
+    assert aggregate.count == len(values)
+    assert math.isclose(aggregate.sum, math.fsum(values.values()), rel_tol=1e-9)
+
+
+def test_normalize_state_value() -> None:
+    """Test member states are parsed and converted to the group unit."""
+
+    celsius = {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS}
+    fahrenheit = {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.FAHRENHEIT}
+
+    assert (
+        normalize_state_value(
+            State("sensor.t", "21.5", celsius),
+            SensorDeviceClass.TEMPERATURE,
+            UnitOfTemperature.CELSIUS,
+        )
+        == 21.5
+    )
+    converted = normalize_state_value(
+        State("sensor.t", "212", fahrenheit),
+        SensorDeviceClass.TEMPERATURE,
+        UnitOfTemperature.CELSIUS,
+    )
+    assert converted is not None
+    assert math.isclose(converted, 100.0)
+
+    # Unavailable, non-numeric, missing
+    assert (
+        normalize_state_value(
+            State("sensor.t", STATE_UNAVAILABLE, celsius),
+            SensorDeviceClass.TEMPERATURE,
+            UnitOfTemperature.CELSIUS,
+        )
+        is None
+    )
+    assert (
+        normalize_state_value(
+            State("sensor.t", "nan", celsius),
+            SensorDeviceClass.TEMPERATURE,
+            UnitOfTemperature.CELSIUS,
+        )
+        is None
+    )
+    assert normalize_state_value(None, None, None) is None
+
+    # Units that can't be converted
+    assert (
+        normalize_state_value(
+            State("sensor.p", "5", {ATTR_UNIT_OF_MEASUREMENT: UnitOfPower.WATT}),
+            SensorDeviceClass.TEMPERATURE,
+            UnitOfTemperature.CELSIUS,
+        )
+        is None
+    )
+
+
+def test_binary_state_counter() -> None:
+    """Test member state counts follow each member's transitions."""
+
+    counter = BinaryStateCounter()
+
+    counter.update("binary_sensor.a", STATE_ON)
+    counter.update("binary_sensor.b", STATE_OFF)
+    counter.update("binary_sensor.c", STATE_UNAVAILABLE)
+    assert (counter.present, counter.on, counter.unavailable) == (3, 1, 1)
+
+    # Repeated state doesn't count twice
+    counter.update("binary_sensor.a", STATE_ON)
+    assert counter.on == 1
+
+    counter.update("binary_sensor.c", STATE_UNKNOWN)
+    assert (counter.unavailable, counter.unknown, counter.invalid) == (0, 1, 1)
+
+    counter.update("binary_sensor.a", STATE_OFF)
+    counter.update("binary_sensor.c", None)
+    assert (counter.present, counter.on, counter.invalid) == (2, 0, 0)
+
+
+def test_publish_policy_disabled() -> None:
+    """Test every change is published without settings."""
+
+    policy = PublishPolicy()
+    assert policy.is_due(100.0, 0)
+    policy.published(100.0, 0)
+
+    assert not policy.is_due(100.0, 0)
+    assert policy.is_due(100.1, 0)
+    assert policy.next_check(0) is None
+
+
+def test_publish_policy_rate_limits() -> None:
+    """Test interval, delta and staleness settings."""
+
+    policy = PublishPolicy(min_interval=5, delta_percent=10, max_staleness=60)
+    policy.published(100.0, 0)
+
+    # Within the minimum interval
+    assert not policy.is_due(200.0, 1)
+    assert policy.next_check(1) == 4
+
+    # Significant change after the interval
+    assert policy.is_due(200.0, 5)
+
+    # Below the delta, held back until stale
+    assert not policy.is_due(105.0, 10)
+    assert policy.next_check(10) == 50
+    assert policy.is_due(105.0, 60)
+
+    # Becoming unavailable is always published
+    assert policy.is_due(None, 1)
+    policy.published(None, 1)
+    assert policy.is_due(100.0, 2)
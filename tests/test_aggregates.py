@@ -27,6 +27,8 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 
 from custom_components.magic_areas.const import (
+    ATTR_ON_COUNT,
+    ATTR_TOTAL,
     CONF_AGGREGATES_MIN_ENTITIES,
     CONF_ENABLED_FEATURES,
     CONF_FEATURE_AGGREGATION,
@@ -206,13 +208,24 @@ async def test_aggregates_binary_sensor_regular(
         hass.states.async_set(mock_entity.entity_id, STATE_ON)
     await hass.async_block_till_done()
 
+    member_count = len(entities_binary_sensor_motion_multiple)
+    aggregate_sensor_state = hass.states.get(aggregate_sensor_id)
+    assert aggregate_sensor_state is not None
+    assert aggregate_sensor_state.attributes[ATTR_ON_COUNT] == member_count
+    assert aggregate_sensor_state.attributes[ATTR_TOTAL] == member_count
+
     # Turn all off and ensure only off when last off
     for entity_index, mock_entity in enumerate(entities_binary_sensor_motion_multiple):
-        last_sensor = entity_index == (len(entities_binary_sensor_motion_multiple) - 1)
+        last_sensor = entity_index == (member_count - 1)
         hass.states.async_set(mock_entity.entity_id, STATE_OFF)
         await hass.async_block_till_done()
         aggregate_sensor_state = hass.states.get(aggregate_sensor_id)
         assert_state(aggregate_sensor_state, STATE_OFF if last_sensor else STATE_ON)
+        assert aggregate_sensor_state is not None
+        assert (
+            aggregate_sensor_state.attributes[ATTR_ON_COUNT]
+            == member_count - entity_index - 1
+        )
 
 
 async def test_aggregates_binary_sensor_all(
@@ -0,0 +1,163 @@
+"""Test the warm-start area cache."""
+
+from datetime import timedelta
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_registry import (
+    RegistryEntry,
+    async_get as async_get_er,
+)
+from homeassistant.util import dt as dt_util
+
+from custom_components.magic_areas.base.record import AreaEntityRecord
+from custom_components.magic_areas.const import (
+    AREA_CACHE_SAVE_DELAY,
+    AREA_CACHE_STORAGE_KEY,
+    AREA_CACHE_STORAGE_VERSION,
+)
+from custom_components.magic_areas.helpers.cache import (
+    AreaCache,
+    registry_fingerprint,
+)
+
+# Constants
+
+AREA_ID = "kitchen"
+ENTITY_ID = "sensor.kitchen_temperature"
+OTHER_ENTITY_ID = "sensor.kitchen_pressure"
+
+# Helpers
+
+
+def make_registry_entry(
+    hass: HomeAssistant, entity_id: str, **kwargs: Any
+) -> RegistryEntry:
+    """Create a registry entry for a fake entity."""
+    domain, object_id = entity_id.split(".")
+    return async_get_er(hass).async_get_or_create(
+        domain, "test", object_id, suggested_object_id=object_id, **kwargs
+    )
+
+
+# Tests
+
+
+async def test_cached_records_follow_fingerprint(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test cached records are only returned for a matching fingerprint."""
+
+    entity_registry = async_get_er(hass)
+    entries = [make_registry_entry(hass, ENTITY_ID)]
+    fingerprint = registry_fingerprint(entries)
+
+    hass_storage[AREA_CACHE_STORAGE_KEY] = {
+        "version": AREA_CACHE_STORAGE_VERSION,
+        "key": AREA_CACHE_STORAGE_KEY,
+        "data": {
+            AREA_ID: {
+                "fingerprint": fingerprint,
+                "entities": [[ENTITY_ID, "temperature", "°C", None]],
+            }
+        },
+    }
+
+    cache = AreaCache(hass)
+    await cache.async_load()
+
+    records = cache.async_get_records(AREA_ID, fingerprint)
+    assert records[ENTITY_ID].domain == "sensor"
+    assert records[ENTITY_ID].device_class == "temperature"
+    assert records[ENTITY_ID].unit == "°C"
+
+    # Any registry change invalidates the area's cache
+    freezer.tick(timedelta(seconds=1))
+    updated = [entity_registry.async_update_entity(ENTITY_ID, name="Temperature")]
+    assert cache.async_get_records(AREA_ID, registry_fingerprint(updated)) == {}
+
+
+async def test_cache_is_saved(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test updated areas are written to storage."""
+
+    cache = AreaCache(hass)
+    await cache.async_load()
+
+    hass.states.async_set(ENTITY_ID, "21")
+    cache.async_update_area(
+        AREA_ID,
+        "fingerprint",
+        [AreaEntityRecord(hass, ENTITY_ID, "sensor", "temperature", "°C")],
+    )
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=AREA_CACHE_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert hass_storage[AREA_CACHE_STORAGE_KEY]["data"] == {
+        AREA_ID: {
+            "fingerprint": "fingerprint",
+            "entities": [[ENTITY_ID, "temperature", "°C", None]],
+        }
+    }
+
+
+async def test_cache_follows_live_states(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test a restart with a changed live state updates the cached record."""
+
+    entries = [
+        make_registry_entry(hass, ENTITY_ID),
+        make_registry_entry(hass, OTHER_ENTITY_ID, original_device_class="pressure"),
+    ]
+    fingerprint = registry_fingerprint(entries)
+
+    hass_storage[AREA_CACHE_STORAGE_KEY] = {
+        "version": AREA_CACHE_STORAGE_VERSION,
+        "key": AREA_CACHE_STORAGE_KEY,
+        "data": {
+            AREA_ID: {
+                "fingerprint": fingerprint,
+                "entities": [[ENTITY_ID, "temperature", "°C", None]],
+            }
+        },
+    }
+
+    cache = AreaCache(hass)
+    await cache.async_load()
+
+    # The entity now reports a different device class than cached
+    hass.states.async_set(
+        ENTITY_ID,
+        "40",
+        {ATTR_DEVICE_CLASS: "humidity", ATTR_UNIT_OF_MEASUREMENT: "%"},
+    )
+    records = [
+        AreaEntityRecord.from_entity_id(hass, entry.entity_id, entry)
+        for entry in entries
+    ]
+    assert records[0].device_class == "humidity"
+
+    cache.async_update_area(AREA_ID, fingerprint, records)
+
+    cached = cache.async_get_records(AREA_ID, fingerprint)
+    assert cached[ENTITY_ID].device_class == "humidity"
+    assert cached[ENTITY_ID].unit == "%"
+
+    # Records built from the registry alone aren't cached
+    assert OTHER_ENTITY_ID not in cached
+
+    # Cached records of entities without a state yet are kept
+    hass.states.async_remove(ENTITY_ID)
+    cache.async_update_area(AREA_ID, fingerprint, records)
+    assert cache.async_get_records(AREA_ID, fingerprint)[ENTITY_ID].unit == "%"
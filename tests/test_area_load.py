@@ -0,0 +1,176 @@
+"""Test loading entities into an area."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_registry import (
+    RegistryEntry,
+    async_get as async_get_er,
+)
+
+from custom_components.magic_areas.base.magic import MagicArea
+from custom_components.magic_areas.base.record import AreaEntityRecord
+from custom_components.magic_areas.const import DATA_AREA_OBJECT, MODULE_DATA
+
+from tests.const import DEFAULT_MOCK_AREA
+
+_LOGGER = logging.getLogger(__name__)
+
+# Constants
+
+AREA_SIZES = [1000, 10000]
+
+# Helpers
+
+
+def get_default_area(hass: HomeAssistant) -> MagicArea:
+    """Return the area object for the default mock area."""
+    for entry_data in hass.data[MODULE_DATA].values():
+        area: MagicArea = entry_data[DATA_AREA_OBJECT]
+        if area.id == DEFAULT_MOCK_AREA.value:
+            return area
+    raise AssertionError("Default area not loaded")
+
+
+def make_registry_entries(hass: HomeAssistant, count: int) -> list[RegistryEntry]:
+    """Create registry entries for fake sensors."""
+    entity_registry = async_get_er(hass)
+    return [
+        entity_registry.async_get_or_create(
+            "sensor", "test", f"load_test_{i}", suggested_object_id=f"load_test_{i}"
+        )
+        for i in range(count)
+    ]
+
+
+def load_fresh(area: MagicArea, entity_list: list[RegistryEntry]) -> None:
+    """Load an entity list into a fresh area."""
+    area.reset_entities()
+    area.load_entity_list(entity_list)
+
+
+# Tests
+
+
+async def test_load_entity_list_deduplicates(
+    hass: HomeAssistant, _setup_integration_basic
+) -> None:
+    """Test entities listed more than once are only loaded once."""
+
+    area = get_default_area(hass)
+    entity_list = make_registry_entries(hass, 10)
+
+    load_fresh(area, entity_list + entity_list[:5])
+
+    assert len(area.entities["sensor"]) == 10
+    assert area.entity_ids == {entry.entity_id for entry in entity_list}
+
+
+async def test_load_entity_list_creates_records(
+    hass: HomeAssistant, _setup_integration_basic
+) -> None:
+    """Test loaded entities keep only what's needed to select them."""
+
+    area = get_default_area(hass)
+    entity_list = make_registry_entries(hass, 1)
+    entity_id = entity_list[0].entity_id
+
+    hass.states.async_set(
+        entity_id,
+        "21",
+        {
+            ATTR_DEVICE_CLASS: "temperature",
+            ATTR_UNIT_OF_MEASUREMENT: "°C",
+            "friendly_name": "Load test",
+        },
+    )
+    load_fresh(area, entity_list)
+
+    record = area.entities["sensor"][0]
+    assert isinstance(record, AreaEntityRecord)
+    assert record.entity_id == entity_id
+    assert record.domain == "sensor"
+    assert record.device_class == "temperature"
+    assert record.unit == "°C"
+    assert not hasattr(record, "__dict__")
+
+    # State is read live
+    hass.states.async_set(entity_id, "22")
+    assert record.state is not None
+    assert record.state.state == "22"
+
+
+async def test_entity_index(hass: HomeAssistant, _setup_integration_basic) -> None:
+    """Test entities can be queried by domain and device class."""
+
+    area = get_default_area(hass)
+    entity_list = make_registry_entries(hass, 3)
+
+    for entry, device_class in zip(
+        entity_list, ["temperature", "humidity", None], strict=True
+    ):
+        hass.states.async_set(
+            entry.entity_id,
+            "1",
+            {ATTR_DEVICE_CLASS: device_class} if device_class else {},
+        )
+    load_fresh(area, entity_list)
+
+    assert [
+        entity.entity_id
+        for entity in area.get_entities("sensor", ["temperature", "humidity"])
+    ] == [entity_list[0].entity_id, entity_list[1].entity_id]
+    assert [entity.entity_id for entity in area.get_entities("sensor", [None])] == [
+        entity_list[2].entity_id
+    ]
+    assert area.get_entities("light", ["temperature"]) == []
+
+    by_device_class = area.get_entities_by_device_class("sensor")
+    assert set(by_device_class) == {"temperature", "humidity", None}
+    assert area.get_entities_by_device_class("light") == {}
+
+
+@pytest.mark.parametrize("area_size", AREA_SIZES)
+async def test_load_entity_list_skips_duplicate_work(
+    hass: HomeAssistant, _setup_integration_basic, area_size: int
+) -> None:
+    """Test duplicate entities don't build records or get added again.
+
+    Work is counted rather than timed, it has to grow with the number of
+    distinct entities only, up to large areas.
+    """
+
+    area = get_default_area(hass)
+    entity_list = make_registry_entries(hass, area_size)
+
+    # Include duplicates, these used to make the load quadratic
+    with patch.object(
+        MagicArea,
+        "get_entity_record",
+        autospec=True,
+        side_effect=MagicArea.get_entity_record,
+    ) as get_entity_record:
+        load_fresh(area, entity_list + entity_list)
+
+    # One record per listed entity, the area's own entities aside
+    built = [
+        call.args[1]
+        for call in get_entity_record.call_args_list
+        if call.args[1].startswith("sensor.load_test_")
+    ]
+    assert sorted(built) == sorted(entry.entity_id for entry in entity_list)
+    assert len(area.entities["sensor"]) == area_size
+    assert len(area.entity_ids) == area_size
+
+
+async def test_setup_timings(hass: HomeAssistant, _setup_integration_basic) -> None:
+    """Test setup phases are timed."""
+
+    area = get_default_area(hass)
+
+    assert set(area.setup_timings) == {"load_entities", "platforms"}
+    assert all(duration >= 0 for duration in area.setup_timings.values())
@@ -1,25 +1,59 @@
 """Test for the logic on automatically reloading areas."""
 
 import asyncio
+from collections import Counter
 from datetime import datetime
 import logging
+from unittest.mock import patch
 
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.binary_sensor import (
+    DOMAIN as BINARY_SENSOR_DOMAIN,
+    BinarySensorDeviceClass,
+)
+from homeassistant.components.cover import CoverDeviceClass
+from homeassistant.components.cover.const import DOMAIN as COVER_DOMAIN
+from homeassistant.components.light.const import DOMAIN as LIGHT_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID, STATE_CLOSED, STATE_ON
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_registry import (
     EVENT_ENTITY_REGISTRY_UPDATED,
     _EventEntityRegistryUpdatedData_CreateRemove,
     _EventEntityRegistryUpdatedData_Update,
+    async_get as async_get_er,
 )
 
-from custom_components.magic_areas.base.magic import MagicArea
+from custom_components.magic_areas.base.magic import MagicArea, MagicMetaArea
 from custom_components.magic_areas.const import (
+    AREA_TYPE_INTERIOR,
+    CONF_AGGREGATES_MIN_ENTITIES,
+    CONF_ENABLED_FEATURES,
+    CONF_FEATURE_AGGREGATION,
+    CONF_FEATURE_COVER_GROUPS,
+    CONF_FEATURE_LIGHT_GROUPS,
+    CONF_TYPE,
     DATA_AREA_OBJECT,
+    DATA_RELOAD_COORDINATOR,
+    DOMAIN,
     MODULE_DATA,
+    AreaType,
+    MagicAreasEvents,
     MetaAreaAutoReloadSettings,
 )
-
-from tests.const import MockAreaIds
-from tests.mocks import MockBinarySensor
+from custom_components.magic_areas.helpers.reload import async_get_reload_coordinator
+
+from tests.const import MOCK_AREAS, MockAreaIds
+from tests.helpers import (
+    get_basic_config_entry_data,
+    init_integration,
+    setup_mock_entities,
+    shutdown_integration,
+)
+from tests.mocks import MockBinarySensor, MockCover, MockLight
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +76,13 @@ FLOOR_META_AREAS = [
 ]
 ALL_AREAS = NORMAL_AREAS + REGULAR_META_AREAS + FLOOR_META_AREAS
 
+# Children keep their meta areas' groups around when the kitchen's members move
+GROUP_MEMBER_AREAS = [
+    MockAreaIds.KITCHEN,
+    MockAreaIds.LIVING_ROOM,
+    MockAreaIds.BACKYARD,
+]
+
 # Helpers
 
 
@@ -70,6 +111,67 @@ def get_entry_by_area_name(hass: HomeAssistant, area_name: str) -> MagicArea | N
     return ma_data[config_entry_id][DATA_AREA_OBJECT]
 
 
+# Fixtures
+
+
+@pytest.fixture(name="group_features_config_entries")
+def mock_config_entries_group_features() -> list[MockConfigEntry]:
+    """Fixture for config entries of all areas with group features."""
+
+    config_entries: list[MockConfigEntry] = []
+    for area_entry in MockAreaIds:
+        data = get_basic_config_entry_data(area_entry)
+        data.update(
+            {
+                CONF_ENABLED_FEATURES: {
+                    CONF_FEATURE_AGGREGATION: {CONF_AGGREGATES_MIN_ENTITIES: 1},
+                    CONF_FEATURE_COVER_GROUPS: {},
+                    CONF_FEATURE_LIGHT_GROUPS: {},
+                }
+            }
+        )
+        config_entries.append(MockConfigEntry(domain=DOMAIN, data=data))
+
+    return config_entries
+
+
+@pytest.fixture(name="entities_group_members")
+async def setup_entities_group_members(
+    hass: HomeAssistant,
+) -> dict[str, dict[MockAreaIds, Entity]]:
+    """Create a light, cover and motion sensor in some areas."""
+
+    entities: dict[str, dict[MockAreaIds, Entity]] = {
+        LIGHT_DOMAIN: {},
+        COVER_DOMAIN: {},
+        BINARY_SENSOR_DOMAIN: {},
+    }
+
+    for area in GROUP_MEMBER_AREAS:
+        entities[LIGHT_DOMAIN][area] = MockLight(
+            name=f"light_{area.value}",
+            state="off",
+            unique_id=f"light_{area.value}",
+        )
+        entities[COVER_DOMAIN][area] = MockCover(
+            name=f"cover_{area.value}",
+            unique_id=f"cover_{area.value}",
+            device_class=CoverDeviceClass.BLIND.value,
+        )
+        entities[BINARY_SENSOR_DOMAIN][area] = MockBinarySensor(
+            name=f"motion_sensor_{area.value}",
+            unique_id=f"motion_sensor_{area.value}",
+            device_class=BinarySensorDeviceClass.MOTION,
+        )
+
+    for domain, area_entities in entities.items():
+        await setup_mock_entities(
+            hass, domain, {area: [entity] for area, entity in area_entities.items()}
+        )
+
+    return entities
+
+
 # Tests
 
 
@@ -99,9 +201,8 @@ async def test_reload_on_entity_area_change(
     await hass.async_block_till_done()
 
     # Sleep so we handle the reload delay
-    await asyncio.sleep(
-        MetaAreaAutoReloadSettings.DELAY * MetaAreaAutoReloadSettings.DELAY_MULTIPLIER
-    )
+    await asyncio.sleep(MetaAreaAutoReloadSettings.QUIET_WINDOW * 2)
+    await hass.async_block_till_done()
 
     # Check all areas' timestamp against the previous map
     for area in NORMAL_AREAS:
@@ -152,9 +253,8 @@ async def test_meta_reload_from_single_reload(
         assert area_object.timestamp == area_timestamp_map[area_name]
 
     # Sleep so we handle the reload delay
-    await asyncio.sleep(
-        MetaAreaAutoReloadSettings.DELAY * MetaAreaAutoReloadSettings.DELAY_MULTIPLIER
-    )
+    await asyncio.sleep(MetaAreaAutoReloadSettings.QUIET_WINDOW * 2)
+    await hass.async_block_till_done()
 
     # Check corresponding area reloaded
     _assert_has_reloaded(MockAreaIds.KITCHEN.value)
@@ -164,9 +264,263 @@ async def test_meta_reload_from_single_reload(
     _assert_has_reloaded(MockAreaIds.GLOBAL.value)
     _assert_has_reloaded(MockAreaIds.FIRST_FLOOR.value)
 
+    # Check meta-areas reloaded in dependency order
+    first_floor = get_entry_by_area_name(hass, MockAreaIds.FIRST_FLOOR.value)
+    interior = get_entry_by_area_name(hass, MockAreaIds.INTERIOR.value)
+    global_area = get_entry_by_area_name(hass, MockAreaIds.GLOBAL.value)
+    assert first_floor and interior and global_area
+    assert first_floor.timestamp < interior.timestamp < global_area.timestamp
+
     # Check other areas didn't reload
     _assert_has_not_reloaded(MockAreaIds.MASTER_BEDROOM.value)
     _assert_has_not_reloaded(MockAreaIds.BACKYARD.value)
     _assert_has_not_reloaded(MockAreaIds.EXTERIOR.value)
     _assert_has_not_reloaded(MockAreaIds.SECOND_FLOOR.value)
     _assert_has_not_reloaded(MockAreaIds.GROUND_LEVEL.value)
+
+
+async def test_reload_requests_are_collapsed(
+    hass: HomeAssistant,
+    entities_binary_sensor_motion_all_areas_with_meta: dict[
+        MockAreaIds, list[MockBinarySensor]
+    ],
+    _setup_integration_all_areas_with_meta,
+) -> None:
+    """Test that a burst of registry changes reloads each area only once."""
+
+    coordinator = async_get_reload_coordinator(hass)
+    metrics = coordinator.metrics
+
+    kitchen = get_entry_by_area_name(hass, MockAreaIds.KITCHEN.value)
+    assert kitchen
+    kitchen_timestamp = kitchen.timestamp
+
+    for entity in entities_binary_sensor_motion_all_areas_with_meta[
+        MockAreaIds.KITCHEN
+    ]:
+        event_data: _EventEntityRegistryUpdatedData_CreateRemove = {
+            "action": "remove",
+            "entity_id": entity.entity_id,
+        }
+        hass.bus.async_fire(EVENT_ENTITY_REGISTRY_UPDATED, event_data)
+        hass.bus.async_fire(EVENT_ENTITY_REGISTRY_UPDATED, event_data)
+    await hass.async_block_till_done()
+
+    # Sleep so we handle the quiet window
+    await asyncio.sleep(coordinator.quiet_window * 2)
+    await hass.async_block_till_done()
+
+    kitchen = get_entry_by_area_name(hass, MockAreaIds.KITCHEN.value)
+    assert kitchen
+    assert kitchen.timestamp != kitchen_timestamp
+
+    requested = coordinator.requested - metrics["requested"]
+    assert requested > 1
+    assert coordinator.batches - metrics["batches"] == 1
+    assert coordinator.reloaded - metrics["reloaded"] == 1
+    assert coordinator.collapsed - metrics["collapsed"] == requested - 1
+
+
+async def test_meta_membership_updated_in_place(
+    hass: HomeAssistant,
+    entities_binary_sensor_motion_all_areas_with_meta: dict[
+        MockAreaIds, list[MockBinarySensor]
+    ],
+    _setup_integration_all_areas_with_meta,
+) -> None:
+    """Test that meta-areas follow a child reload without reloading themselves."""
+
+    coordinator = async_get_reload_coordinator(hass)
+    metrics = coordinator.metrics
+
+    global_area = get_entry_by_area_name(hass, MockAreaIds.GLOBAL.value)
+    assert global_area
+
+    event_data: _EventEntityRegistryUpdatedData_Update = {
+        "action": "update",
+        "entity_id": "sensor.test",
+        "changes": {"area_id": MockAreaIds.KITCHEN.value},
+    }
+    hass.bus.async_fire(EVENT_ENTITY_REGISTRY_UPDATED, event_data)
+    await hass.async_block_till_done()
+
+    # Sleep so we handle the quiet window
+    await asyncio.sleep(coordinator.quiet_window * 2)
+    await hass.async_block_till_done()
+
+    # Global, Interior and the kitchen's floor were updated in place
+    assert coordinator.meta_updated - metrics["meta_updated"] == 3
+    assert coordinator.meta_reloaded == metrics["meta_reloaded"]
+    assert get_entry_by_area_name(hass, MockAreaIds.GLOBAL.value) is global_area
+
+
+async def test_coordinator_shutdown_on_last_unload(
+    hass: HomeAssistant,
+    entities_binary_sensor_motion_one: list[MockBinarySensor],
+    basic_config_entry: MockConfigEntry,
+) -> None:
+    """Test the coordinator stops listening once the last area is unloaded."""
+
+    await init_integration(hass, [basic_config_entry])
+
+    coordinator = async_get_reload_coordinator(hass)
+    coordinator.async_request_reload(basic_config_entry.entry_id)
+
+    await shutdown_integration(hass, [basic_config_entry])
+    assert DATA_RELOAD_COORDINATOR not in hass.data
+
+    # Area load signals don't reach the old coordinator anymore
+    coordinator._loading["kitchen"] = (AREA_TYPE_INTERIOR, None)
+    async_dispatcher_send(
+        hass, MagicAreasEvents.AREA_LOADED, AREA_TYPE_INTERIOR, None, "kitchen"
+    )
+    await hass.async_block_till_done()
+    assert "kitchen" in coordinator._loading
+
+    # Pending reloads were dropped with it
+    await asyncio.sleep(coordinator.quiet_window * 2)
+    await hass.async_block_till_done()
+    assert coordinator.batches == 0
+
+
+async def test_meta_areas_wait_for_all_children_on_setup(
+    hass: HomeAssistant,
+    entities_binary_sensor_motion_all_areas_with_meta: dict[
+        MockAreaIds, list[MockBinarySensor]
+    ],
+    all_areas_with_meta_config_entry: list[MockConfigEntry],
+) -> None:
+    """Test meta areas are updated once all of their children loaded."""
+
+    updates: Counter[str] = Counter()
+    update_membership = MagicMetaArea.async_update_membership
+
+    async def _count_updates(self: MagicMetaArea) -> bool:
+        updates[self.id] += 1
+        return await update_membership(self)
+
+    non_meta_areas = [
+        area for area in MockAreaIds if MOCK_AREAS[area][CONF_TYPE] != AreaType.META
+    ]
+
+    with patch.object(MagicMetaArea, "async_update_membership", _count_updates):
+        await init_integration(
+            hass, all_areas_with_meta_config_entry, areas=non_meta_areas
+        )
+        await hass.async_block_till_done()
+
+        # No meta area followed its children one by one
+        assert all(count == 1 for count in updates.values()), updates
+
+    await shutdown_integration(hass, all_areas_with_meta_config_entry)
+
+
+async def test_meta_areas_use_loaded_child_entities(
+    hass: HomeAssistant,
+    entities_binary_sensor_motion_all_areas_with_meta: dict[
+        MockAreaIds, list[MockBinarySensor]
+    ],
+    _setup_integration_all_areas_with_meta,
+) -> None:
+    """Test meta areas hold their children's entities once set up."""
+
+    areas: list[MagicArea] = [
+        entry_data[DATA_AREA_OBJECT] for entry_data in hass.data[MODULE_DATA].values()
+    ]
+
+    for meta_area in areas:
+        if not isinstance(meta_area, MagicMetaArea):
+            continue
+
+        child_entity_ids = {
+            record.entity_id
+            for area in meta_area.get_child_magic_areas()
+            for records in area.magic_entities.values()
+            for record in records
+        }
+        assert child_entity_ids
+        assert meta_area.entity_ids == child_entity_ids, meta_area.id
+
+
+@pytest.mark.parametrize(
+    ("domain", "group_entity_id", "member_state"),
+    [
+        (LIGHT_DOMAIN, "light.magic_areas_light_groups_{}_all_lights", STATE_ON),
+        (
+            COVER_DOMAIN,
+            "cover.magic_areas_cover_groups_{}_cover_group_blind",
+            STATE_CLOSED,
+        ),
+        (
+            BINARY_SENSOR_DOMAIN,
+            "binary_sensor.magic_areas_aggregates_{}_aggregate_motion",
+            STATE_ON,
+        ),
+    ],
+)
+async def test_meta_groups_follow_members_in_place(
+    hass: HomeAssistant,
+    entities_group_members: dict[str, dict[MockAreaIds, Entity]],
+    group_features_config_entries: list[MockConfigEntry],
+    domain: str,
+    group_entity_id: str,
+    member_state: str,
+) -> None:
+    """Test meta area groups gain and lose members without being re-added."""
+
+    non_meta_areas = [
+        area for area in MockAreaIds if MOCK_AREAS[area][CONF_TYPE] != AreaType.META
+    ]
+    await init_integration(hass, group_features_config_entries, areas=non_meta_areas)
+
+    coordinator = async_get_reload_coordinator(hass)
+    metrics = coordinator.metrics
+
+    moved_entity_id = entities_group_members[domain][MockAreaIds.KITCHEN].entity_id
+    assert moved_entity_id
+    # Meta area groups are made of their children's groups
+    new_member_id = group_entity_id.format(MockAreaIds.FRONT_YARD.value)
+    interior_group_id = group_entity_id.format(MockAreaIds.INTERIOR.value)
+    exterior_group_id = group_entity_id.format(MockAreaIds.EXTERIOR.value)
+
+    interior_group = hass.states.get(interior_group_id)
+    exterior_group = hass.states.get(exterior_group_id)
+    assert interior_group and exterior_group
+    assert new_member_id not in exterior_group.attributes[ATTR_ENTITY_ID]
+
+    # Move the kitchen's member to the front yard, which gets a group of its own
+    async_get_er(hass).async_update_entity(
+        moved_entity_id, area_id=MockAreaIds.FRONT_YARD.value
+    )
+    await hass.async_block_till_done()
+
+    await asyncio.sleep(coordinator.quiet_window * 2)
+    await hass.async_block_till_done()
+
+    assert coordinator.meta_updated > metrics["meta_updated"]
+    assert coordinator.meta_reloaded == metrics["meta_reloaded"]
+
+    interior_group = hass.states.get(interior_group_id)
+    exterior_group = hass.states.get(exterior_group_id)
+    assert interior_group and exterior_group
+    assert new_member_id not in interior_group.attributes[ATTR_ENTITY_ID]
+    assert new_member_id in exterior_group.attributes[ATTR_ENTITY_ID]
+    interior_reported = interior_group.last_reported
+    exterior_reported = exterior_group.last_reported
+
+    # Only the meta area group it joined follows the new member
+    hass.states.async_set(moved_entity_id, member_state)
+    await hass.async_block_till_done()
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+
+    new_member = hass.states.get(new_member_id)
+    assert new_member and new_member.state == member_state
+
+    interior_group_after = hass.states.get(interior_group_id)
+    exterior_group_after = hass.states.get(exterior_group_id)
+    assert interior_group_after and exterior_group_after
+    assert interior_group_after.last_reported == interior_reported
+    assert exterior_group_after.last_reported != exterior_reported
+
+    await shutdown_integration(hass, group_features_config_entries)
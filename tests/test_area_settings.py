@@ -0,0 +1,84 @@
+"""Tests for the area settings snapshot."""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from custom_components.magic_areas.base.config import AreaSettings
+from custom_components.magic_areas.const import (
+    CONF_CLEAR_TIMEOUT,
+    CONF_DARK_ENTITY,
+    CONF_ENABLED_FEATURES,
+    CONF_EXTENDED_TIME,
+    CONF_FEATURE_LIGHT_GROUPS,
+    CONF_FEATURE_PRESENCE_HOLD,
+    CONF_RELOAD_QUIET_WINDOW,
+    CONF_SECONDARY_STATES,
+    CONF_SLEEP_ENTITY,
+    DEFAULT_EXTENDED_TIMEOUT,
+    DEFAULT_RELOAD_QUIET_WINDOW,
+    ONE_MINUTE,
+    AreaStates,
+)
+
+
+def test_settings_resolves_timeouts_and_secondary_states() -> None:
+    """Test timeouts are resolved to seconds and unset entities are dropped."""
+
+    settings = AreaSettings.from_config(
+        {
+            CONF_CLEAR_TIMEOUT: 2,
+            CONF_SECONDARY_STATES: {
+                CONF_EXTENDED_TIME: 3,
+                CONF_DARK_ENTITY: "binary_sensor.dark",
+                CONF_SLEEP_ENTITY: "",
+            },
+        }
+    )
+
+    assert settings.clear_timeout == 2 * ONE_MINUTE
+    assert settings.extended_time == 3 * ONE_MINUTE
+    assert settings.extended_timeout == DEFAULT_EXTENDED_TIMEOUT * ONE_MINUTE
+    assert dict(settings.secondary_state_entities) == {
+        AreaStates.DARK: "binary_sensor.dark"
+    }
+
+
+def test_settings_features() -> None:
+    """Test enabled features and their options, including the legacy format."""
+
+    settings = AreaSettings.from_config(
+        {CONF_ENABLED_FEATURES: {CONF_FEATURE_LIGHT_GROUPS: {"a": 1}}}
+    )
+    assert CONF_FEATURE_LIGHT_GROUPS in settings.features
+    assert settings.feature_options[CONF_FEATURE_LIGHT_GROUPS]["a"] == 1
+
+    legacy = AreaSettings.from_config(
+        {CONF_ENABLED_FEATURES: [CONF_FEATURE_PRESENCE_HOLD]}
+    )
+    assert CONF_FEATURE_PRESENCE_HOLD in legacy.features
+    assert CONF_FEATURE_PRESENCE_HOLD not in legacy.feature_options
+
+
+def test_settings_reload_quiet_window() -> None:
+    """Test the reload quiet window is read from the options, in seconds."""
+
+    assert (
+        AreaSettings.from_config({}).reload_quiet_window == DEFAULT_RELOAD_QUIET_WINDOW
+    )
+    assert (
+        AreaSettings.from_config({CONF_RELOAD_QUIET_WINDOW: 10}).reload_quiet_window
+        == 10
+    )
+
+
+def test_settings_is_immutable() -> None:
+    """Test the snapshot can't be changed after creation."""
+
+    settings = AreaSettings.from_config({})
+
+    with pytest.raises(FrozenInstanceError):
+        settings.clear_timeout = 0  # type: ignore[misc]
+
+    with pytest.raises(TypeError):
+        settings.feature_options["foo"] = {}  # type: ignore[index]
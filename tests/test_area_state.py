@@ -1,28 +1,40 @@
 """Test for area changes and how the system handles it."""
 
 from collections.abc import AsyncGenerator
+from datetime import timedelta
 import logging
 from typing import Any
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from homeassistant.components.binary_sensor import (
     DOMAIN as BINARY_SENSOR_DOMAIN,
     BinarySensorDeviceClass,
 )
-from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_component import DATA_INSTANCES
 
+from custom_components.magic_areas.base.magic import MagicArea
 from custom_components.magic_areas.const import (
+    ATTR_ACTIVE_SENSORS,
     ATTR_PRESENCE_SENSORS,
     ATTR_STATES,
     CONF_ACCENT_ENTITY,
+    CONF_CLEAR_TIMEOUT,
     CONF_DARK_ENTITY,
     CONF_KEEP_ONLY_ENTITIES,
     CONF_SECONDARY_STATES,
     CONF_SLEEP_ENTITY,
+    DATA_AREA_OBJECT,
+    DEFAULT_EXTENDED_TIME,
     DOMAIN,
+    MODULE_DATA,
     AreaStates,
 )
 
@@ -40,6 +52,18 @@ from tests.mocks import MockBinarySensor
 _LOGGER = logging.getLogger(__name__)
 
 
+# Helpers
+
+
+def get_default_area(hass: HomeAssistant) -> MagicArea:
+    """Return the area object for the default mock area."""
+    for entry_data in hass.data[MODULE_DATA].values():
+        area: MagicArea = entry_data[DATA_AREA_OBJECT]
+        if area.id == DEFAULT_MOCK_AREA.value:
+            return area
+    raise AssertionError("Default area not loaded")
+
+
 # Fixtures
 
 
@@ -67,6 +91,14 @@ def mock_config_entry_keep_only_sensor() -> MockConfigEntry:
     return MockConfigEntry(domain=DOMAIN, data=data)
 
 
+@pytest.fixture(name="clear_timeout_config_entry")
+def mock_config_entry_clear_timeout() -> MockConfigEntry:
+    """Fixture for mock configuration entry."""
+    data = get_basic_config_entry_data(DEFAULT_MOCK_AREA)
+    data.update({CONF_CLEAR_TIMEOUT: 1})
+    return MockConfigEntry(domain=DOMAIN, data=data)
+
+
 @pytest.fixture(name="_setup_integration_secondary_states")
 async def setup_integration_secondary_states(
     hass: HomeAssistant,
@@ -91,6 +123,18 @@ async def setup_integration_keep_only_sensor(
     await shutdown_integration(hass, [keep_only_sensor_config_entry])
 
 
+@pytest.fixture(name="_setup_integration_clear_timeout")
+async def setup_integration_clear_timeout(
+    hass: HomeAssistant,
+    clear_timeout_config_entry: MockConfigEntry,
+) -> AsyncGenerator[Any]:
+    """Set up integration with a clear timeout."""
+
+    await init_integration(hass, [clear_timeout_config_entry])
+    yield
+    await shutdown_integration(hass, [clear_timeout_config_entry])
+
+
 # Entities
 
 
@@ -120,6 +164,25 @@ async def setup_secondary_state_sensors(hass: HomeAssistant) -> list[MockBinaryS
     return mock_binary_sensor_entities
 
 
+@pytest.fixture(name="entities_binary_sensor_motion_static")
+async def setup_entities_binary_sensor_motion_static(
+    hass: HomeAssistant,
+) -> list[MockBinarySensor]:
+    """Create one mock sensor that is not polled, keeping states set by tests."""
+    mock_binary_sensor_entities = [
+        MockBinarySensor(
+            name="motion_sensor",
+            unique_id="unique_motion",
+            device_class=BinarySensorDeviceClass.MOTION,
+            should_poll=False,
+        )
+    ]
+    await setup_mock_entities(
+        hass, BINARY_SENSOR_DOMAIN, {DEFAULT_MOCK_AREA: mock_binary_sensor_entities}
+    )
+    return mock_binary_sensor_entities
+
+
 # Tests
 
 
@@ -232,8 +295,47 @@ async def test_area_secondary_state_change(
             assert_in_attribute(area_binary_sensor, ATTR_STATES, state_tuples[1])
 
 
-# Test extended state
-# @TODO pending figuring out virtualclock
+async def test_area_extended_state(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    entities_binary_sensor_motion_static: list[MockBinarySensor],
+    _setup_integration_basic,
+) -> None:
+    """Test the extended state is set once the extended time is reached."""
+
+    motion_sensor_entity_id = entities_binary_sensor_motion_static[0].entity_id
+    area_sensor_entity_id = (
+        f"{BINARY_SENSOR_DOMAIN}.magic_areas_presence_tracking_kitchen_area_state"
+    )
+
+    # Turn on motion sensor
+    hass.states.async_set(motion_sensor_entity_id, STATE_ON)
+    await hass.async_block_till_done()
+
+    area_binary_sensor = hass.states.get(area_sensor_entity_id)
+    assert_in_attribute(area_binary_sensor, ATTR_STATES, AreaStates.OCCUPIED)
+    assert_in_attribute(
+        area_binary_sensor, ATTR_STATES, AreaStates.EXTENDED, negate=True
+    )
+
+    # Just before the extended time nothing changes
+    freezer.tick(timedelta(minutes=DEFAULT_EXTENDED_TIME) - timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    area_binary_sensor = hass.states.get(area_sensor_entity_id)
+    assert_in_attribute(
+        area_binary_sensor, ATTR_STATES, AreaStates.EXTENDED, negate=True
+    )
+
+    # Extended state lands on time, without any sensor activity
+    freezer.tick(timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    area_binary_sensor = hass.states.get(area_sensor_entity_id)
+    assert_state(area_binary_sensor, STATE_ON)
+    assert_in_attribute(area_binary_sensor, ATTR_STATES, AreaStates.EXTENDED)
 
 
 # Test keep-only sensors
@@ -309,3 +411,122 @@ async def test_keep_only_sensors(
     assert_state(flappy_sensor, STATE_OFF)
     assert_state(area_binary_sensor, STATE_OFF)
     assert_in_attribute(area_binary_sensor, ATTR_STATES, AreaStates.CLEAR)
+
+
+async def test_active_sensors_follow_sensor_changes(
+    hass: HomeAssistant,
+    entities_binary_sensor_motion_multiple: list[MockBinarySensor],
+    _setup_integration_basic,
+) -> None:
+    """Test the active sensors are kept up to date from each sensor change."""
+
+    sensor_ids = [entity.entity_id for entity in entities_binary_sensor_motion_multiple]
+    area_sensor_entity_id = (
+        f"{BINARY_SENSOR_DOMAIN}.magic_areas_presence_tracking_kitchen_area_state"
+    )
+
+    area_binary_sensor = hass.states.get(area_sensor_entity_id)
+    assert_state(area_binary_sensor, STATE_OFF)
+    assert area_binary_sensor.attributes[ATTR_ACTIVE_SENSORS] == []
+
+    # Sensors turning on are added
+    for entity_id in sensor_ids[:2]:
+        hass.states.async_set(entity_id, STATE_ON)
+        await hass.async_block_till_done()
+
+    area_binary_sensor = hass.states.get(area_sensor_entity_id)
+    assert_state(area_binary_sensor, STATE_ON)
+    assert area_binary_sensor.attributes[ATTR_ACTIVE_SENSORS] == sensor_ids[:2]
+
+    # Sensors turning off are removed, the area stays occupied
+    hass.states.async_set(sensor_ids[0], STATE_OFF)
+    await hass.async_block_till_done()
+
+    area_binary_sensor = hass.states.get(area_sensor_entity_id)
+    assert_state(area_binary_sensor, STATE_ON)
+    assert area_binary_sensor.attributes[ATTR_ACTIVE_SENSORS] == [sensor_ids[1]]
+
+    # Unavailable sensors don't count as active
+    hass.states.async_set(sensor_ids[1], STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+
+    area_binary_sensor = hass.states.get(area_sensor_entity_id)
+    assert_state(area_binary_sensor, STATE_OFF)
+    assert area_binary_sensor.attributes[ATTR_ACTIVE_SENSORS] == []
+
+
+async def test_clear_timeout_starts_without_off_transition(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    entities_binary_sensor_motion_static: list[MockBinarySensor],
+    _setup_integration_clear_timeout,
+) -> None:
+    """Test the clear timeout runs in full when no sensor reported off."""
+
+    motion_sensor_entity_id = entities_binary_sensor_motion_static[0].entity_id
+    area_sensor_entity_id = (
+        f"{BINARY_SENSOR_DOMAIN}.magic_areas_presence_tracking_kitchen_area_state"
+    )
+
+    hass.states.async_set(motion_sensor_entity_id, STATE_ON)
+    await hass.async_block_till_done()
+    assert_state(hass.states.get(area_sensor_entity_id), STATE_ON)
+
+    # The sensor goes away while active, starting the clear timeout
+    hass.states.async_remove(motion_sensor_entity_id)
+    await hass.async_block_till_done()
+    assert_state(hass.states.get(area_sensor_entity_id), STATE_ON)
+
+    # Just before the timeout the area is still occupied
+    freezer.tick(timedelta(minutes=1) - timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert_state(hass.states.get(area_sensor_entity_id), STATE_ON)
+
+    # And clear right after it
+    freezer.tick(timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    area_binary_sensor = hass.states.get(area_sensor_entity_id)
+    assert_state(area_binary_sensor, STATE_OFF)
+    assert_in_attribute(area_binary_sensor, ATTR_STATES, AreaStates.CLEAR)
+
+
+async def test_sensor_changes_are_coalesced(
+    hass: HomeAssistant,
+    entities_binary_sensor_motion_multiple: list[MockBinarySensor],
+    _setup_integration_basic,
+) -> None:
+    """Test sensor changes within a loop iteration cause a single evaluation."""
+
+    area = get_default_area(hass)
+    area.tracer.logger.setLevel(logging.DEBUG)
+    area.tracer.refresh()
+    area.tracer.records.clear()
+
+    area_sensor = hass.data[DATA_INSTANCES][BINARY_SENSOR_DOMAIN].get_entity(
+        f"{BINARY_SENSOR_DOMAIN}.magic_areas_presence_tracking_{DEFAULT_MOCK_AREA}_area_state"
+    )
+    assert area_sensor is not None
+    coalesced_evaluations = area_sensor.coalesced_evaluations
+
+    for entity in entities_binary_sensor_motion_multiple:
+        hass.states.async_set(entity.entity_id, STATE_ON)
+    await hass.async_block_till_done()
+
+    evaluations = [
+        record for record in area.tracer.records if record.event == "evaluate"
+    ]
+    assert len(evaluations) == 1
+
+    # Every change after the first was merged into the pending evaluation
+    new_states, _lost_states, coalesced = evaluations[0].detail
+    assert AreaStates.OCCUPIED in new_states
+    assert coalesced == len(entities_binary_sensor_motion_multiple) - 1
+
+    # The entity keeps counting across evaluations
+    assert area_sensor.coalesced_evaluations == coalesced_evaluations + coalesced
+
+    area.tracer.logger.setLevel(logging.NOTSET)
+    area.tracer.refresh()
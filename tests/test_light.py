@@ -6,13 +6,23 @@ import logging
 from typing import Any
 
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    mock_restore_cache,
+)
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.components.light.const import DOMAIN as LIGHT_DOMAIN
 from homeassistant.components.switch.const import DOMAIN as SWITCH_DOMAIN
-from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_ON, STATE_OFF, STATE_ON
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.entity_component import DATA_INSTANCES
 
 from custom_components.magic_areas.const import (
     CONF_ENABLED_FEATURES,
@@ -20,10 +30,13 @@ from custom_components.magic_areas.const import (
     CONF_OVERHEAD_LIGHTS,
     CONF_OVERHEAD_LIGHTS_ACT_ON,
     CONF_OVERHEAD_LIGHTS_STATES,
+    DATA_AREA_OBJECT,
     DOMAIN,
     LIGHT_GROUP_ACT_ON_OCCUPANCY_CHANGE,
+    MODULE_DATA,
     AreaStates,
 )
+from custom_components.magic_areas.light import AreaLightGroup
 
 from tests.const import DEFAULT_MOCK_AREA
 from tests.helpers import (
@@ -174,3 +187,84 @@ async def test_light_group_basic(
     # Check light group is off
     light_group_state = hass.states.get(light_group_entity_id)
     assert_state(light_group_state, STATE_OFF)
+
+
+async def test_light_control_flag_follows_switch(
+    hass: HomeAssistant,
+    entities_light_one: list[MockLight],
+    entities_binary_sensor_motion_one: list[MockBinarySensor],
+    light_groups_config_entry: MockConfigEntry,
+) -> None:
+    """Test the area's light control flag is kept by the switch."""
+
+    light_control_entity_id = (
+        f"{SWITCH_DOMAIN}.magic_areas_light_groups_{DEFAULT_MOCK_AREA}_light_control"
+    )
+    mock_restore_cache(hass, [State(light_control_entity_id, STATE_ON)])
+
+    await init_integration(hass, [light_groups_config_entry])
+    area = hass.data[MODULE_DATA][light_groups_config_entry.entry_id][DATA_AREA_OBJECT]
+
+    # Restored from the switch's last state
+    assert area.light_control
+
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: light_control_entity_id},
+        blocking=True,
+    )
+    assert not area.light_control
+
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_ON,
+        {ATTR_ENTITY_ID: light_control_entity_id},
+        blocking=True,
+    )
+    assert area.light_control
+
+    # Removing the switch disables light control
+    await shutdown_integration(hass, [light_groups_config_entry])
+    assert not area.light_control
+
+
+async def test_all_lights_group_follows_child_groups(
+    hass: HomeAssistant,
+    entities_light_one: list[MockLight],
+    entities_binary_sensor_motion_one: list[MockBinarySensor],
+    _setup_integration_light_groups,
+) -> None:
+    """Test the all lights group controls while any child group does."""
+
+    all_lights_entity_id = (
+        f"{LIGHT_DOMAIN}.magic_areas_light_groups_{DEFAULT_MOCK_AREA}_all_lights"
+    )
+    overhead_lights_entity_id = (
+        f"{LIGHT_DOMAIN}.magic_areas_light_groups_{DEFAULT_MOCK_AREA}_overhead_lights"
+    )
+
+    light_component = hass.data[DATA_INSTANCES][LIGHT_DOMAIN]
+    all_lights = light_component.get_entity(all_lights_entity_id)
+    overhead_lights = light_component.get_entity(overhead_lights_entity_id)
+    assert isinstance(all_lights, AreaLightGroup)
+    assert isinstance(overhead_lights, AreaLightGroup)
+
+    # Child groups are held as objects, their ids exposed as attribute
+    assert all_lights._child_groups == [overhead_lights]
+    assert_in_attribute(
+        hass.states.get(all_lights_entity_id), "child_ids", overhead_lights_entity_id
+    )
+    assert all_lights.is_child_controllable(overhead_lights)
+
+    # Stop controlling once no child group controls
+    overhead_lights.controlling = False
+    assert not all_lights.is_child_controllable(overhead_lights)
+    all_lights.handle_group_state_change_primary()
+    await hass.async_block_till_done()
+    assert not all_lights.controlling
+
+    overhead_lights.controlling = True
+    all_lights.handle_group_state_change_primary()
+    await hass.async_block_till_done()
+    assert all_lights.controlling
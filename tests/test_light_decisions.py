@@ -0,0 +1,142 @@
+"""Test the compiled light group decisions against the reference logic."""
+
+import random
+
+from custom_components.magic_areas.const import (
+    AREA_PRIORITY_STATES,
+    LIGHT_GROUP_ACT_ON_OCCUPANCY_CHANGE,
+    LIGHT_GROUP_ACT_ON_STATE_CHANGE,
+    AreaStates,
+)
+from custom_components.magic_areas.helpers.states import states_mask
+from custom_components.magic_areas.light import LightGroupAction, LightGroupDecisions
+
+# Helpers
+
+
+def reference_decision(
+    assigned_states: list[str],
+    act_on: list[str],
+    new_states: list[str],
+    lost_states: list[str],
+    current_states: list[str],
+) -> LightGroupAction:
+    """Decide like the list-based secondary state change handling did."""
+
+    if AreaStates.CLEAR in new_states:
+        return LightGroupAction.RESET
+
+    if AreaStates.BRIGHT in current_states:
+        if AreaStates.BRIGHT in new_states and AreaStates.OCCUPIED not in new_states:
+            return LightGroupAction.TURN_OFF
+        return LightGroupAction.NONE
+
+    if not new_states and not lost_states:
+        return LightGroupAction.NONE
+
+    if not assigned_states:
+        return LightGroupAction.NONE
+
+    if AreaStates.OCCUPIED not in current_states:
+        return LightGroupAction.NONE
+
+    valid_states = [state for state in assigned_states if state in current_states]
+    has_priority_states = any(state in current_states for state in AREA_PRIORITY_STATES)
+    non_priority_states = [
+        state for state in valid_states if state not in AREA_PRIORITY_STATES
+    ]
+
+    if (
+        AreaStates.OCCUPIED in new_states
+        and LIGHT_GROUP_ACT_ON_OCCUPANCY_CHANGE not in act_on
+    ):
+        return LightGroupAction.NONE
+
+    if (
+        AreaStates.OCCUPIED not in new_states
+        and LIGHT_GROUP_ACT_ON_STATE_CHANGE not in act_on
+    ):
+        return LightGroupAction.NONE
+
+    if has_priority_states:
+        for non_priority_state in non_priority_states:
+            valid_states.remove(non_priority_state)
+
+    if valid_states:
+        return LightGroupAction.TURN_ON
+
+    if AreaStates.DARK in new_states:
+        return LightGroupAction.NONE
+
+    out_of_priority_states = [
+        state
+        for state in AREA_PRIORITY_STATES
+        if state in assigned_states and state in lost_states
+    ]
+    if out_of_priority_states:
+        return LightGroupAction.TURN_OFF
+
+    new_priority_states = [
+        state for state in AREA_PRIORITY_STATES if state in new_states
+    ]
+    if not new_priority_states:
+        return LightGroupAction.NONE
+
+    return LightGroupAction.TURN_OFF
+
+
+def random_states(rng: random.Random) -> list[str]:
+    """Return a random subset of area states."""
+    return [state for state in AreaStates if rng.random() < 0.4]
+
+
+# Tests
+
+
+def test_decisions_match_reference() -> None:
+    """Test compiled decisions match the reference on random state changes."""
+
+    rng = random.Random(4321)
+    act_on_options = [
+        LIGHT_GROUP_ACT_ON_OCCUPANCY_CHANGE,
+        LIGHT_GROUP_ACT_ON_STATE_CHANGE,
+    ]
+
+    for _ in range(200):
+        assigned_states = random_states(rng)
+        act_on = [option for option in act_on_options if rng.random() < 0.6]
+        decisions = LightGroupDecisions(assigned_states, act_on)
+
+        for _ in range(200):
+            new_states = random_states(rng)
+            lost_states = random_states(rng)
+            current_states = random_states(rng)
+
+            assert decisions.decide(
+                states_mask(new_states),
+                states_mask(lost_states),
+                states_mask(current_states),
+            ) == reference_decision(
+                assigned_states, act_on, new_states, lost_states, current_states
+            ), (assigned_states, act_on, new_states, lost_states, current_states)
+
+
+def test_decisions_examples() -> None:
+    """Test a few common transitions."""
+
+    decisions = LightGroupDecisions(
+        [AreaStates.SLEEP],
+        [LIGHT_GROUP_ACT_ON_OCCUPANCY_CHANGE, LIGHT_GROUP_ACT_ON_STATE_CHANGE],
+    )
+    occupied = states_mask([AreaStates.OCCUPIED])
+    sleep = states_mask([AreaStates.SLEEP])
+
+    # Entering sleep while occupied
+    assert decisions.decide(sleep, 0, occupied | sleep) == LightGroupAction.TURN_ON
+    # Leaving sleep
+    assert decisions.decide(0, sleep, occupied) == LightGroupAction.TURN_OFF
+    # Area clear
+    assert (
+        decisions.decide(states_mask([AreaStates.CLEAR]), occupied, 0)
+        == LightGroupAction.RESET
+    )
@@ -2,18 +2,65 @@
 
 import logging
 
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.const import STATE_OFF, STATE_ON
-from homeassistant.core import HomeAssistant
-
-from custom_components.magic_areas.const import AreaStates
-
-from tests.const import MockAreaIds
-from tests.helpers import assert_state
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from custom_components.magic_areas.const import (
+    ATTR_STATES,
+    CONF_SECONDARY_STATES,
+    CONF_SECONDARY_STATES_CALCULATION_MODE,
+    CONF_SLEEP_ENTITY,
+    CONF_TYPE,
+    DOMAIN,
+    AreaStates,
+    AreaType,
+    CalculationMode,
+    MagicAreasEvents,
+)
+from custom_components.magic_areas.util import area_signal
+
+from tests.const import MOCK_AREAS, MockAreaIds
+from tests.helpers import (
+    assert_in_attribute,
+    assert_state,
+    get_basic_config_entry_data,
+    init_integration,
+    shutdown_integration,
+)
 from tests.mocks import MockBinarySensor
 
 _LOGGER = logging.getLogger(__name__)
 
+# Constants
+
+SLEEP_SENSOR_ENTITY_ID = "binary_sensor.sleep_sensor"
+
+
+# Fixtures
+
+
+@pytest.fixture(name="meta_sleep_config_entries")
+def mock_config_entries_meta_sleep() -> list[MockConfigEntry]:
+    """Fixture for all areas with a sleep sensor in the kitchen."""
+
+    config_entries: list[MockConfigEntry] = []
+    for area_entry in MockAreaIds:
+        data = get_basic_config_entry_data(area_entry)
+        if area_entry == MockAreaIds.KITCHEN:
+            data[CONF_SECONDARY_STATES] = {CONF_SLEEP_ENTITY: SLEEP_SENSOR_ENTITY_ID}
+        if area_entry == MockAreaIds.FIRST_FLOOR:
+            data[CONF_SECONDARY_STATES] = {
+                CONF_SECONDARY_STATES_CALCULATION_MODE: CalculationMode.ANY
+            }
+        config_entries.append(MockConfigEntry(domain=DOMAIN, data=data))
+
+    return config_entries
+
 
 # Tests
 
@@ -185,3 +232,99 @@ async def test_meta_area_primary_state_change(
 
     second_floor_area_sensor_state = hass.states.get(second_floor_area_sensor_entity_id)
     assert_state(second_floor_area_sensor_state, STATE_OFF)
+
+
+async def test_area_state_signal_is_scoped(
+    hass: HomeAssistant,
+    entities_binary_sensor_motion_all_areas_with_meta: dict[
+        MockAreaIds, list[MockBinarySensor]
+    ],
+    _setup_integration_all_areas_with_meta,
+) -> None:
+    """Test area state changes only reach listeners of the changed area."""
+
+    received: dict[str, list[str]] = {}
+
+    def listen(signal: str) -> None:
+        @callback
+        def _record(area_id: str, states_tuple) -> None:
+            received.setdefault(signal, []).append(area_id)
+
+        async_dispatcher_connect(hass, signal, _record)
+
+    kitchen_signal = area_signal(
+        MagicAreasEvents.AREA_STATE_CHANGED, MockAreaIds.KITCHEN.value
+    )
+    backyard_signal = area_signal(
+        MagicAreasEvents.AREA_STATE_CHANGED, MockAreaIds.BACKYARD.value
+    )
+    for signal in (kitchen_signal, backyard_signal):
+        listen(signal)
+    listen(MagicAreasEvents.AREA_STATE_CHANGED)
+
+    backyard_area_sensor_entity_id = f"{BINARY_SENSOR_DOMAIN}.magic_areas_presence_tracking_{MockAreaIds.BACKYARD.value}_area_state"
+    backyard_area_sensor_state = hass.states.get(backyard_area_sensor_entity_id)
+    assert backyard_area_sensor_state is not None
+
+    kitchen_motion_sensor_id = entities_binary_sensor_motion_all_areas_with_meta[
+        MockAreaIds.KITCHEN
+    ][0].entity_id
+    hass.states.async_set(kitchen_motion_sensor_id, STATE_ON)
+    await hass.async_block_till_done()
+
+    assert set(received[kitchen_signal]) == {MockAreaIds.KITCHEN.value}
+    assert backyard_signal not in received
+
+    # Nothing is sent to listeners of every area
+    assert MagicAreasEvents.AREA_STATE_CHANGED not in received
+
+    # The unrelated area didn't write its state
+    new_backyard_area_sensor_state = hass.states.get(backyard_area_sensor_entity_id)
+    assert new_backyard_area_sensor_state is not None
+    assert (
+        new_backyard_area_sensor_state.last_reported
+        == backyard_area_sensor_state.last_reported
+    )
+
+
+async def test_meta_area_drops_states_lost_on_clear(
+    hass: HomeAssistant,
+    entities_binary_sensor_motion_all_areas_with_meta: dict[
+        MockAreaIds, list[MockBinarySensor]
+    ],
+    meta_sleep_config_entries: list[MockConfigEntry],
+) -> None:
+    """Test secondary states lost as a child clears leave the meta area."""
+
+    hass.states.async_set(SLEEP_SENSOR_ENTITY_ID, STATE_OFF)
+    non_meta_areas = [
+        area for area in MockAreaIds if MOCK_AREAS[area][CONF_TYPE] != AreaType.META
+    ]
+    await init_integration(hass, meta_sleep_config_entries, areas=non_meta_areas)
+
+    first_floor_area_sensor_entity_id = f"{BINARY_SENSOR_DOMAIN}.magic_areas_presence_tracking_{MockAreaIds.FIRST_FLOOR.value}_area_state"
+    kitchen_motion_sensor_id = entities_binary_sensor_motion_all_areas_with_meta[
+        MockAreaIds.KITCHEN
+    ][0].entity_id
+
+    # Kitchen occupied and sleeping
+    hass.states.async_set(kitchen_motion_sensor_id, STATE_ON)
+    hass.states.async_set(SLEEP_SENSOR_ENTITY_ID, STATE_ON)
+    await hass.async_block_till_done()
+
+    first_floor_area_sensor_state = hass.states.get(first_floor_area_sensor_entity_id)
+    assert_state(first_floor_area_sensor_state, STATE_ON)
+    assert_in_attribute(first_floor_area_sensor_state, ATTR_STATES, AreaStates.SLEEP)
+
+    # Kitchen clears and stops sleeping in the same evaluation
+    hass.states.async_set(kitchen_motion_sensor_id, STATE_OFF)
+    hass.states.async_set(SLEEP_SENSOR_ENTITY_ID, STATE_OFF)
+    await hass.async_block_till_done()
+
+    first_floor_area_sensor_state = hass.states.get(first_floor_area_sensor_entity_id)
+    assert_state(first_floor_area_sensor_state, STATE_OFF)
+    assert_in_attribute(
+        first_floor_area_sensor_state, ATTR_STATES, AreaStates.SLEEP, negate=True
+    )
+
+    await shutdown_integration(hass, meta_sleep_config_entries)
@@ -0,0 +1,93 @@
+"""Test routing registry events to areas."""
+
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+
+from custom_components.magic_areas.helpers.registry import RegistryIndex
+
+# Helpers
+
+
+def make_area(area_id: str, entity_ids: set[str], device_ids: set[str]):
+    """Return a stand-in for an area with loaded entities and devices."""
+    return SimpleNamespace(
+        id=area_id, name=area_id, entity_ids=entity_ids, device_ids=device_ids
+    )
+
+
+# Tests
+
+
+async def test_events_reach_affected_areas_only(hass: HomeAssistant) -> None:
+    """Test registry events only notify the areas they affect."""
+
+    notified: list[str] = []
+
+    @callback
+    def _on_change(area) -> None:
+        notified.append(area.id)
+
+    index = RegistryIndex(hass)
+    kitchen = make_area("kitchen", {"sensor.kitchen"}, {"kitchen_device"})
+    backyard = make_area("backyard", {"sensor.backyard"}, {"backyard_device"})
+    unregister_kitchen = index.async_register_area(kitchen, _on_change)
+    index.async_register_area(backyard, _on_change)
+
+    async def fire(event_type: str, data: dict) -> list[str]:
+        notified.clear()
+        hass.bus.async_fire(event_type, data)
+        await hass.async_block_till_done()
+        return sorted(notified)
+
+    # Updates not touching the area are ignored
+    assert (
+        await fire(
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            {"action": "update", "entity_id": "sensor.kitchen", "changes": {}},
+        )
+        == []
+    )
+
+    # Moving an entity notifies the area it left
+    assert await fire(
+        EVENT_ENTITY_REGISTRY_UPDATED,
+        {
+            "action": "update",
+            "entity_id": "sensor.kitchen",
+            "changes": {"area_id": "kitchen"},
+        },
+    ) == ["kitchen"]
+
+    # Removed entities reach the area that loaded them
+    assert await fire(
+        EVENT_ENTITY_REGISTRY_UPDATED,
+        {"action": "remove", "entity_id": "sensor.backyard"},
+    ) == ["backyard"]
+
+    # Entities nobody loaded don't wake any area
+    assert (
+        await fire(
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            {"action": "create", "entity_id": "sensor.unrelated"},
+        )
+        == []
+    )
+
+    # Device events are routed the same way
+    assert await fire(
+        EVENT_DEVICE_REGISTRY_UPDATED,
+        {"action": "remove", "device_id": "backyard_device"},
+    ) == ["backyard"]
+
+    # Unregistered areas aren't notified anymore
+    unregister_kitchen()
+    assert (
+        await fire(
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            {"action": "remove", "entity_id": "sensor.kitchen"},
+        )
+        == []
+    )
@@ -0,0 +1,50 @@
+"""Test the batched service calls."""
+
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from homeassistant.components.light.const import DOMAIN as LIGHT_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_OFF, SERVICE_TURN_ON
+from homeassistant.core import HomeAssistant
+
+from custom_components.magic_areas.helpers.service import ServiceCallBatcher
+
+# Tests
+
+
+async def test_calls_are_merged(hass: HomeAssistant) -> None:
+    """Test intents queued in the same loop iteration share a service call."""
+
+    turn_on_calls = async_mock_service(hass, LIGHT_DOMAIN, SERVICE_TURN_ON)
+    turn_off_calls = async_mock_service(hass, LIGHT_DOMAIN, SERVICE_TURN_OFF)
+
+    batcher = ServiceCallBatcher(hass)
+    batcher.async_queue(LIGHT_DOMAIN, SERVICE_TURN_OFF, "light.kitchen")
+    batcher.async_queue(LIGHT_DOMAIN, SERVICE_TURN_OFF, "light.living_room")
+    batcher.async_queue(LIGHT_DOMAIN, SERVICE_TURN_OFF, "light.bedroom")
+    batcher.async_queue(LIGHT_DOMAIN, SERVICE_TURN_ON, "light.hallway")
+    await hass.async_block_till_done()
+
+    assert len(turn_off_calls) == 1
+    assert turn_off_calls[0].data[ATTR_ENTITY_ID] == [
+        "light.kitchen",
+        "light.living_room",
+        "light.bedroom",
+    ]
+    assert len(turn_on_calls) == 1
+    assert turn_on_calls[0].data[ATTR_ENTITY_ID] == ["light.hallway"]
+
+
+async def test_latest_intent_wins(hass: HomeAssistant) -> None:
+    """Test an entity is only sent its last queued service."""
+
+    turn_on_calls = async_mock_service(hass, LIGHT_DOMAIN, SERVICE_TURN_ON)
+    turn_off_calls = async_mock_service(hass, LIGHT_DOMAIN, SERVICE_TURN_OFF)
+
+    batcher = ServiceCallBatcher(hass)
+    batcher.async_queue(LIGHT_DOMAIN, SERVICE_TURN_ON, "light.kitchen")
+    batcher.async_queue(LIGHT_DOMAIN, SERVICE_TURN_OFF, "light.kitchen")
+    await hass.async_block_till_done()
+
+    assert not turn_on_calls
+    assert len(turn_off_calls) == 1
+    assert turn_off_calls[0].data[ATTR_ENTITY_ID] == ["light.kitchen"]
@@ -0,0 +1,43 @@
+"""Test the area state bitmask helpers."""
+
+from custom_components.magic_areas.const import AreaStates
+from custom_components.magic_areas.helpers.states import (
+    AREA_STATE_BITS,
+    mask_states,
+    states_mask,
+)
+
+# Tests
+
+
+def test_states_mask_round_trip() -> None:
+    """Test states survive a round trip through a bitmask."""
+
+    assert len(set(AREA_STATE_BITS.values())) == len(AreaStates)
+
+    states = [AreaStates.SLEEP, AreaStates.OCCUPIED, AreaStates.DARK]
+    mask = states_mask(states)
+
+    # Listed in AreaStates order
+    assert mask_states(mask) == [
+        AreaStates.OCCUPIED,
+        AreaStates.DARK,
+        AreaStates.SLEEP,
+    ]
+
+    # Plain strings and unknown states
+    assert states_mask(["occupied", "unknown_state"]) == states_mask(
+        [AreaStates.OCCUPIED]
+    )
+    assert mask_states(0) == []
+
+
+def test_states_mask_diff() -> None:
+    """Test new and lost states are computed from the changed bits."""
+
+    last = states_mask([AreaStates.OCCUPIED, AreaStates.DARK])
+    current = states_mask([AreaStates.OCCUPIED, AreaStates.EXTENDED])
+    changed = last ^ current
+
+    assert mask_states(changed & current) == [AreaStates.EXTENDED]
+    assert mask_states(changed & last) == [AreaStates.DARK]
@@ -14,7 +14,13 @@ from homeassistant.components.sensor.const import (
     SensorDeviceClass,
 )
 from homeassistant.components.threshold.const import ATTR_HYSTERESIS, ATTR_UPPER
-from homeassistant.const import LIGHT_LUX, STATE_OFF, STATE_ON
+from homeassistant.const import (
+    LIGHT_LUX,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
 from homeassistant.core import HomeAssistant
 
 from custom_components.magic_areas.const import (
@@ -172,3 +178,66 @@ async def test_threshold_sensor_light(
     # Ensure threhsold sensor is cleared
     threshold_sensor_state = hass.states.get(threshold_sensor_id)
     assert_state(threshold_sensor_state, STATE_OFF)
+
+
+async def test_threshold_sensor_hysteresis(
+    hass: HomeAssistant,
+    entities_sensor_illuminance_multiple: list[MockSensor],
+    _setup_integration_threshold,
+) -> None:
+    """Test the threshold only flips outside of the hysteresis band."""
+
+    threshold_sensor_id = (
+        f"{BINARY_SENSOR_DOMAIN}.magic_areas_threshold_kitchen_threshold_light"
+    )
+
+    async def set_illuminance(value: float) -> None:
+        for mock_entity in entities_sensor_illuminance_multiple:
+            hass.states.async_set(
+                mock_entity.entity_id,
+                str(value),
+                attributes={"unit_of_measurement": LIGHT_LUX},
+            )
+        await hass.async_block_till_done()
+
+    # Within the band (540-660), stays off
+    await set_illuminance(620)
+    assert_state(hass.states.get(threshold_sensor_id), STATE_OFF)
+
+    await set_illuminance(700)
+    assert_state(hass.states.get(threshold_sensor_id), STATE_ON)
+
+    # Within the band, stays on
+    await set_illuminance(580)
+    assert_state(hass.states.get(threshold_sensor_id), STATE_ON)
+
+    await set_illuminance(500)
+    assert_state(hass.states.get(threshold_sensor_id), STATE_OFF)
+
+
+async def test_threshold_sensor_unknown_without_values(
+    hass: HomeAssistant,
+    entities_sensor_illuminance_multiple: list[MockSensor],
+    _setup_integration_threshold,
+) -> None:
+    """Test the threshold is unknown while no sensor reports a value."""
+
+    threshold_sensor_id = (
+        f"{BINARY_SENSOR_DOMAIN}.magic_areas_threshold_kitchen_threshold_light"
+    )
+
+    for mock_entity in entities_sensor_illuminance_multiple:
+        hass.states.async_set(mock_entity.entity_id, STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+
+    assert_state(hass.states.get(threshold_sensor_id), STATE_UNKNOWN)
+
+    # Within the hysteresis band, a first value settles on off
+    hass.states.async_set(
+        entities_sensor_illuminance_multiple[0].entity_id,
+        "620",
+        attributes={"unit_of_measurement": LIGHT_LUX},
+    )
+    await hass.async_block_till_done()
+
+    assert_state(hass.states.get(threshold_sensor_id), STATE_OFF)
@@ -1,10 +1,17 @@
-"""Tests for the Reusable Timer helper."""
+"""Tests for the timer helpers."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from homeassistant.core import HomeAssistant
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
-from custom_components.magic_areas.helpers.timer import ReusableTimer
+from homeassistant.core import HomeAssistant, callback
+
+from custom_components.magic_areas.helpers.timer import (
+    TIMER_WHEEL_SLOTS,
+    ReusableTimer,
+    TimerWheel,
+)
 
 
 async def test_timer_fires(hass: HomeAssistant, patch_async_call_later):
@@ -69,3 +76,100 @@ async def test_async_remove_cancels(hass: HomeAssistant, patch_async_call_later)
     await hass.async_block_till_done()
 
     assert "at" not in fired
+
+
+async def test_timer_wheel_fires_in_order(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test wheel timers fire once due, in deadline order."""
+
+    wheel = TimerWheel(hass)
+    fired: list[str] = []
+
+    def record(name: str):
+        @callback
+        def _fire(now: datetime) -> None:
+            fired.append(name)
+
+        return _fire
+
+    wheel.async_schedule(30, record("late"))
+    wheel.async_schedule(5, record("early"))
+    wheel.async_schedule(5.5, record("early_too"))
+    assert wheel.pending == 3
+
+    freezer.tick(timedelta(seconds=4))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert fired == []
+
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert fired == ["early", "early_too"]
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert fired == ["early", "early_too", "late"]
+    assert wheel.pending == 0
+
+
+async def test_timer_wheel_cancel_and_rearm(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test cancelled timers don't fire and re-armed ones move their deadline."""
+
+    wheel = TimerWheel(hass)
+    fired: list[datetime] = []
+
+    @callback
+    def _fire(now: datetime) -> None:
+        fired.append(now)
+
+    # Flapping sensor: re-armed over and over
+    cancel = wheel.async_schedule(10, _fire)
+    for _ in range(100):
+        cancel()
+        cancel = wheel.async_schedule(10, _fire)
+    assert wheel.pending == 1
+
+    cancelled = wheel.async_schedule(5, _fire)
+    cancelled()
+    # Cancelling twice is a no-op
+    cancelled()
+    assert wheel.pending == 1
+
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(fired) == 1
+    assert wheel.pending == 0
+
+
+async def test_timer_wheel_long_delays(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test timers more than a turn of the wheel away wait for their turn."""
+
+    wheel = TimerWheel(hass)
+    fired: list[datetime] = []
+
+    @callback
+    def _fire(now: datetime) -> None:
+        fired.append(now)
+
+    delay = TIMER_WHEEL_SLOTS * 2.5
+    wheel.async_schedule(delay, _fire)
+
+    # Same bucket, earlier turns
+    for _ in range(2):
+        freezer.tick(timedelta(seconds=TIMER_WHEEL_SLOTS))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert not fired
+
+    freezer.tick(timedelta(seconds=TIMER_WHEEL_SLOTS))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(fired) == 1
@@ -0,0 +1,86 @@
+"""Test the logging guards and area tracing."""
+
+import logging
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import EVENT_LOGGING_CHANGED
+from homeassistant.core import HomeAssistant
+
+from custom_components.magic_areas.const import DATA_LOG_GUARDS
+from custom_components.magic_areas.helpers.trace import (
+    TRACE_BUFFER_SIZE,
+    AreaTracer,
+    LogGuard,
+    async_setup_log_guards,
+)
+
+from tests.helpers import init_integration, shutdown_integration
+
+# Constants
+
+AREA_ID = "kitchen"
+
+# Tests
+
+
+async def test_log_guard_follows_logging_changes(hass: HomeAssistant) -> None:
+    """Test guards are refreshed when logger levels change."""
+
+    logger = logging.getLogger("custom_components.magic_areas.test_trace")
+    logger.setLevel(logging.INFO)
+    guard = LogGuard(logger)
+    assert not guard.enabled
+
+    async_setup_log_guards(hass)
+
+    logger.setLevel(logging.DEBUG)
+    assert not guard.enabled
+
+    hass.bus.async_fire(EVENT_LOGGING_CHANGED)
+    await hass.async_block_till_done()
+    assert guard.enabled
+
+
+async def test_log_guards_stop_on_last_unload(
+    hass: HomeAssistant, basic_config_entry: MockConfigEntry
+) -> None:
+    """Test the logging listener is removed with the last area."""
+
+    await init_integration(hass, [basic_config_entry])
+    assert DATA_LOG_GUARDS in hass.data
+
+    listeners = hass.bus.async_listeners().get(EVENT_LOGGING_CHANGED, 0)
+
+    await shutdown_integration(hass, [basic_config_entry])
+    assert DATA_LOG_GUARDS not in hass.data
+    assert hass.bus.async_listeners().get(EVENT_LOGGING_CHANGED, 0) == listeners - 1
+
+
+async def test_area_tracer_records(hass: HomeAssistant) -> None:
+    """Test areas only record while traced, up to the buffer size."""
+
+    tracer = AreaTracer(AREA_ID)
+    tracer.logger.setLevel(logging.INFO)
+    tracer.refresh()
+
+    tracer.trace("evaluate", states=["clear"])
+    assert not tracer.records
+
+    tracer.logger.setLevel(logging.DEBUG)
+    tracer.refresh()
+
+    tracer.trace("evaluate", states=["occupied"], duration=0.001)
+    record = tracer.records[-1]
+    assert (record.area, record.event, record.states) == (
+        AREA_ID,
+        "evaluate",
+        ("occupied",),
+    )
+
+    for _ in range(TRACE_BUFFER_SIZE):
+        tracer.trace("sensor")
+    assert len(tracer.records) == TRACE_BUFFER_SIZE
+    assert tracer.records[0].event == "sensor"
+
+    tracer.logger.setLevel(logging.NOTSET)
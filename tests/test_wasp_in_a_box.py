@@ -4,7 +4,7 @@ import asyncio
 from collections.abc import AsyncGenerator
 import logging
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -342,7 +342,7 @@ async def test_open_box_cancels_timer(
         return lambda: None  # dummy cancel
 
     with patch(
-        "custom_components.magic_areas.helpers.timer.async_call_later",
+        "custom_components.magic_areas.helpers.timer.async_schedule_timer",
         side_effect=capture_callback,
     ):
         hass.states.async_set(motion_sensor_entity_id, STATE_OFF)
@@ -411,3 +411,51 @@ async def test_wasp_seen_cancels_timer(
     final = hass.states.get(wasp_in_a_box_entity_id)
     assert_state(final, STATE_ON)
     assert_attribute(final, ATTR_WASP, STATE_ON)
+
+
+async def test_delayed_check_is_replaced_and_cancelled(
+    hass: HomeAssistant,
+    entities_wasp_in_a_box: list[MockBinarySensor],
+) -> None:
+    """Test a newer box event replaces the pending delayed check."""
+
+    data = get_basic_config_entry_data(DEFAULT_MOCK_AREA)
+    data.update(
+        {
+            CONF_ENABLED_FEATURES: {
+                CONF_FEATURE_WASP_IN_A_BOX: {
+                    CONF_WASP_IN_A_BOX_DELAY: 5,
+                    CONF_WASP_IN_A_BOX_WASP_TIMEOUT: 0,
+                },
+                CONF_FEATURE_AGGREGATION: {CONF_AGGREGATES_MIN_ENTITIES: 1},
+            },
+        }
+    )
+    config_entry = MockConfigEntry(domain=DOMAIN, data=data)
+    await init_integration(hass, [config_entry])
+
+    door_sensor_entity_id = entities_wasp_in_a_box[1].entity_id
+    cancels: list[MagicMock] = []
+
+    def schedule(hass_inner, delay, action):
+        cancels.append(MagicMock())
+        return cancels[-1]
+
+    with patch(
+        "custom_components.magic_areas.binary_sensor.wasp_in_a_box.async_schedule_timer",
+        side_effect=schedule,
+    ):
+        hass.states.async_set(door_sensor_entity_id, STATE_ON)
+        await asyncio.sleep(1)
+        await hass.async_block_till_done()
+        hass.states.async_set(door_sensor_entity_id, STATE_OFF)
+        await asyncio.sleep(1)
+        await hass.async_block_till_done()
+
+    assert len(cancels) == 2
+    cancels[0].assert_called_once()
+    cancels[1].assert_not_called()
+
+    # Removing the sensor cancels the pending check
+    await shutdown_integration(hass, [config_entry])
+    cancels[1].assert_called_once()